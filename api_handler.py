@@ -1,24 +1,121 @@
-import requests
+import asyncio
 import json
 import os
 import configparser
 import threading
 import time
+import queue
+from urllib.parse import urlsplit
+from response_cache import ResponseCache, CACHE_DB_FILE, DEFAULT_MAX_BYTES, DEFAULT_TTLS
+from async_engine import AsyncEngine, DEFAULT_IO_THREADS
+from concurrency import CancelToken, CancelledError, RequestBudget, SingleFlight, WorkerPool, WAIT_POLL_SECONDS
+from tmdb_cache import TmdbCache, DEFAULT_TMDB_TTL, NO_MATCH
+from domain_scoreboard import DomainScoreboard, DOMAIN_STATS_FILE
+from rate_limit import (RateLimiter, ThrottledError, parse_retry_after, DEFAULT_RATE_PER_HOST, DEFAULT_BURST,
+                        DEFAULT_MAX_RETRY_WAIT, MAX_THROTTLE_RETRIES, THROTTLE_STATUSES)
+from metrics import Metrics, hit_rate, thread_counts
+from poster_cache import PosterDiskCache, POSTER_CACHE_DIR, DEFAULT_DISK_MAX_BYTES, DEFAULT_MEMORY_MAX_BYTES
 
 # --- Configuration Constants ---
 YTS_CONFIG_FILE = "yts_domains.json"
 APP_CONFIG_FILE = "config.ini"
+TMDB_API_BASE = "https://api.themoviedb.org/3"
+
+# --- Connection Pool Defaults (overridable in the [Network] section of config.ini) ---
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_WORKERS = 6
+DEFAULT_TMDB_BATCH_CONCURRENCY = 4
+
+# --- Hedged Requests (enable with [Network] hedge_requests = true) ---
+HEDGE_PERCENTILE = 95          # hedge once the primary is slower than this percentile of its history
+HEDGE_DEFAULT_DELAY = 2.0      # seconds, used until the primary has latency history
+HEDGE_MIN_DELAY = 0.25
+HEDGE_BUDGET_RATIO = 0.1       # at most ~10% of YTS requests may be duplicated
+HEDGE_BUDGET_BURST = 3
+
+requests = None   # imported on first network use, see _load_requests()
+
+
+def _load_requests():
+    """Imports requests (~90 ms) the first time the network is used, keeping it off the cold-start path."""
+    global requests
+    if requests is None:
+        import requests as module
+        requests = module
+    return requests
+
+
+def _request_key(kwargs):
+    """Hashable form of requests kwargs for coalescing; dicts (params, headers) compare by their items."""
+    key = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, dict):
+            value = tuple(sorted((str(k), str(v)) for k, v in value.items()))
+        else:
+            value = repr(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+# --- Offline Mode ---
+# After a full domain scan fails, requests are served from the cache only for this long before rescanning.
+OFFLINE_RETRY_SECONDS = 60
 
 
 class APIHandler:
-    def __init__(self):
+    def __init__(self, log=print):
+        # Progress/diagnostic messages (domain discovery, failures) go through `log`, e.g. to stderr in headless mode.
+        self.log = log
         self.yts_active_domain = None
         self.yts_domains = self._load_yts_domains()
+        self.scoreboard = DomainScoreboard(DOMAIN_STATS_FILE)
+        # Reuse the last mirror that served us; the first real request re-validates it.
+        if self.scoreboard.last_best in self._candidate_domains():
+            self.yts_active_domain = self.scoreboard.last_best
         self.tmdb_api_key = None
+        self.tmdb_proxy_url = None
+        self.tmdb_base_url = TMDB_API_BASE
         self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept-Encoding": "gzip, deflate",
         }
+        self.pool_connections = DEFAULT_POOL_CONNECTIONS
+        self.pool_maxsize = DEFAULT_POOL_MAXSIZE
+        self._sessions = {}
+        self._request_counts = {}
+        self._session_lock = threading.Lock()
+        self._single_flight = SingleFlight()
+        self.worker_count = DEFAULT_WORKERS
+        self.rate_per_host = DEFAULT_RATE_PER_HOST
+        self.rate_burst = DEFAULT_BURST
+        self.max_concurrency_per_host = DEFAULT_POOL_MAXSIZE
+        self.max_retry_wait = DEFAULT_MAX_RETRY_WAIT
+        self.io_threads = DEFAULT_IO_THREADS
+        self.hedging_enabled = False
+        self.hedge_budget = RequestBudget(HEDGE_BUDGET_RATIO, HEDGE_BUDGET_BURST)
+        self.hedges_won = 0
+        self.cache_enabled = True
+        self.cache_max_bytes = DEFAULT_MAX_BYTES
+        self.cache_ttls = dict(DEFAULT_TTLS)
+        self.stale_while_revalidate = True
+        self.tmdb_ttl = DEFAULT_TMDB_TTL
+        self.tmdb_batch_concurrency = DEFAULT_TMDB_BATCH_CONCURRENCY
+        self.poster_disk_max_bytes = DEFAULT_DISK_MAX_BYTES
+        self.poster_memory_max_bytes = DEFAULT_MEMORY_MAX_BYTES
+        self._offline_until = 0.0
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
+        self.metrics = Metrics()
+        # The parsed config.ini; feature modules (catalog, trackers, torrent client, proxy) read their own sections from it.
+        self.config = configparser.ConfigParser()
         self._load_app_config()
+        self.limiter = RateLimiter(self.rate_per_host, self.rate_burst, self.max_concurrency_per_host, self.max_retry_wait)
+        self.cache = ResponseCache(CACHE_DB_FILE, self.cache_ttls, self.cache_max_bytes) if self.cache_enabled else None
+        self.poster_cache = PosterDiskCache(POSTER_CACHE_DIR, self.poster_disk_max_bytes) if self.cache_enabled else None
+        self.tmdb_cache = TmdbCache(CACHE_DB_FILE, self.tmdb_ttl) if self.cache_enabled else None
+        self.workers = WorkerPool(self.worker_count)
+        self.io = AsyncEngine(self.io_threads)
 
     def _load_yts_domains(self):
         if not os.path.exists(YTS_CONFIG_FILE):
@@ -40,117 +137,560 @@ class APIHandler:
                 f.write(config_content)
         try:
             config.read(APP_CONFIG_FILE)
+            self.config = config
             key = config.get('TMDB', 'api_key', fallback=None)
             self.tmdb_api_key = key.strip() if key and key.strip() else None
+            self.tmdb_proxy_url = (config.get('TMDB', 'proxy_url', fallback='') or '').strip().rstrip('/') or None
+            self.pool_connections = config.getint('Network', 'pool_connections', fallback=DEFAULT_POOL_CONNECTIONS)
+            self.pool_maxsize = config.getint('Network', 'pool_maxsize', fallback=DEFAULT_POOL_MAXSIZE)
+            self.worker_count = config.getint('Network', 'workers', fallback=DEFAULT_WORKERS)
+            self.rate_per_host = config.getfloat('Network', 'rate_per_host', fallback=DEFAULT_RATE_PER_HOST)
+            self.rate_burst = config.getint('Network', 'burst', fallback=DEFAULT_BURST)
+            self.max_concurrency_per_host = config.getint('Network', 'max_concurrency_per_host', fallback=self.pool_maxsize)
+            self.max_retry_wait = config.getfloat('Network', 'max_retry_wait', fallback=DEFAULT_MAX_RETRY_WAIT)
+            self.io_threads = config.getint('Network', 'io_threads', fallback=DEFAULT_IO_THREADS)
+            self.hedging_enabled = config.getboolean('Network', 'hedge_requests', fallback=False)
+            self.cache_enabled = config.getboolean('Cache', 'enabled', fallback=True)
+            self.cache_max_bytes = int(config.getfloat('Cache', 'max_size_mb', fallback=DEFAULT_MAX_BYTES / (1024 * 1024)) * 1024 * 1024)
+            self.cache_ttls['list_movies.json'] = config.getint('Cache', 'list_ttl', fallback=DEFAULT_TTLS['list_movies.json'])
+            self.cache_ttls['movie_details.json'] = config.getint('Cache', 'details_ttl', fallback=DEFAULT_TTLS['movie_details.json'])
+            self.stale_while_revalidate = config.getboolean('Cache', 'stale_while_revalidate', fallback=True)
+            self.tmdb_ttl = int(config.getfloat('Cache', 'tmdb_ttl_days', fallback=DEFAULT_TMDB_TTL / 86400) * 86400)
+            self.tmdb_batch_concurrency = config.getint('TMDB', 'batch_concurrency', fallback=DEFAULT_TMDB_BATCH_CONCURRENCY)
+            self.poster_disk_max_bytes = int(config.getfloat('Cache', 'poster_disk_mb', fallback=DEFAULT_DISK_MAX_BYTES / (1024 * 1024)) * 1024 * 1024)
+            self.poster_memory_max_bytes = int(config.getfloat('Cache', 'poster_memory_mb', fallback=DEFAULT_MEMORY_MAX_BYTES / (1024 * 1024)) * 1024 * 1024)
         except Exception as e:
-            print(f"Error reading config file: {e}")
+            self.log(f"Error reading config file: {e}")
 
     def reload_yts_domains(self):
         self.yts_domains = self._load_yts_domains()
         self.yts_active_domain = None
+        self.scoreboard.save(force=True)
 
     def reload_app_config(self):
         self._load_app_config()
+        self.close()
+        self.limiter = RateLimiter(self.rate_per_host, self.rate_burst, self.max_concurrency_per_host, self.max_retry_wait)
+        if self.cache:
+            self.cache.ttls.update(self.cache_ttls)
+            self.cache.max_bytes = self.cache_max_bytes
+        if self.poster_cache:
+            self.poster_cache.max_bytes = self.poster_disk_max_bytes
+        if self.tmdb_cache:
+            self.tmdb_cache.ttl = self.tmdb_ttl
+
+    # --- Pooled HTTP Sessions ---
+    def _get_session(self, url):
+        """Returns the keep-alive session for the host of `url`, creating it on first use."""
+        host = urlsplit(url).netloc.lower()
+        with self._session_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                from requests.adapters import HTTPAdapter
+                session = _load_requests().Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            self._request_counts[host] = self._request_counts.get(host, 0) + 1
+            return session
+
+    def http_get(self, url, token=None, **kwargs):
+        """
+        GET through the pooled session of the target host. Accepts the same kwargs as requests.get.
+
+        Identical concurrent GETs (same URL, params, headers and other kwargs) are coalesced into
+        one request whose Response object is shared by every caller, so callers must treat it as
+        read-only (no consuming `raw`, no mutating headers). If `token` is cancelled the call raises CancelledError instead of
+        sending, or stops waiting on a coalesced request it does not own. The shared request
+        itself never sees `token`, so cancelling whichever caller started it does not cancel
+        the others waiting on it.
+        """
+        _load_requests()
+        if token is not None:
+            token.raise_if_cancelled()
+        if kwargs.get('stream'):
+            return self._send('GET', url, token, kwargs)
+        key = (url, _request_key(kwargs))
+        response = self._single_flight.do(key, lambda: self._send('GET', url, None, kwargs), token)
+        if token is not None:
+            token.raise_if_cancelled()
+        return response
+
+    def http_post(self, url, token=None, **kwargs):
+        """POST through the pooled session of the target host. Never coalesced, since POSTs are not idempotent."""
+        _load_requests()
+        if token is not None:
+            token.raise_if_cancelled()
+        return self._send('POST', url, token, kwargs)
+
+    def _send(self, method, url, token, kwargs):
+        """
+        Sends one request under the host's rate limiter. A 429/503 pauses the host for its
+        Retry-After (or a growing backoff) and is retried while that wait is short; otherwise
+        the throttling response is returned for the caller to handle.
+        """
+        host = urlsplit(url).netloc.lower()
+        limiter = self.limiter.for_host(host)
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            limiter.acquire(token)
+            overloaded = succeeded = False
+            try:
+                response = self._get_session(url).request(method, url, **kwargs)
+                overloaded = response.status_code in THROTTLE_STATUSES
+                succeeded = not overloaded
+            except requests.Timeout:
+                overloaded = True
+                raise
+            finally:
+                limiter.release(overloaded, succeeded)
+            if not overloaded:
+                return response
+            delay = limiter.throttle(parse_retry_after(response.headers.get('Retry-After')))
+            if attempt == MAX_THROTTLE_RETRIES or delay > self.max_retry_wait:
+                return response
+            self.log(f"{host} answered HTTP {response.status_code}; backing off {delay:.1f}s.")
+        return response
+
+    def submit(self, fn, *args, **kwargs):
+        """Runs fn(*args, token=..., **kwargs) on the bounded API worker pool and returns a cancellable TaskHandle."""
+        return self.workers.submit(fn, *args, **kwargs)
+
+    def get_connection_stats(self):
+        """
+        Returns {host: {'requests', 'new_connections', 'reused_connections'}} for every pooled host.
+        New connections are read from the underlying urllib3 pools; everything else was a keep-alive reuse.
+        """
+        stats = {}
+        with self._session_lock:
+            sessions = list(self._sessions.items())
+            counts = dict(self._request_counts)
+        for host, session in sessions:
+            new_connections = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        new_connections += pool.num_connections
+            requests_made = counts.get(host, 0)
+            stats[host] = {
+                'requests': requests_made,
+                'new_connections': new_connections,
+                'reused_connections': max(0, requests_made - new_connections),
+            }
+        return stats
+
+    def get_request_stats(self):
+        """Coalescing counters: requests actually sent vs. callers that shared an in-flight response."""
+        return self._single_flight.stats()
+
+    def get_diagnostics(self):
+        """Latency histograms, cache hit rates, coalescing and in-flight work as one JSON-serializable dict."""
+        report = self.metrics.snapshot()
+        report['caches'] = {}
+        for name, cache in (('responses', self.cache), ('tmdb', self.tmdb_cache), ('posters_disk', self.poster_cache)):
+            if cache:
+                stats = cache.stats()
+                report['caches'][name] = dict(stats, hit_rate=hit_rate(stats))
+        report['coalescing'] = self.get_request_stats()
+        report['connections'] = self.get_connection_stats()
+        report['in_flight'] = {
+            'workers': self.workers.stats(),
+            'io': self.io.stats(),
+            'revalidating': len(self._revalidating),
+            'threads': thread_counts(),
+        }
+        report['rate_limits'] = self.limiter.stats()
+        report['yts'] = {'active_domain': self.yts_active_domain, 'offline': self.is_offline, 'hedges_won': self.hedges_won}
+        return report
+
+    def close(self):
+        """Closes every pooled session. New sessions are created lazily on the next request."""
+        with self._session_lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+            self._request_counts = {}
+        for session in sessions:
+            session.close()
+
+    def _candidate_domains(self):
+        return [d.strip().rstrip('/') for d in self.yts_domains if d.strip()]
 
-    def _test_domain_speed(self, domain, results_list):
-        """Worker function for threading. Tests a single domain and records its speed."""
+    def _test_domain_speed(self, domain, results):
+        """Worker function for threading. Tests a single domain, scores it, and reports (latency or None, domain)."""
+        latency = None
         try:
-            url = f"{domain.strip().rstrip('/')}/api/v2/list_movies.json?limit=1"
-            print(f"  -> Testing {domain}...")
+            url = f"{domain}/api/v2/list_movies.json?limit=1"
+            self.log(f"  -> Testing {domain}...")
             start_time = time.monotonic()
             
             # --- CHANGE: Increased test timeout to 20 seconds ---
-            response = requests.get(url, headers=self.headers, timeout=20)
+            response = self.http_get(url, timeout=20)
             
             if response.status_code == 200:
                 if response.json().get('status') == 'ok':
                     latency = time.monotonic() - start_time
-                    print(f"  [SUCCESS] {domain} responded in {latency:.2f} seconds.")
-                    results_list.append((latency, domain))
+                    self.log(f"  [SUCCESS] {domain} responded in {latency:.2f} seconds.")
                 else:
-                    print(f"  [FAILED] {domain} responded but API status is not 'ok'.")
+                    self.log(f"  [FAILED] {domain} responded but API status is not 'ok'.")
             else:
-                print(f"  [FAILED] {domain} returned HTTP status code {response.status_code}.")
+                self.log(f"  [FAILED] {domain} returned HTTP status code {response.status_code}.")
 
-        except requests.exceptions.RequestException as e:
-            print(f"  [FAILED] {domain} could not be reached. Reason: Timeout or connection error.")
+        except (requests.exceptions.RequestException, ThrottledError, ValueError) as e:
+            self.log(f"  [FAILED] {domain} could not be reached. Reason: Timeout or connection error.")
+        finally:
+            if latency is None:
+                self.scoreboard.record_failure(domain)
+            else:
+                self.scoreboard.record_success(domain, latency)
+            self.scoreboard.save(force=True)
+            results.put((latency, domain))
 
     def _find_fastest_active_domain(self):
         """
-        Tests all domains concurrently to find the one with the lowest latency.
+        Probes all domains concurrently (best-scored first) and selects the first one that answers
+        correctly. Slower probes keep running in the background and only update the scoreboard,
+        so a dead mirror never delays the first search.
         """
-        print("Searching for the fastest YTS domain...")
-        domain_latencies = []
-        threads = []
+        self.log("Searching for the fastest YTS domain...")
+        candidates = self.scoreboard.ranked(self._candidate_domains())
+        results = queue.Queue()
 
-        for domain in self.yts_domains:
-            if domain.strip():
-                thread = threading.Thread(target=self._test_domain_speed, args=(domain, domain_latencies))
-                threads.append(thread)
-                thread.start()
+        for domain in candidates:
+            threading.Thread(target=self._test_domain_speed, args=(domain, results), daemon=True).start()
 
-        for thread in threads:
-            thread.join()
+        for _ in candidates:
+            latency, domain = results.get()
+            if latency is not None:
+                self.log("-" * 30)
+                self.log(f"First healthy domain is {domain} ({latency:.2f}s). Selecting it; other domains keep scoring in the background.")
+                self.log("-" * 30)
+                self.yts_active_domain = domain
+                self.scoreboard.set_best(domain)
+                self._offline_until = 0.0
+                return domain
 
-        print("-" * 30)
-        if not domain_latencies:
-            print("All domains failed the test.")
-            return None
+        self.log("-" * 30)
+        self.log("All domains failed the test.")
+        self.scoreboard.save(force=True)
+        return None
+
+    @property
+    def is_offline(self):
+        """True while the last full domain scan failed and requests are being served from the cache only."""
+        return time.monotonic() < self._offline_until
+
+    def warm_up(self):
+        """Picks a YTS mirror ahead of the first request; run off the UI thread at startup."""
+        _load_requests()
+        if not self.yts_active_domain and not self.is_offline:
+            self._single_flight.do('domain-scan', self._find_fastest_active_domain)
+
+    def _make_yts_request(self, endpoint, params=None, token=None):
+        """
+        One YTS API call against the active mirror, scanning for one first if needed. If the
+        mirror turns out to be dead (e.g. the one remembered from the last session), it is
+        dropped and the request is retried once on a freshly scanned mirror.
+        """
+        for attempt in range(2):
+            if not self.yts_active_domain:
+                if not self._single_flight.do('domain-scan', self._find_fastest_active_domain):
+                    self._offline_until = time.monotonic() + OFFLINE_RETRY_SECONDS
+                    raise ConnectionError("No active YTS domains found.\n\nCheck your internet connection or edit the YTS Domains list in the app settings.")
+            try:
+                return self._request_active_domain(endpoint, params, token)
+            except ThrottledError:
+                raise
+            except ConnectionError:
+                if attempt:
+                    raise
+                self.log(f"Retrying {endpoint} on a freshly scanned domain.")
+
+    def _request_active_domain(self, endpoint, params, token):
+        self.hedge_budget.on_request()
+        if self.hedging_enabled:
+            return self._hedged_yts_request(endpoint, params, token)
+
+        domain = self.yts_active_domain
+        try:
+            return self._fetch_from_domain(domain, endpoint, params, token)
+        except requests.RequestException as e:
+            self.yts_active_domain = None
+            raise ConnectionError(f"Request to {domain}/api/v2/{endpoint} failed. Re-scanning on next attempt. Error: {e}") from e
 
-        domain_latencies.sort()
-        fastest_domain = domain_latencies[0][1]
-        fastest_time = domain_latencies[0][0]
-
-        print(f"Found {len(domain_latencies)} working domains.")
-        print(f"Fastest is {fastest_domain} ({fastest_time:.2f}s). Selecting it.")
-        print("-" * 30)
-        
-        self.yts_active_domain = fastest_domain
-        return fastest_domain
-
-    def _make_yts_request(self, endpoint, params=None):
-        if not self.yts_active_domain:
-            if not self._find_fastest_active_domain():
-                raise ConnectionError("No active YTS domains found.\n\nCheck your internet connection or edit the YTS Domains list in the app settings.")
-        
-        url = f"{self.yts_active_domain}/api/v2/{endpoint}"
+    def _fetch_from_domain(self, domain, endpoint, params, token=None):
+        """One YTS API call against a specific mirror. Records the outcome on the scoreboard."""
+        url = f"{domain}/api/v2/{endpoint}"
         try:
-            response = requests.get(url, params=params, headers=self.headers, timeout=30)
+            start_time = time.monotonic()
+            response = self.http_get(url, token=token, params=params, timeout=30)
+            if response.status_code in THROTTLE_STATUSES:
+                # The mirror is up but rate-limiting us: back off instead of abandoning it for a rescan.
+                self.metrics.observe('yts', endpoint, time.monotonic() - start_time, ok=False)
+                retry_in = self.limiter.for_host(urlsplit(url).netloc.lower()).retry_in()
+                raise ThrottledError(f"{domain} is rate-limiting requests (HTTP {response.status_code}); retry in {retry_in:.0f}s.", retry_in)
             response.raise_for_status()
             data = response.json()
-            if data.get('status') == 'ok':
-                return data.get('data')
-            else:
-                raise Exception(data.get('status_message', 'Unknown YTS API error'))
-        except requests.RequestException as e:
+        except requests.RequestException:
+            self.scoreboard.record_failure(domain)
+            self.metrics.observe('yts', endpoint, time.monotonic() - start_time, ok=False)
+            raise
+        elapsed = time.monotonic() - start_time
+        self.metrics.observe('yts', endpoint, elapsed, ok=data.get('status') == 'ok')
+        if data.get('status') == 'ok':
+            self.scoreboard.record_success(domain, elapsed)
+            return data.get('data')
+        raise Exception(data.get('status_message', 'Unknown YTS API error'))
+
+    def _hedge_delay(self, domain):
+        p95 = self.scoreboard.percentile(domain, HEDGE_PERCENTILE)
+        return HEDGE_DEFAULT_DELAY if p95 is None else max(HEDGE_MIN_DELAY, p95)
+
+    def _hedged_yts_request(self, endpoint, params, token=None):
+        """
+        Sends to the active mirror and, if it has not answered within its observed p95 latency,
+        sends the same request to the next-best mirror. The first valid response wins and the
+        other attempt is cancelled (dropped before sending, or its response discarded).
+        Duplicates are capped by `hedge_budget`.
+        """
+        primary = self.yts_active_domain
+        backups = [d for d in self.scoreboard.ranked(self._candidate_domains())
+                   if d != primary and self.scoreboard.failure_rate(d) < 1.0]
+        results = queue.Queue()
+        attempts = {}
+
+        def attempt(domain):
+            attempt_token = token.child() if token is not None else CancelToken()
+            attempts[domain] = attempt_token
+
+            def run():
+                try:
+                    results.put((domain, self._fetch_from_domain(domain, endpoint, params, attempt_token), None))
+                except Exception as e:
+                    results.put((domain, None, e))
+
+            threading.Thread(target=run, daemon=True).start()
+
+        attempt(primary)
+        outstanding = 1
+        hedged = not backups
+        hedge_at = time.monotonic() + self._hedge_delay(primary)
+        errors = []
+        try:
+            while outstanding:
+                # Poll, so a cancelled caller stops waiting even while an attempt is still blocked.
+                if token is not None:
+                    token.raise_if_cancelled()
+                try:
+                    timeout = WAIT_POLL_SECONDS if hedged else max(0.0, min(WAIT_POLL_SECONDS, hedge_at - time.monotonic()))
+                    domain, data, error = results.get(timeout=timeout)
+                except queue.Empty:
+                    if hedged or time.monotonic() < hedge_at:
+                        continue
+                    hedged = True
+                    if self.hedge_budget.try_spend():
+                        self.log(f"{primary} is slow; hedging {endpoint} to {backups[0]}.")
+                        attempt(backups[0])
+                        outstanding += 1
+                    continue
+                outstanding -= 1
+                if error is None:
+                    if domain != primary:
+                        self.hedges_won += 1
+                        if any(d == primary for d, _ in errors):
+                            self.yts_active_domain = domain
+                    return data
+                errors.append((domain, error))
+                if isinstance(error, CancelledError):
+                    raise error
+                # A failed primary is hedged immediately, budget permitting.
+                if domain == primary and not hedged and backups:
+                    hedged = True
+                    if self.hedge_budget.try_spend():
+                        attempt(backups[0])
+                        outstanding += 1
+        finally:
+            for attempt_token in attempts.values():
+                attempt_token.cancel()
+
+        if any(d == primary and isinstance(e, requests.RequestException) for d, e in errors):
             self.yts_active_domain = None
-            raise ConnectionError(f"Request to {url} failed. Re-scanning on next attempt. Error: {e}") from e
+        network_errors = [e for _, e in errors if isinstance(e, requests.RequestException)]
+        if len(network_errors) < len(errors):
+            raise next(e for _, e in errors if not isinstance(e, requests.RequestException))
+        raise ConnectionError(f"Request to {primary}/api/v2/{endpoint} failed. Re-scanning on next attempt. Error: {errors[-1][1]}")
+
+    def _cached_yts_request(self, endpoint, params=None, on_refresh=None, token=None):
+        """
+        Serves YTS responses through the persistent cache.
+
+        Fresh entries are returned without touching the network. Stale entries are returned
+        immediately when stale-while-revalidate is on, and refreshed in the background;
+        `on_refresh(data)` is then called from that background thread if the payload changed.
+        While offline (no mirror answered the last scan) only cached data is served.
+        """
+        if not self.cache:
+            return self._make_yts_request(endpoint, params, token)
+
+        cached, is_fresh = self.cache.get(endpoint, params)
+        if cached is not None and is_fresh:
+            return cached
+
+        if self.is_offline:
+            if cached is not None:
+                return cached
+            raise ConnectionError("Offline: no YTS domain is reachable and this page is not cached yet.")
+
+        if cached is not None and self.stale_while_revalidate:
+            self._revalidate_in_background(endpoint, params, cached, on_refresh)
+            return cached
+
+        try:
+            data = self._make_yts_request(endpoint, params, token)
+        except ConnectionError:
+            if cached is not None:
+                return cached
+            raise
+        self.cache.put(endpoint, params, data)
+        return data
+
+    def _revalidate_in_background(self, endpoint, params, cached, on_refresh):
+        key = ResponseCache.make_key(endpoint, params)
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def worker():
+            try:
+                data = self._make_yts_request(endpoint, params)
+                self.cache.put(endpoint, params, data)
+                if on_refresh and data != cached:
+                    on_refresh(data)
+            except Exception as e:
+                self.log(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(key)
 
-    def list_movies(self, **kwargs):
+        threading.Thread(target=worker, daemon=True).start()
+
+    def list_movies(self, on_refresh=None, token=None, use_cache=True, **kwargs):
         params = {'limit': 50}
         params.update(kwargs)
-        return self._make_yts_request('list_movies.json', params)
+        if not use_cache:
+            return self._make_yts_request('list_movies.json', params, token)
+        return self._cached_yts_request('list_movies.json', params, on_refresh, token)
 
-    def get_movie_details(self, movie_id):
+    def get_movie_details(self, movie_id, on_refresh=None, token=None):
         params = {'movie_id': movie_id, 'with_images': 'true', 'with_cast': 'true'}
-        return self._make_yts_request('movie_details.json', params)
+        return self._cached_yts_request('movie_details.json', params, on_refresh, token)
+
+    def get_yts(self, endpoint, params=None, token=None):
+        """Any YTS API endpoint (e.g. 'movie_suggestions.json') through the same cache and mirror selection."""
+        return self._cached_yts_request(endpoint, params, token=token)
+
+    async def fetch_movie_bundle(self, movie_id, imdb_code=None, poster_url=None, on_refresh=None, token=None, on_part=None):
+        """
+        Fetches YTS details, TMDB extras and poster bytes for one movie with the round trips overlapped.
+
+        The TMDB chain only needs the IMDb code and the poster only its URL; when the caller
+        already has both from the list payload, all three requests start at once and the total
+        wait is roughly the slowest of them instead of their sum. Missing inputs are taken from
+        the YTS details once they arrive. Returns {'details', 'tmdb', 'poster'}; failed parts are None.
+        If given, `on_part(name, value)` is called (on the engine thread) as soon as each part lands,
+        so callers can render progressively instead of waiting for the whole bundle.
+        """
+        def part(name, fn, *args, **kwargs):
+            async def run():
+                value = await self.io.run_blocking(fn, *args, **kwargs)
+                if on_part and value is not None:
+                    on_part(name, value)
+                return value
+            return asyncio.ensure_future(run())
+
+        details_task = part('details', self.get_movie_details, movie_id, on_refresh=on_refresh, token=token)
+        tmdb_task = part('tmdb', self.get_tmdb_details, imdb_code, token=token) if imdb_code else None
+        poster_task = part('poster', self.get_image_data, poster_url, token=token) if poster_url else None
 
-    def get_tmdb_details(self, imdb_id):
-        if not self.tmdb_api_key:
-            return None
         try:
-            find_url = f"https://api.themoviedb.org/3/find/{imdb_id}"
-            params = {'api_key': self.tmdb_api_key, 'external_source': 'imdb_id'}
-            response = requests.get(find_url, params=params, timeout=10)
-            response.raise_for_status()
-            find_data = response.json()
-            if not find_data.get('movie_results'): return None
+            details = await details_task
+        except CancelledError:
+            raise
+        except Exception as e:
+            self.log(f"YTS details request for movie {movie_id} failed: {e}")
+            details = None
+
+        movie = (details or {}).get('movie') or {}
+        if tmdb_task is None and movie.get('imdb_code'):
+            tmdb_task = part('tmdb', self.get_tmdb_details, movie['imdb_code'], token=token)
+        if poster_task is None and movie.get('large_cover_image'):
+            poster_task = part('poster', self.get_image_data, movie['large_cover_image'], token=token)
+
+        pending = [t for t in (tmdb_task, poster_task) if t is not None]
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        parts = iter(results)
+        tmdb = next(parts) if tmdb_task is not None else None
+        poster = next(parts) if poster_task is not None else None
+        if isinstance(tmdb, CancelledError) or isinstance(poster, CancelledError):
+            raise CancelledError()
+        return {
+            'details': details,
+            'tmdb': None if isinstance(tmdb, Exception) else tmdb,
+            'poster': None if isinstance(poster, Exception) else poster,
+        }
+
+    def get_tmdb_details(self, imdb_id, token=None):
+        return self.get_tmdb_entry(imdb_id, token)[1]
+
+    def get_tmdb_entry(self, imdb_id, token=None):
+        """
+        Returns (tmdb_id, extras) for an IMDb code, or (None, None) when TMDB has no match or is
+        unavailable. With [TMDB] proxy_url set, lookups go to a shared yts_proxy instead of TMDB.
+        """
+        try:
+            return self.fetch_tmdb_entry(imdb_id, token)
+        except ConnectionError as e:
+            self.log(str(e)); return None, None
+
+    def fetch_tmdb_entry(self, imdb_id, token=None):
+        """
+        Like get_tmdb_entry, but raises ConnectionError (ThrottledError when rate-limited) if the
+        lookup failed, so a failure can be told apart from a definitive "no match" (None, None).
+        """
+        if not (self.tmdb_api_key or self.tmdb_proxy_url) or not imdb_id:
+            return None, None
+        known_tmdb_id = None
+        if self.tmdb_cache:
+            extras, known_tmdb_id = self.tmdb_cache.get(imdb_id)
+            if extras is NO_MATCH:
+                return None, None
+            if extras is not None:
+                return known_tmdb_id, extras
+        if self.tmdb_proxy_url:
+            return self._get_tmdb_via_proxy(imdb_id, token)
+        try:
+            if known_tmdb_id is None:
+                find_url = f"{self.tmdb_base_url}/find/{imdb_id}"
+                params = {'api_key': self.tmdb_api_key, 'external_source': 'imdb_id'}
+                with self.metrics.timer('tmdb', 'find'):
+                    response = self.http_get(find_url, token=token, params=params, timeout=10)
+                    response.raise_for_status()
+                find_data = response.json()
+                if not find_data.get('movie_results'):
+                    if self.tmdb_cache:
+                        self.tmdb_cache.put(imdb_id, None, None)
+                    return None, None
+                known_tmdb_id = find_data['movie_results'][0]['id']
             
-            tmdb_id = find_data['movie_results'][0]['id']
-            details_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}"
+            tmdb_id = known_tmdb_id
+            details_url = f"{self.tmdb_base_url}/movie/{tmdb_id}"
             params = {'api_key': self.tmdb_api_key, 'append_to_response': 'videos,credits'}
-            response = requests.get(details_url, params=params, timeout=10)
-            response.raise_for_status()
+            with self.metrics.timer('tmdb', 'movie'):
+                response = self.http_get(details_url, token=token, params=params, timeout=10)
+                response.raise_for_status()
             details_data = response.json()
             
             enhanced_data = {}
@@ -162,13 +702,63 @@ class APIHandler:
                 enhanced_data['cast'] = [actor['name'] for actor in details_data['credits']['cast'][:10]]
             if details_data.get('overview'):
                 enhanced_data['description_full'] = details_data['overview']
-            return enhanced_data
+            if self.tmdb_cache:
+                self.tmdb_cache.put(imdb_id, tmdb_id, enhanced_data)
+            return tmdb_id, enhanced_data
         except (requests.RequestException, KeyError, IndexError) as e:
-            print(f"TMDB API request failed: {e}"); return None
+            raise ConnectionError(f"TMDB API request failed: {e}") from e
+
+    def _get_tmdb_via_proxy(self, imdb_id, token=None):
+        """TMDB extras from a yts_proxy, which holds the API key and a cache shared by every client."""
+        try:
+            with self.metrics.timer('tmdb', 'proxy'):
+                response = self.http_get(f"{self.tmdb_proxy_url}/tmdb/{imdb_id}", token=token, timeout=15)
+                response.raise_for_status()
+            entry = response.json()['data']
+            tmdb_id, extras = entry['tmdb_id'], entry['extras']
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            raise ConnectionError(f"TMDB proxy request failed: {e}") from e
+        if self.tmdb_cache:
+            self.tmdb_cache.put(imdb_id, tmdb_id, extras if tmdb_id is not None else None)
+        return tmdb_id, extras
+
+    async def enrich_tmdb_batch(self, imdb_ids, max_concurrency=None):
+        """
+        Enriches a whole results page with TMDB data, at most `max_concurrency` movies at a time.
+        Codes already fresh in the TMDB cache are skipped. Returns {imdb_id: extras_or_None}.
+        """
+        if not (self.tmdb_api_key or self.tmdb_proxy_url):
+            return {}
+        semaphore = asyncio.Semaphore(max_concurrency or self.tmdb_batch_concurrency)
+
+        async def enrich(imdb_id):
+            async with semaphore:
+                return imdb_id, await self.io.run_blocking(self.get_tmdb_details, imdb_id)
+
+        todo = [i for i in dict.fromkeys(imdb_ids) if i and not (self.tmdb_cache and self.tmdb_cache.is_fresh(i))]
+        results = await asyncio.gather(*(enrich(i) for i in todo), return_exceptions=True)
+        return dict(r for r in results if not isinstance(r, Exception))
 
-    def get_image_data(self, url):
+    def enrich_page_in_background(self, movies):
+        """Schedules TMDB batch enrichment for a list_movies page on the asyncio engine. Returns a Future."""
+        return self.io.submit(self.enrich_tmdb_batch([m.get('imdb_code') for m in movies]))
+
+    def get_image_data(self, url, token=None):
+        if self.poster_cache:
+            data = self.poster_cache.get(url)
+            if data is not None:
+                return data
         try:
-            response = requests.get(url, headers=self.headers, timeout=20)
-            return response.content if response.status_code == 200 else None
+            start_time = time.monotonic()
+            response = self.http_get(url, token=token, timeout=20)
+            self.metrics.observe('images', 'download', time.monotonic() - start_time, ok=response.status_code == 200)
+            if response.status_code != 200:
+                return None
+            if self.poster_cache:
+                self.poster_cache.put(url, response.content)
+            return response.content
+        except CancelledError:
+            return None
         except Exception as e:
-            print(f"Failed to download image from {url}: {e}"); return None
+            self.metrics.observe('images', 'download', time.monotonic() - start_time, ok=False)
+            self.log(f"Failed to download image from {url}: {e}"); return None
@@ -0,0 +1,64 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_IO_THREADS = 8
+
+
+class AsyncEngine:
+    """
+    A single asyncio event loop running on its own daemon thread.
+
+    Coroutines are scheduled from any thread with `submit()` (returns a concurrent.futures.Future)
+    or `run()` (blocks for the result). Blocking pooled-session calls are awaited through
+    `run_blocking()`, which hands them to the loop's bounded executor, so independent
+    round trips can overlap without each caller managing its own threads.
+    """
+
+    def __init__(self, io_threads=DEFAULT_IO_THREADS):
+        self.loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="io")
+        self.loop.set_default_executor(self._executor)
+        self._lock = threading.Lock()
+        self.tasks_in_flight = 0
+        self.blocking_in_flight = 0
+        self._thread = threading.Thread(target=self._run_loop, name="asyncio-engine", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run_blocking(self, fn, *args, **kwargs):
+        """Awaitable that runs fn(*args, **kwargs) on the engine's executor."""
+        future = self.loop.run_in_executor(None, functools.partial(fn, *args, **kwargs))
+        self._track(future, 'blocking_in_flight')
+        return future
+
+    def submit(self, coro):
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._track(future, 'tasks_in_flight')
+        return future
+
+    def _track(self, future, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+        def done(_):
+            with self._lock:
+                setattr(self, counter, getattr(self, counter) - 1)
+
+        future.add_done_callback(done)
+
+    def stats(self):
+        with self._lock:
+            return {'tasks_in_flight': self.tasks_in_flight, 'blocking_in_flight': self.blocking_in_flight}
+
+    def run(self, coro, timeout=None):
+        """Runs `coro` on the engine loop and blocks the calling (non-loop) thread until it finishes."""
+        return self.submit(coro).result(timeout)
+
+    def shutdown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,476 @@
+"""
+Offline benchmark for the network and data paths behind the GUI. Local stand-in servers play
+the YTS mirrors, TMDB and the poster host with configurable latency, jitter and failure
+injection, so results are reproducible and never touch the real services.
+
+    python bench.py
+    python bench.py --runs 50 --latency 120 --jitter 60 --failure-rate 0.02
+    python bench.py --fixtures recordings/    # serve recorded responses, see load_fixtures()
+
+Scenarios time the handler and data paths the GUI calls, not Tk itself (each run in its own
+scratch directory, so caches start empty where it matters):
+
+    handler_startup       APIHandler() + mirror selection with one dead mirror in the list
+    first_page_to_model   first list_movies page into MovieModel and MovieTable
+    details_bundle        fetch_movie_bundle (details, TMDB, poster) + poster decode
+    next_page_to_model    next uncached list_movies page into the model
+    domain_failover       active mirror goes dark; time until a request succeeds elsewhere
+
+The report (p50/p95/p99 per scenario) goes to stdout and bench_output.txt. Each scenario has a
+p95 ceiling of `fixed + round_trips * (latency + jitter)` ms; the exit status is 1 when any
+scenario exceeds its ceiling or fails every run.
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+# --- Benchmark Defaults ---
+BENCH_OUTPUT_FILE = "bench_output.txt"
+DEFAULT_RUNS = 20
+DEFAULT_LATENCY_MS = 60
+DEFAULT_JITTER_MS = 30
+DEFAULT_FAILURE_RATE = 0.0
+DEFAULT_SEED = 1234
+CATALOG_SIZE = 2000
+PAGE_SIZE = 50
+POSTER_SIZE = (500, 750)
+DETAILS_POSTER_BOX = (0, 400)
+
+# scenario: (sequential upstream round trips on the critical path, fixed budget in ms)
+THRESHOLDS = {
+    'handler_startup': (2, 400),
+    'first_page_to_model': (1, 250),
+    'details_bundle': (3, 300),
+    'next_page_to_model': (1, 200),
+    'domain_failover': (3, 500),
+}
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def dead_url():
+    """A localhost URL nobody listens on (connections are refused), standing in for a mirror that went down."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+# --- Stand-in Upstream ---
+def synthetic_catalog(size=CATALOG_SIZE):
+    genres = ['Action', 'Comedy', 'Drama', 'Horror', 'Sci-Fi', 'Thriller', 'Romance', 'Animation']
+    movies = []
+    for i in range(1, size + 1):
+        movies.append({
+            'id': i, 'imdb_code': f"tt{1000000 + i}", 'title': f"Bench Movie {i}", 'title_long': f"Bench Movie {i} ({1970 + i % 55})",
+            'year': 1970 + i % 55, 'rating': round((i * 37) % 90 / 10, 1), 'runtime': 80 + i % 70,
+            'genres': [genres[i % len(genres)], genres[(i * 3) % len(genres)]], 'language': 'en',
+            'summary': f"Synthetic synopsis for movie {i}. " * 4, 'date_uploaded_unix': 1500000000 + i * 3600,
+            'torrents': [
+                {'hash': hashlib.sha1(f"{i}-{q}".encode()).hexdigest().upper(), 'quality': q, 'type': 'web',
+                 'seeds': (i * 7 + n) % 300, 'peers': (i * 3 + n) % 120, 'size': f"{1 + n}.{i % 10} GB", 'size_bytes': (1 + n) * 10 ** 9}
+                for n, q in enumerate(('720p', '1080p', '2160p')[:1 + i % 3])
+            ],
+        })
+    return movies
+
+
+def _read_json_fixtures(path, pattern):
+    for name in sorted(glob.glob(os.path.join(path, pattern))):
+        with open(name, 'r', encoding='utf-8') as f:
+            yield os.path.splitext(os.path.basename(name))[0], json.load(f)
+
+
+def load_fixtures(path):
+    """
+    Recorded upstream responses, for every route the stand-in servers answer:
+
+        list_movies*.json          YTS list_movies (full responses or their 'data' objects); required
+        movie_details*.json        YTS movie_details, keyed by the movie id inside
+        tmdb_find_<imdb_code>.json TMDB /find/<imdb_code>
+        tmdb_movie_<tmdb_id>.json  TMDB /movie/<tmdb_id> (with videos and credits appended)
+        poster*.jpg                served for every poster URL (the first one found)
+
+    Routes without a recording fall back to responses synthesized from the catalog.
+    """
+    fixtures = {'catalog': {}, 'details': {}, 'tmdb_find': {}, 'tmdb_movie': {}, 'poster': None}
+    for _, payload in _read_json_fixtures(path, "list_movies*.json"):
+        for movie in (payload.get('data', payload).get('movies') or []):
+            fixtures['catalog'][movie['id']] = movie
+    if not fixtures['catalog']:
+        raise SystemExit(f"No list_movies*.json fixtures found in {path}")
+    fixtures['catalog'] = list(fixtures['catalog'].values())
+    for _, payload in _read_json_fixtures(path, "movie_details*.json"):
+        movie = payload.get('data', payload).get('movie') or {}
+        if movie.get('id') is not None:
+            fixtures['details'][movie['id']] = movie
+    for name, payload in _read_json_fixtures(path, "tmdb_find_*.json"):
+        fixtures['tmdb_find'][name[len("tmdb_find_"):]] = payload
+    for name, payload in _read_json_fixtures(path, "tmdb_movie_*.json"):
+        fixtures['tmdb_movie'][name[len("tmdb_movie_"):]] = payload
+    posters = sorted(glob.glob(os.path.join(path, "poster*.jpg")))
+    if posters:
+        with open(posters[0], 'rb') as f:
+            fixtures['poster'] = f.read()
+    return fixtures
+
+
+def make_poster_bytes(size=POSTER_SIZE):
+    """A real JPEG when Pillow is installed (so decode time is measured), otherwise opaque bytes."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b'\xff\xd8' + os.urandom(60000)
+    img = Image.linear_gradient('L').resize(size).convert('RGB')
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', quality=85)
+    return buffer.getvalue()
+
+
+class FakeUpstream(ThreadingHTTPServer):
+    """
+    Serves the YTS API, TMDB find/movie and poster routes from an in-memory catalog. The bench
+    runs one instance per real host (YTS mirror, TMDB, image host), since APIHandler rate-limits
+    and pools connections per host; `tmdb_url` and `image_url` point at the sibling instances.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fixtures, latency_ms, jitter_ms, failure_rate, seed):
+        super().__init__(('127.0.0.1', 0), _FakeUpstreamHandler)
+        self.catalog = fixtures['catalog']
+        self.by_id = {m['id']: m for m in self.catalog}
+        self.by_imdb = {m.get('imdb_code'): m for m in self.catalog}
+        self.details = fixtures['details']
+        self.tmdb_find = fixtures['tmdb_find']
+        self.tmdb_movie = fixtures['tmdb_movie']
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.poster = fixtures['poster'] or make_poster_bytes()
+        self.counts = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.tmdb_url = self.image_url = self.base_url
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def draw(self, route):
+        """Counts the request and returns (delay seconds, fail?) from the seeded generator."""
+        with self._lock:
+            self.counts[route] = self.counts.get(route, 0) + 1
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            return delay, self._rng.random() < self.failure_rate
+
+    def with_images(self, movie):
+        movie = dict(movie)
+        for key in ('small_cover_image', 'medium_cover_image', 'large_cover_image', 'background_image'):
+            movie[key] = f"{self.image_url}/img/{movie['id']}.jpg"
+        return movie
+
+
+class _FakeUpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = dict(parse_qsl(parts.query))
+        server = self.server
+        route = 'tmdb' if parts.path.startswith('/3/') else 'poster' if parts.path.startswith('/img/') else parts.path
+        delay, fail = server.draw(route)
+        time.sleep(delay)
+        if fail:
+            self._send(503, b'{"status": "error", "status_message": "injected failure"}', 'application/json', {'Retry-After': '1'})
+            return
+
+        if parts.path == '/api/v2/list_movies.json':
+            page, limit = int(params.get('page', 1)), int(params.get('limit', 20))
+            movies = [server.with_images(m) for m in server.catalog[(page - 1) * limit:page * limit]]
+            self._send_json({'status': 'ok', 'data': {'movie_count': len(server.catalog), 'limit': limit, 'page_number': page, 'movies': movies}})
+        elif parts.path == '/api/v2/movie_details.json':
+            movie_id = int(params.get('movie_id', 0))
+            movie = server.details.get(movie_id) or server.by_id.get(movie_id)
+            self._send_json({'status': 'ok', 'data': {'movie': server.with_images(movie) if movie else {}}})
+        elif parts.path.startswith('/3/find/'):
+            imdb_code = parts.path.rsplit('/', 1)[1]
+            if imdb_code in server.tmdb_find:
+                self._send_json(server.tmdb_find[imdb_code])
+                return
+            movie = server.by_imdb.get(imdb_code)
+            self._send_json({'movie_results': [{'id': movie['id']}] if movie else []})
+        elif parts.path.startswith('/3/movie/'):
+            tmdb_id = parts.path.rsplit('/', 1)[1]
+            if tmdb_id in server.tmdb_movie:
+                self._send_json(server.tmdb_movie[tmdb_id])
+                return
+            movie = server.by_id.get(int(tmdb_id), {}) if tmdb_id.isdigit() else {}
+            self._send_json({
+                'overview': movie.get('summary', ''),
+                'videos': {'results': [{'type': 'Trailer', 'site': 'YouTube', 'key': f"bench{movie.get('id')}"}]},
+                'credits': {'cast': [{'name': f"Actor {n}"} for n in range(12)]},
+            })
+        elif parts.path.startswith('/img/'):
+            self._send(200, server.poster, 'image/jpeg')
+        else:
+            self._send(404, b'{}', 'application/json')
+
+    def _send_json(self, payload):
+        self._send(200, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# --- Scratch Environments ---
+class BenchEnv:
+    """
+    A scratch working directory with its own config.ini, yts_domains.json and caches, and an
+    APIHandler pointed at the stand-in server. APIHandler reads and writes these files in the
+    current directory, so the environment chdirs into it for its lifetime.
+    """
+
+    def __init__(self, upstream, domains):
+        self.upstream = upstream
+        self.domains = domains
+        self.api = None
+        self._dir = tempfile.mkdtemp(prefix="yts-bench-")
+        self._old_cwd = os.getcwd()
+        os.chdir(self._dir)
+        with open("yts_domains.json", 'w') as f:
+            json.dump(domains, f)
+        with open("config.ini", 'w') as f:
+            f.write("[TMDB]\napi_key = bench\n")
+
+    def start_api(self):
+        from api_handler import APIHandler
+        self.api = APIHandler(log=lambda message: None)
+        self.api.tmdb_base_url = f"{self.upstream.tmdb_url}/3"
+        return self.api
+
+    def close(self):
+        if self.api:
+            self.api.close()
+            self.api.workers.shutdown()
+            self.api.io.shutdown()
+            if self.api.cache:
+                self.api.cache.close()
+        os.chdir(self._old_cwd)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def list_params(page):
+    return {'page': page, 'limit': PAGE_SIZE, 'sort_by': 'date_added', 'order_by': 'desc'}
+
+
+# --- Scenarios ---
+# Each scenario is a generator that yields twice: setup runs before the first `yield`, the timed
+# section sits between the two, and cleanup after the second one is not measured.
+
+def scenario_handler_startup(upstream, run):
+    with BenchEnv(upstream, [dead_url(), upstream.base_url]) as env:
+        yield
+        api = env.start_api()
+        api.warm_up()
+        if not api.yts_active_domain:
+            raise ConnectionError("no mirror selected")
+        yield
+
+
+def scenario_first_page_to_model(upstream, run):
+    from movie_model import MovieModel
+    from movie_table import MovieTable
+    with BenchEnv(upstream, [upstream.base_url]) as env:
+        api = env.start_api()
+        api.warm_up()
+        yield
+        data = api.list_movies(**list_params(1))
+        MovieModel().append_page(data['movies'], data['movie_count'])
+        MovieTable(data['movies'])
+        yield
+
+
+def scenario_details_bundle(upstream, run, shared):
+    from poster_decoder import decode_poster
+    movie = shared['movies'][run % len(shared['movies'])]
+    api = shared['api']
+    yield
+    bundle = api.io.run(api.fetch_movie_bundle(movie['id'], movie.get('imdb_code'), movie.get('medium_cover_image')))
+    if not bundle['details']:
+        raise ConnectionError("details missing")
+    if bundle['poster'] and shared['can_decode']:
+        decode_poster(bundle['poster'], DETAILS_POSTER_BOX)
+    yield
+
+
+def scenario_next_page_to_model(upstream, run, shared):
+    yield
+    data = shared['api'].list_movies(**list_params(run + 2))
+    shared['model'].append_page(data['movies'], data['movie_count'])
+    yield
+
+
+def scenario_domain_failover(upstream, run):
+    with BenchEnv(upstream, [dead_url(), upstream.base_url]) as env:
+        api = env.start_api()
+        api.warm_up()
+        api.yts_active_domain = env.domains[0]    # the selected mirror has just gone down
+        yield
+        for attempt in range(3):
+            try:
+                api.list_movies(use_cache=False, **list_params(1))
+                break
+            except ConnectionError:
+                continue
+        else:
+            raise ConnectionError("no mirror answered after failover")
+        yield
+
+
+def time_scenario(factory, *args):
+    """Runs one scenario generator; returns elapsed seconds of its timed section."""
+    steps = factory(*args)
+    try:
+        next(steps)
+        start = time.perf_counter()
+        next(steps)
+        return time.perf_counter() - start
+    finally:
+        steps.close()
+
+
+def run_benchmarks(upstream, runs):
+    from movie_model import MovieModel
+    try:
+        import PIL  # noqa: F401
+        can_decode = True
+    except ImportError:
+        can_decode = False
+
+    results = {}
+
+    def measure(name, factory, extra=()):
+        timings, errors = [], []
+        for run in range(runs):
+            try:
+                timings.append(time_scenario(factory, upstream, run, *extra) * 1000)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+        results[name] = {'timings_ms': timings, 'errors': errors}
+
+    measure('handler_startup', scenario_handler_startup)
+    measure('first_page_to_model', scenario_first_page_to_model)
+    # Details and page flips share one warm handler, like a running app; every run hits new ids/pages.
+    with BenchEnv(upstream, [upstream.base_url]) as env:
+        api = env.start_api()
+        api.warm_up()
+        first = api.list_movies(**list_params(1))
+        shared = {'api': api, 'movies': first['movies'], 'model': MovieModel(), 'can_decode': can_decode}
+        shared['model'].append_page(first['movies'], first['movie_count'])
+        measure('details_bundle', scenario_details_bundle, (shared,))
+        measure('next_page_to_model', scenario_next_page_to_model, (shared,))
+    measure('domain_failover', scenario_domain_failover)
+    return results
+
+
+def build_report(results, args, upstream_counts):
+    lines = [
+        f"YTS benchmark  runs={args.runs} latency={args.latency}ms jitter=±{args.jitter}ms "
+        f"failure_rate={args.failure_rate} seed={args.seed} python={sys.version.split()[0]}",
+        "",
+        f"{'scenario':<22} {'ok':>4} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'limit':>8}  status",
+    ]
+    regressions = []
+    for name, result in results.items():
+        timings = result['timings_ms']
+        round_trips, fixed = THRESHOLDS[name]
+        limit = fixed + round_trips * (args.latency + args.jitter)
+        if timings:
+            p50, p95, p99 = (percentile(timings, p) for p in (50, 95, 99))
+            status = "ok" if p95 <= limit else "REGRESSION"
+            cells = f"{p50:>8.1f} {p95:>8.1f} {p99:>8.1f} {max(timings):>8.1f}"
+        else:
+            status = "FAILED"
+            cells = f"{'-':>8} {'-':>8} {'-':>8} {'-':>8}"
+        if status != "ok":
+            regressions.append(name)
+        lines.append(f"{name:<22} {len(timings):>4} {len(result['errors']):>4} {cells} {limit:>8.0f}  {status}")
+    lines += ["", "Upstream requests: " + ", ".join(f"{route} {n}" for route, n in sorted(upstream_counts.items()))]
+    for name, result in results.items():
+        for error in sorted(set(result['errors']))[:3]:
+            lines.append(f"  {name} error: {error}")
+    lines.append("")
+    lines.append("All scenarios within thresholds." if not regressions else f"Over threshold: {', '.join(regressions)}")
+    return "\n".join(lines), regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmark against a local stand-in for YTS, TMDB and the poster host.")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY_MS, help="mean upstream latency in ms")
+    parser.add_argument('--jitter', type=float, default=DEFAULT_JITTER_MS, help="uniform ± jitter in ms")
+    parser.add_argument('--failure-rate', type=float, default=DEFAULT_FAILURE_RATE, help="fraction of upstream requests answered with 503 + Retry-After: 1")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--fixtures', help="directory of recorded upstream responses to serve instead of synthetic data")
+    parser.add_argument('--output', default=BENCH_OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    # Scenario environments chdir into scratch directories; keep imports and the output path absolute.
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, here)
+    output = os.path.abspath(args.output)
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else {
+        'catalog': synthetic_catalog(), 'details': {}, 'tmdb_find': {}, 'tmdb_movie': {}, 'poster': None}
+    upstream, tmdb, images = (FakeUpstream(fixtures, args.latency, args.jitter, args.failure_rate, args.seed + n) for n in range(3))
+    upstream.tmdb_url, upstream.image_url = tmdb.base_url, images.base_url
+    try:
+        results = run_benchmarks(upstream, args.runs)
+    finally:
+        for server in (upstream, tmdb, images):
+            server.shutdown()
+    counts = {}
+    for server in (upstream, tmdb, images):
+        for route, n in server.counts.items():
+            counts[route] = counts.get(route, 0) + n
+    report, regressions = build_report(results, args, counts)
+    print(report)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(report + "\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+import sqlite3
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# --- Catalog Configuration (overridable in the [Catalog] section of config.ini) ---
+CATALOG_DB_FILE = "yts_catalog.sqlite3"
+SYNC_PAGE_SIZE = 50                # YTS caps `limit` at 50
+DEFAULT_SYNC_CONCURRENCY = 3
+DEFAULT_SYNC_RATE = 2.0            # list_movies pages started per second, across all sync workers
+
+SORT_COLUMNS = {
+    'date_added': 'date_added_unix',
+    'like_count': 'like_count',
+    'download_count': 'download_count',
+    'peers': 'peers',
+    'seeds': 'seeds',
+    'rating': 'rating',
+    'year': 'year',
+    'title': 'title COLLATE NOCASE',
+}
+
+
+def read_catalog_config(config):
+    """[Catalog] settings from a parsed config.ini: prefer_local, sync concurrency and sync rate."""
+    settings = {'prefer_local': True, 'concurrency': DEFAULT_SYNC_CONCURRENCY, 'rate': DEFAULT_SYNC_RATE}
+    try:
+        settings['prefer_local'] = config.getboolean('Catalog', 'prefer_local', fallback=True)
+        settings['concurrency'] = config.getint('Catalog', 'sync_concurrency', fallback=DEFAULT_SYNC_CONCURRENCY)
+        settings['rate'] = config.getfloat('Catalog', 'sync_rate', fallback=DEFAULT_SYNC_RATE)
+    except ValueError as e:
+        print(f"Error reading [Catalog] settings: {e}")
+    return settings
+
+
+class CatalogStore:
+    """
+    Local SQLite mirror of the YTS catalog.
+
+    Each movie keeps its full list_movies payload plus the columns needed to filter and
+    sort without parsing JSON. `query()` accepts the same params as APIHandler.list_movies
+    and returns the same {'movie_count', 'page_number', 'limit', 'movies'} shape, so the UI
+    can browse the mirror exactly like a live YTS domain.
+    """
+
+    def __init__(self, path=CATALOG_DB_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS movies ("
+            " id INTEGER PRIMARY KEY, title TEXT, year INTEGER, rating REAL, runtime INTEGER,"
+            " genres TEXT, qualities TEXT, imdb_code TEXT, date_added_unix INTEGER,"
+            " download_count INTEGER, like_count INTEGER, seeds INTEGER, peers INTEGER, payload TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS idx_movies_added ON movies(date_added_unix);"
+            "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _row(movie):
+        torrents = movie.get('torrents') or []
+        return (
+            movie['id'],
+            movie.get('title_english') or movie.get('title', ''),
+            movie.get('year') or 0,
+            movie.get('rating') or 0.0,
+            movie.get('runtime') or 0,
+            '|' + '|'.join(movie.get('genres') or []) + '|',
+            '|' + '|'.join(t.get('quality', '') for t in torrents) + '|',
+            movie.get('imdb_code', ''),
+            movie.get('date_uploaded_unix') or 0,
+            movie.get('download_count') or 0,
+            movie.get('like_count') or 0,
+            max((t.get('seeds') or 0 for t in torrents), default=0),
+            max((t.get('peers') or 0 for t in torrents), default=0),
+            json.dumps(movie, separators=(',', ':')),
+        )
+
+    def upsert_many(self, movies):
+        rows = [self._row(m) for m in movies if m.get('id') is not None]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO movies VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def known_ids(self, ids):
+        ids = list(ids)
+        if not ids:
+            return set()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id FROM movies WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM movies").fetchone()[0]
+
+    def get_state(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_state(self, key, value):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+            self._conn.commit()
+
+    def is_complete(self):
+        return bool(self.get_state('full_complete', False))
+
+    def iter_payloads(self, batch_size=1000):
+        """Yields every stored movie payload, in batches, without holding the lock between them."""
+        last_id = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, payload FROM movies WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for _, payload in rows:
+                yield json.loads(payload)
+            last_id = rows[-1][0]
+
+    def get_many(self, ids):
+        """Returns the payloads for `ids`, in the same order (unknown ids are skipped)."""
+        ids = list(ids)
+        if not ids:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, payload FROM movies WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        payloads = {movie_id: payload for movie_id, payload in rows}
+        return [json.loads(payloads[i]) for i in ids if i in payloads]
+
+    def query(self, page=1, limit=SYNC_PAGE_SIZE, sort_by='date_added', order_by='desc',
+              query_term=None, genre=None, quality=None, minimum_rating=None, **_ignored):
+        where, args = [], []
+        if query_term:
+            where.append("(title LIKE ? OR imdb_code = ?)")
+            args += [f"%{query_term}%", query_term]
+        if genre and genre != 'All':
+            where.append("genres LIKE ?")
+            args.append(f"%|{genre}|%")
+        if quality and quality != 'All':
+            where.append("qualities LIKE ?")
+            args.append(f"%|{quality}|%")
+        if minimum_rating:
+            where.append("rating >= ?")
+            args.append(float(minimum_rating))
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        column = SORT_COLUMNS.get(sort_by, 'date_added_unix')
+        direction = 'ASC' if order_by == 'asc' else 'DESC'
+        page, limit = max(1, int(page)), int(limit)
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM movies{clause}", args).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT payload FROM movies{clause} ORDER BY {column} {direction}, id {direction} LIMIT ? OFFSET ?",
+                args + [limit, (page - 1) * limit],
+            ).fetchall()
+        return {'movie_count': total, 'limit': limit, 'page_number': page, 'movies': [json.loads(r[0]) for r in rows]}
+
+
+class CatalogSync:
+    """
+    Pulls the YTS catalog into a CatalogStore.
+
+    The first sync pages through list_movies oldest-first with a few concurrent, rate-capped
+    workers and records every finished page, so an interrupted sync resumes where it stopped.
+    Once a full pass has completed, later syncs are incremental: newest-first, stopping at the
+    first page that contains an id already in the store; they only run on a complete mirror,
+    so a partial one is never walked page by page from the newest end.
+    `progress(done, total, message)` is called from the sync thread.
+    """
+
+    def __init__(self, api, store, concurrency=DEFAULT_SYNC_CONCURRENCY, rate=DEFAULT_SYNC_RATE):
+        self.api = api
+        self.store = store
+        self.concurrency = concurrency
+        self.min_interval = 1.0 / rate if rate > 0 else 0.0
+        self.running = False
+        self._stop = threading.Event()
+        self._pace_lock = threading.Lock()
+        self._next_start = 0.0
+
+    def stop(self):
+        self._stop.set()
+
+    def _pace(self):
+        """Blocks until this worker may start its next request under the shared rate cap."""
+        with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _fetch_page(self, page, order_by):
+        if self._stop.is_set():
+            return page, None
+        self._pace()
+        data = self.api.list_movies(use_cache=False, page=page, limit=SYNC_PAGE_SIZE, sort_by='date_added', order_by=order_by)
+        return page, data
+
+    def run(self, progress=None):
+        """
+        Runs a resumable full sync if none has completed yet, then an incremental one once the
+        mirror is complete. Blocking.
+        """
+        progress = progress or (lambda done, total, message: None)
+        self._stop.clear()
+        self.running = True
+        try:
+            if not self.store.is_complete():
+                self._full_sync(progress)
+            if not self._stop.is_set() and self.store.is_complete():
+                self._incremental_sync(progress)
+        finally:
+            self.running = False
+
+    def _full_sync(self, progress):
+        first = self.api.list_movies(use_cache=False, page=1, limit=SYNC_PAGE_SIZE, sort_by='date_added', order_by='asc')
+        total_pages = max(1, math.ceil(first.get('movie_count', 0) / SYNC_PAGE_SIZE))
+        done = set(self.store.get_state('full_pages_done', []))
+        if 1 not in done:
+            self.store.upsert_many(first.get('movies') or [])
+            done.add(1)
+            self.store.set_state('full_pages_done', sorted(done))
+        todo = [p for p in range(1, total_pages + 1) if p not in done]
+        failed = 0
+        progress(len(done), total_pages, "Syncing catalog...")
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="catalog-sync") as pool:
+            futures = [pool.submit(self._fetch_page, p, 'asc') for p in todo]
+            for future in as_completed(futures):
+                try:
+                    page, data = future.result()
+                except Exception as e:
+                    print(f"Catalog page failed, will retry on next sync: {e}")
+                    failed += 1
+                    continue
+                if data is None:
+                    continue
+                self.store.upsert_many(data.get('movies') or [])
+                done.add(page)
+                self.store.set_state('full_pages_done', sorted(done))
+                progress(len(done), total_pages, "Syncing catalog...")
+
+        if len(done) >= total_pages and not self._stop.is_set():
+            self.store.set_state('full_complete', True)
+            self.store.set_state('full_pages_done', [])
+            self.store.set_state('last_sync', time.time())
+        elif failed:
+            progress(len(done), total_pages, f"Catalog incomplete: {failed} pages failed, sync again to resume.")
+
+    def _incremental_sync(self, progress):
+        page = 1
+        added = 0
+        while not self._stop.is_set():
+            _, data = self._fetch_page(page, 'desc')
+            movies = (data or {}).get('movies') or []
+            if not movies:
+                break
+            known = self.store.known_ids(m['id'] for m in movies)
+            fresh = []
+            for movie in movies:
+                if movie['id'] in known:
+                    break
+                fresh.append(movie)
+            self.store.upsert_many(fresh)
+            added += len(fresh)
+            progress(page, page, f"Catalog update: {added} new movies")
+            if len(fresh) < len(movies):
+                break
+            page += 1
+        self.store.set_state('last_sync', time.time())
+        progress(1, 1, f"Catalog up to date ({self.store.count()} movies, {added} new)")
@@ -0,0 +1,204 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# How often a caller blocked on someone else's in-flight request re-checks its own cancel token.
+WAIT_POLL_SECONDS = 0.1
+
+
+class CancelledError(Exception):
+    """Raised inside work that was superseded before it could finish."""
+
+
+class CancelToken:
+    """A flag shared between the caller that owns some work and the code doing it."""
+
+    def __init__(self, parent=None):
+        self._event = threading.Event()
+        self._children = set()
+        self._lock = threading.Lock()
+        self._parent = parent
+
+    def cancel(self):
+        with self._lock:
+            self._event.set()
+            children, self._children = self._children, set()
+        for child in children:
+            child.cancel()
+        if self._parent is not None:
+            self._parent._discard(self)
+            self._parent = None
+
+    def child(self):
+        """A token that is cancelled along with this one, but can also be cancelled on its own."""
+        token = CancelToken(self)
+        with self._lock:
+            if not self._event.is_set():
+                self._children.add(token)
+                return token
+        token.cancel()
+        return token
+
+    def _discard(self, child):
+        with self._lock:
+            self._children.discard(child)
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CancelledError()
+
+
+class TaskHandle:
+    """Handle returned by WorkerPool.submit(). Cancelling it drops queued work and flags running work."""
+
+    def __init__(self, future, token):
+        self.future = future
+        self.token = token
+
+    def cancel(self):
+        self.token.cancel()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+    def done(self):
+        return self.future.done()
+
+
+class WorkerPool:
+    """Bounded pool for background API work. Every task receives its CancelToken as the `token` kwarg."""
+
+    def __init__(self, max_workers, name="api"):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+
+    def submit(self, fn, *args, **kwargs):
+        token = CancelToken()
+        with self._lock:
+            self.queued += 1
+        future = self._executor.submit(self._run, fn, token, args, kwargs)
+        future.add_done_callback(self._on_done)
+        return TaskHandle(future, token)
+
+    def _on_done(self, future):
+        if future.cancelled():   # dropped from the queue before it ever ran
+            with self._lock:
+                self.queued -= 1
+
+    def _run(self, fn, token, args, kwargs):
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            if token.cancelled:
+                return None
+            return fn(*args, token=token, **kwargs)
+        except CancelledError:
+            return None
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def stats(self):
+        with self._lock:
+            return {'queued': self.queued, 'running': self.running}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while `do(key, fn)` is running for a key, every
+    other caller with the same key waits for and shares that one result (or exception)
+    instead of issuing its own request.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, token=None):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            while not call.event.wait(WAIT_POLL_SECONDS):
+                if token is not None:
+                    token.raise_if_cancelled()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self):
+        with self._lock:
+            return {'in_flight': len(self._calls), 'executed': self.executed, 'coalesced': self.coalesced}
+
+
+class RequestBudget:
+    """
+    Caps optional duplicate work (e.g. hedged requests) to a fraction of primary traffic.
+
+    Every primary request earns `ratio` credits, up to `burst`; each duplicate spends one.
+    With ratio=0.1 at most ~10% of requests can be duplicated over time, whatever the load.
+    """
+
+    def __init__(self, ratio, burst):
+        self.ratio = ratio
+        self.burst = burst
+        self.spent = 0
+        self.denied = 0
+        self._credits = burst
+        self._lock = threading.Lock()
+
+    def on_request(self):
+        with self._lock:
+            self._credits = min(self.burst, self._credits + self.ratio)
+
+    def try_spend(self):
+        with self._lock:
+            if self._credits >= 1.0:
+                self._credits -= 1.0
+                self.spent += 1
+                return True
+            self.denied += 1
+            return False
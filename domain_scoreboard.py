@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+import time
+
+# --- Scoreboard Configuration ---
+DOMAIN_STATS_FILE = "yts_domain_stats.json"
+EWMA_ALPHA = 0.3              # weight of the newest latency sample
+LATENCY_SAMPLES = 50          # recent raw samples kept per domain (for percentiles)
+OUTCOME_HISTORY = 20          # recent success/failure outcomes kept per domain
+UNKNOWN_LATENCY = 5.0         # assumed latency for a domain that has never answered
+FAILURE_PENALTY = 4.0         # score multiplier per unit of recent failure rate
+SAVE_INTERVAL = 10.0          # minimum seconds between non-forced writes
+
+
+class DomainScoreboard:
+    """
+    Per-domain latency and reliability history, persisted next to yts_domains.json.
+
+    Each domain keeps an EWMA of its response latency, a window of recent raw samples,
+    and a window of recent success/failure outcomes. `ranked()` orders domains by EWMA
+    inflated by their recent failure rate, and `last_best` remembers which mirror served
+    us last so a restart can use it immediately.
+    """
+
+    def __init__(self, path=DOMAIN_STATS_FILE):
+        self.path = path
+        self.last_best = None
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.last_best = data.get('last_best')
+            self._stats = data.get('domains', {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            self._stats = {}
+
+    def save(self, force=False):
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_save < SAVE_INTERVAL:
+                return
+            self._last_save = now
+            payload = {'last_best': self.last_best, 'domains': self._stats}
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(payload, f, indent=4)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Could not save stats to {self.path}: {e}")
+
+    def _entry(self, domain):
+        return self._stats.setdefault(domain, {
+            'ewma': None, 'samples': [], 'outcomes': [], 'last_success': None, 'last_failure': None,
+        })
+
+    def record_success(self, domain, latency):
+        with self._lock:
+            entry = self._entry(domain)
+            entry['ewma'] = latency if entry['ewma'] is None else EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * entry['ewma']
+            entry['samples'] = (entry['samples'] + [round(latency, 4)])[-LATENCY_SAMPLES:]
+            entry['outcomes'] = (entry['outcomes'] + [1])[-OUTCOME_HISTORY:]
+            entry['last_success'] = time.time()
+        self.save()
+
+    def record_failure(self, domain):
+        with self._lock:
+            entry = self._entry(domain)
+            entry['outcomes'] = (entry['outcomes'] + [0])[-OUTCOME_HISTORY:]
+            entry['last_failure'] = time.time()
+        self.save()
+
+    def set_best(self, domain):
+        with self._lock:
+            self.last_best = domain
+        self.save(force=True)
+
+    def failure_rate(self, domain):
+        with self._lock:
+            outcomes = self._stats.get(domain, {}).get('outcomes') or []
+        return 1.0 - sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+    def is_live(self, domain):
+        """True if the most recent recorded outcome for `domain` was a success."""
+        with self._lock:
+            outcomes = self._stats.get(domain, {}).get('outcomes') or []
+        return bool(outcomes) and outcomes[-1] == 1
+
+    def score(self, domain):
+        """Lower is better: smoothed latency inflated by the recent failure rate."""
+        with self._lock:
+            ewma = self._stats.get(domain, {}).get('ewma')
+        latency = UNKNOWN_LATENCY if ewma is None else ewma
+        return latency * (1.0 + FAILURE_PENALTY * self.failure_rate(domain))
+
+    def ranked(self, domains):
+        return sorted(domains, key=self.score)
+
+    def percentile(self, domain, pct):
+        """Returns the `pct` percentile (0-100) of recent latency samples, or None without history."""
+        with self._lock:
+            samples = sorted(self._stats.get(domain, {}).get('samples') or [])
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct / 100.0 * (len(samples) - 1)))))
+        return samples[index]
+
+    def snapshot(self):
+        with self._lock:
+            last_best = self.last_best
+            ewmas = {d: s.get('ewma') for d, s in self._stats.items()}
+        return {
+            'last_best': last_best,
+            'domains': {d: {'ewma': e, 'failure_rate': self.failure_rate(d)} for d, e in ewmas.items()},
+        }
@@ -0,0 +1,202 @@
+import bisect
+import json
+import re
+import threading
+import time
+from collections import deque
+
+# --- Metrics Defaults ---
+# Upper bounds (ms) of the latency histogram buckets; anything slower lands in the overflow bucket.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+HEARTBEAT_INTERVAL_MS = 100
+DEFAULT_STALL_THRESHOLD_MS = 200
+STALL_HISTORY = 200         # most recent main-thread stalls kept for the diagnostics window
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution (not thread-safe on its own; Metrics serializes access)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms, ok=True):
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if not ok:
+            self.errors += 1
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (the max for the overflow bucket)."""
+        if not self.count:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.buckets[i], self.max_ms) if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean_ms': round(self.total_ms / self.count, 1) if self.count else None,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(self.max_ms, 1),
+            'buckets': {f"<={b}": n for b, n in zip(self.buckets, self.counts)} | {'overflow': self.counts[-1]},
+        }
+
+
+class Metrics:
+    """
+    Process-wide latency histograms keyed by (category, name), e.g. ('yts', 'list_movies.json'),
+    ('tmdb', 'find'), ('images', 'download'), ('trackers', 'udp'), ('ui', 'heartbeat_lag').
+
+    `timer()` is a context manager for the common case; failures are counted when the block raises.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self.stalls = deque(maxlen=STALL_HISTORY)
+        self.started_at = time.time()
+
+    def observe(self, category, name, seconds, ok=True):
+        with self._lock:
+            histogram = self._histograms.get((category, name))
+            if histogram is None:
+                histogram = self._histograms[(category, name)] = LatencyHistogram()
+            histogram.observe(seconds * 1000, ok)
+
+    def timer(self, category, name):
+        return _Timer(self, category, name)
+
+    def record_stall(self, ms):
+        with self._lock:
+            self.stalls.append({'time': time.time(), 'ms': round(ms, 1)})
+
+    def snapshot(self):
+        with self._lock:
+            latency = {}
+            for (category, name), histogram in sorted(self._histograms.items()):
+                latency.setdefault(category, {})[name] = histogram.snapshot()
+            return {'uptime': round(time.time() - self.started_at), 'latency': latency, 'stalls': list(self.stalls)}
+
+
+class _Timer:
+    __slots__ = ('metrics', 'category', 'name', 'start')
+
+    def __init__(self, metrics, category, name):
+        self.metrics = metrics
+        self.category = category
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.category, self.name, time.perf_counter() - self.start, ok=exc_type is None)
+        return False
+
+
+class LagMonitor:
+    """
+    Measures how late Tk runs an `after()` heartbeat. Lateness is time the main thread spent
+    busy (a handler, a layout pass, a synchronous decode); every beat is recorded in the
+    ('ui', 'heartbeat_lag') histogram and beats later than `threshold_ms` are kept as stalls.
+    """
+
+    def __init__(self, widget, metrics, interval_ms=HEARTBEAT_INTERVAL_MS, threshold_ms=DEFAULT_STALL_THRESHOLD_MS):
+        self.widget = widget
+        self.metrics = metrics
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.worst_ms = 0.0
+        self._expected = None
+        self._after_id = None
+
+    def start(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._after_id = self.widget.after(self.interval_ms, self._beat)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._expected) * 1000)
+        self.metrics.observe('ui', 'heartbeat_lag', lag_ms / 1000)
+        if lag_ms > self.threshold_ms:
+            self.metrics.record_stall(lag_ms)
+        self.worst_ms = max(self.worst_ms, lag_ms)
+        self._expected = now + self.interval_ms / 1000
+        self._after_id = self.widget.after(self.interval_ms, self._beat)
+
+
+def thread_counts():
+    """Live threads grouped by name prefix (e.g. 'io', 'api', 'poster-decode')."""
+    counts = {}
+    for thread in threading.enumerate():
+        # Executor threads are named '<prefix>_<n>', plain threads 'Thread-<n> (<target>)'.
+        prefix = re.sub(r'(_\d+$)|(-\d+)', '', thread.name)
+        counts[prefix] = counts.get(prefix, 0) + 1
+    return counts
+
+
+def hit_rate(stats):
+    """Hit ratio from a cache stats dict with 'hits'/'misses' (and optional 'stale_hits'), or None before any lookup."""
+    if not stats:
+        return None
+    hits = stats.get('hits', 0) + stats.get('stale_hits', 0)
+    total = hits + stats.get('misses', 0)
+    return round(hits / total, 3) if total else None
+
+
+def export_json(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+
+
+def format_report(report, recent_stalls=10):
+    """Plain-text rendering of a diagnostics report for the diagnostics window."""
+    lines = [f"Uptime: {report.get('uptime', 0)} s", "", "Latency (ms)            count  err    p50    p95    p99    max"]
+    for category, names in report.get('latency', {}).items():
+        for name, h in names.items():
+            cells = [h['p50_ms'], h['p95_ms'], h['p99_ms'], h['max_ms']]
+            lines.append(f"  {category + ' ' + name:<21.21} {h['count']:>6} {h['errors']:>4} " + " ".join(
+                f"{c:>6.0f}" if c is not None else "     -" for c in cells))
+    lines += ["", "Caches"]
+    for name, stats in report.get('caches', {}).items():
+        rate = stats.get('hit_rate')
+        lines.append(f"  {name:<16} hit rate {'-' if rate is None else f'{rate:.0%}':>5}   entries {stats.get('entries', '-')}")
+    coalescing = report.get('coalescing')
+    if coalescing:
+        lines.append(f"  coalesced requests {coalescing['coalesced']} of {coalescing['executed'] + coalescing['coalesced']}")
+    lines += ["", "In flight"]
+    for name, value in report.get('in_flight', {}).items():
+        if isinstance(value, dict):
+            value = ", ".join(f"{k} {v}" for k, v in value.items())
+        lines.append(f"  {name:<16} {value}")
+    limits = report.get('rate_limits', {})
+    if limits:
+        lines += ["", "Rate limits       window  in flight  throttled  paused"]
+        for host, stats in limits.items():
+            lines.append(f"  {host:<16.16} {stats['window']:>6} {stats['in_flight']:>10} {stats['throttled']:>10} {stats['paused_for']:>6.1f}s")
+    stalls = report.get('stalls', [])
+    lines += ["", f"Main-thread stalls: {len(stalls)} recorded"]
+    for stall in stalls[-recent_stalls:]:
+        lines.append(f"  {time.strftime('%H:%M:%S', time.localtime(stall['time']))}  {stall['ms']:.0f} ms")
+    return "\n".join(lines)
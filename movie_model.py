@@ -0,0 +1,81 @@
+import json
+
+
+class MovieRecord:
+    """One results row. Display columns are plain slots; the full list payload is kept as compact JSON bytes."""
+
+    __slots__ = ('id', 'title', 'year', 'rating', 'genres', '_payload')
+
+    def __init__(self, movie):
+        self.id = movie['id']
+        self.title = movie.get('title', 'Unknown')
+        self.year = movie.get('year', 'N/A')
+        self.rating = movie.get('rating', 0)
+        self.genres = ', '.join((movie.get('genres') or ['N/A'])[:2])
+        self._payload = json.dumps(movie, separators=(',', ':')).encode('utf-8')
+
+    def values(self):
+        """Treeview column values, in the same order as the center panel columns."""
+        return (self.title, self.year, self.rating, self.genres)
+
+    def payload(self):
+        return json.loads(self._payload)
+
+
+class MovieModel:
+    """
+    Compact backing store for the virtualized results list.
+
+    Rows are MovieRecord objects in display order plus an id -> row index, so a
+    10,000+ row result set costs a few hundred bytes per movie and no Tk items;
+    the view materializes only the rows currently in its viewport.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.index = {}
+        self.total = 0
+        self.pages_loaded = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def clear(self):
+        self.records = []
+        self.index = {}
+        self.total = 0
+        self.pages_loaded = 0
+
+    @property
+    def has_more(self):
+        return len(self.records) < self.total
+
+    def append_page(self, movies, total):
+        self.total = total
+        self.pages_loaded += 1
+        for movie in movies:
+            if movie.get('id') is None or movie['id'] in self.index:
+                continue
+            self.index[movie['id']] = len(self.records)
+            self.records.append(MovieRecord(movie))
+        if not movies:
+            # The server ran out early; stop asking for more pages.
+            self.total = len(self.records)
+
+    def window(self, start, count):
+        return self.records[start:start + count]
+
+    def row_of(self, movie_id):
+        return self.index.get(movie_id)
+
+    def ids(self):
+        return [r.id for r in self.records]
+
+    def payload(self, movie_id):
+        row = self.index.get(movie_id)
+        return self.records[row].payload() if row is not None else None
+
+    def reorder(self, ids):
+        """Puts the rows in the order of `ids` (e.g. from MovieTable.select) and rebuilds the id index."""
+        self.records = [self.records[self.index[i]] for i in ids if i in self.index]
+        self.index = {r.id: i for i, r in enumerate(self.records)}
@@ -0,0 +1,216 @@
+np = None
+_numpy_checked = False
+
+
+def _numpy():
+    """Imports NumPy on first use (~70 ms, so not at startup). Returns None if it is not installed."""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as module
+            np = module
+        except ImportError:  # pure-Python fallback, same results, just slower on large sets
+            np = None
+        _numpy_checked = True
+    return np
+
+
+# --- Column Layout ---
+NUMERIC_COLUMNS = ('year', 'rating', 'runtime', 'seeds', 'peers', 'download_count', 'like_count', 'date_added')
+TEXT_COLUMNS = ('title', 'genre')   # sorted via precomputed ranks, so every sort key is numeric
+MASK_COLUMNS = ('genre_mask', 'quality_mask')
+INT64_MASK_BITS = 63                 # distinct genres/qualities that fit a signed int64 bitmask
+
+# list_movies sort_by values -> table column
+SORT_BY_COLUMNS = {
+    'date_added': 'date_added',
+    'like_count': 'like_count',
+    'download_count': 'download_count',
+    'peers': 'peers',
+    'seeds': 'seeds',
+    'rating': 'rating',
+    'year': 'year',
+    'title': 'title',
+}
+
+
+def _numeric_row(movie):
+    torrents = movie.get('torrents') or []
+    return (
+        int(movie.get('year') or 0),
+        float(movie.get('rating') or 0.0),
+        int(movie.get('runtime') or 0),
+        max((t.get('seeds') or 0 for t in torrents), default=0),
+        max((t.get('peers') or 0 for t in torrents), default=0),
+        int(movie.get('download_count') or 0),
+        int(movie.get('like_count') or 0),
+        int(movie.get('date_uploaded_unix') or 0),
+    )
+
+
+def _ranks(values):
+    """Dense sort rank of each value, so text columns can be sorted (and negated) like numbers."""
+    ranks = [0] * len(values)
+    rank = -1
+    previous = object()
+    for i in sorted(range(len(values)), key=values.__getitem__):
+        if values[i] != previous:
+            rank += 1
+            previous = values[i]
+        ranks[i] = rank
+    return ranks
+
+
+class MovieTable:
+    """
+    Columnar, in-memory view of a movie set for fast client-side filtering and sorting.
+
+    Numeric fields are stored one array per column, genres and torrent qualities as bitmasks,
+    and title/genre text as sort ranks. `select()` applies compound filters (all given genres,
+    a quality, minimum rating/seeds, a year range) and a multi-key sort in one vectorized pass
+    and returns the matching movie ids in display order. Without NumPy the same API runs on
+    plain lists.
+    """
+
+    def __init__(self, movies=()):
+        self.ids = []
+        self._id_set = set()
+        self._numeric = []
+        self._genre_masks = []
+        self._quality_masks = []
+        self._titles = []
+        self._genre_text = []
+        self.genre_bits = {}
+        self.quality_bits = {}
+        self._columns = None
+        self.append(movies)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _bit(self, table, name):
+        bit = table.get(name)
+        if bit is None:
+            bit = table[name] = 1 << len(table)
+        return bit
+
+    def append(self, movies):
+        """Adds movies not seen yet; columns are rebuilt lazily on the next select()."""
+        for movie in movies:
+            movie_id = movie.get('id')
+            if movie_id is None or movie_id in self._id_set:
+                continue
+            self._id_set.add(movie_id)
+            self.ids.append(movie_id)
+            self._numeric.append(_numeric_row(movie))
+            genre_mask = 0
+            for genre in movie.get('genres') or []:
+                genre_mask |= self._bit(self.genre_bits, genre)
+            quality_mask = 0
+            for torrent in movie.get('torrents') or []:
+                quality_mask |= self._bit(self.quality_bits, torrent.get('quality', ''))
+            self._genre_masks.append(genre_mask)
+            self._quality_masks.append(quality_mask)
+            self._titles.append(str(movie.get('title_english') or movie.get('title') or '').lower())
+            self._genre_text.append(', '.join((movie.get('genres') or ['N/A'])[:2]).lower())
+            self._columns = None
+
+    def _build(self):
+        columns = {name: [row[i] for row in self._numeric] for i, name in enumerate(NUMERIC_COLUMNS)}
+        columns['title'] = _ranks(self._titles)
+        columns['genre'] = _ranks(self._genre_text)
+        columns['genre_mask'] = self._genre_masks
+        columns['quality_mask'] = self._quality_masks
+        columns['id'] = self.ids
+        if _numpy() is not None:
+            # Past 63 distinct genres/qualities the masks no longer fit int64; they then stay Python
+            # ints in an object array, which is slower to filter but still exact.
+            wide = max(len(self.genre_bits), len(self.quality_bits)) > INT64_MASK_BITS
+            columns = {name: np.asarray(values, dtype=self._dtype(name, wide)) for name, values in columns.items()}
+        self._columns = columns
+        return columns
+
+    @staticmethod
+    def _dtype(name, wide_masks):
+        if name == 'rating':
+            return np.float64
+        if name in MASK_COLUMNS and wide_masks:
+            return object
+        return np.int64
+
+    def select(self, genres=(), quality=None, min_rating=None, min_seeds=None,
+               min_year=None, max_year=None, sort_keys=()):
+        """
+        Returns the ids of movies matching every given filter, ordered by `sort_keys`,
+        a list of (column, descending) pairs, most significant first. Ties keep insertion order.
+        """
+        columns = self._columns or self._build()
+        genre_bits = 0
+        for genre in genres or ():
+            if genre not in self.genre_bits:
+                return []
+            genre_bits |= self.genre_bits[genre]
+        quality_bit = 0
+        if quality:
+            if quality not in self.quality_bits:
+                return []
+            quality_bit = self.quality_bits[quality]
+
+        if _numpy() is not None:
+            return self._select_numpy(columns, genre_bits, quality_bit, min_rating, min_seeds, min_year, max_year, sort_keys)
+        return self._select_python(columns, genre_bits, quality_bit, min_rating, min_seeds, min_year, max_year, sort_keys)
+
+    @staticmethod
+    def _select_numpy(columns, genre_bits, quality_bit, min_rating, min_seeds, min_year, max_year, sort_keys):
+        mask = np.ones(len(columns['id']), dtype=bool)
+        if genre_bits:
+            mask &= (columns['genre_mask'] & genre_bits) == genre_bits
+        if quality_bit:
+            mask &= (columns['quality_mask'] & quality_bit) != 0
+        if min_rating:
+            mask &= columns['rating'] >= float(min_rating)
+        if min_seeds:
+            mask &= columns['seeds'] >= int(min_seeds)
+        if min_year:
+            mask &= columns['year'] >= int(min_year)
+        if max_year:
+            mask &= columns['year'] <= int(max_year)
+        rows = np.flatnonzero(mask)
+        if sort_keys and len(rows):
+            # lexsort treats its last key as the primary one.
+            keys = [-columns[name][rows] if descending else columns[name][rows] for name, descending in reversed(sort_keys)]
+            rows = rows[np.lexsort(keys)]
+        return columns['id'][rows].tolist()
+
+    @staticmethod
+    def _select_python(columns, genre_bits, quality_bit, min_rating, min_seeds, min_year, max_year, sort_keys):
+        def keep(i):
+            if genre_bits and columns['genre_mask'][i] & genre_bits != genre_bits:
+                return False
+            if quality_bit and not columns['quality_mask'][i] & quality_bit:
+                return False
+            if min_rating and columns['rating'][i] < float(min_rating):
+                return False
+            if min_seeds and columns['seeds'][i] < int(min_seeds):
+                return False
+            if min_year and columns['year'][i] < int(min_year):
+                return False
+            return not (max_year and columns['year'][i] > int(max_year))
+
+        rows = [i for i in range(len(columns['id'])) if keep(i)]
+        if sort_keys:
+            rows.sort(key=lambda i: tuple(-columns[name][i] if descending else columns[name][i] for name, descending in sort_keys))
+        return [columns['id'][i] for i in rows]
+
+    def query(self, params):
+        """Filters and sorts with list_movies params (genre, quality, minimum_rating, sort_by, order_by)."""
+        genre = params.get('genre')
+        quality = params.get('quality')
+        column = SORT_BY_COLUMNS.get(params.get('sort_by'), 'date_added')
+        descending = params.get('order_by', 'desc') != 'asc'
+        return self.select(
+            genres=(genre,) if genre and genre != 'All' else (),
+            quality=quality if quality and quality != 'All' else None,
+            min_rating=params.get('minimum_rating'),
+            sort_keys=((column, descending), ('id', descending)),
+        )
@@ -0,0 +1,160 @@
+import os
+import sqlite3
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# --- Poster Cache Defaults ---
+POSTER_CACHE_DIR = "poster_cache"
+DEFAULT_DISK_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+
+class PosterDiskCache:
+    """
+    Content-addressed on-disk store for raw poster bytes.
+
+    Blobs live under `<root>/blobs/<aa>/<sha256>` and a small SQLite index maps each
+    poster URL to its blob digest. Identical images served from different mirror URLs
+    share one blob. When the index total exceeds `max_bytes`, least-recently-read URLs
+    are dropped and blobs no longer referenced by any URL are deleted.
+    """
+
+    def __init__(self, root=POSTER_CACHE_DIR, max_bytes=DEFAULT_DISK_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(root, "index.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS posters ("
+            " url TEXT PRIMARY KEY, digest TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posters_access ON posters(last_access)")
+        self._conn.commit()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute("SELECT digest FROM posters WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            try:
+                with open(self._blob_path(row[0]), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                self._conn.execute("DELETE FROM posters WHERE url = ?", (url,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE posters SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+            self.hits += 1
+            return data
+
+    def put(self, url, data):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO posters (url, digest, size, last_access) VALUES (?, ?, ?, ?)",
+                (url, digest, len(data), time.time()),
+            )
+            self._evict_locked()
+            self._conn.commit()
+        return digest
+
+    def _evict_locked(self):
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM posters)"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, digest in self._conn.execute("SELECT url, digest FROM posters ORDER BY last_access ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM posters WHERE url = ?", (url,))
+            self.evictions += 1
+            still_used = self._conn.execute("SELECT 1 FROM posters WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+            if still_used is None:
+                try:
+                    total -= os.path.getsize(self._blob_path(digest))
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+
+    def stats(self):
+        with self._lock:
+            entries, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM posters").fetchone()
+        return {'entries': entries, 'bytes': total, 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+class DecodedImageLRU:
+    """
+    In-memory LRU of decoded, already-resized PIL images keyed by (url, target size).
+
+    The budget is in bytes of pixel data (width * height * bands), not in entries,
+    so a handful of huge images cannot crowd out memory the way a count-bounded cache would.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MEMORY_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _image_bytes(image):
+        width, height = image.size
+        return width * height * len(image.getbands())
+
+    def get(self, key):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, image):
+        size = self._image_bytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._items[key] = (image, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._items:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._items),
+                'bytes': self.current_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,101 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# --- Decoder Defaults ---
+DEFAULT_DECODE_WORKERS = 2
+REDUCING_GAP = 3.0     # for non-JPEG sources: integer-reduce first, then LANCZOS the last <=3x
+
+
+def fit_size(width, height, box):
+    """Scales (width, height) to the box height, then shrinks further if a box width (non-zero) is exceeded."""
+    max_w, max_h = box
+    scale = max_h / height
+    if max_w and width * scale > max_w:
+        scale = max_w / width
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def decode_poster(data, box):
+    """
+    Decodes poster bytes straight to roughly the target size and resamples the rest.
+
+    For JPEGs, draft() makes libjpeg decode at 1/2, 1/4 or 1/8 scale (never below the target),
+    so a 2000px cover is never fully decoded just to become a 250px thumbnail.
+    """
+    from PIL import Image   # imported by the first decode, not at app startup
+
+    img = Image.open(io.BytesIO(data))
+    size = fit_size(img.width, img.height, box)
+    if img.format == 'JPEG':
+        img.draft('RGB', size)
+    return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+
+
+class PosterDecoder:
+    """
+    Small worker pool that turns poster bytes into resized PIL images, memoized in a DecodedImageLRU.
+
+    `request(slot, ...)` coalesces per slot (e.g. the details panel): while one decode for the slot
+    runs, newer requests replace each other and only the most recent one is computed and reported.
+    Callbacks run on the worker thread; GUI callers hand the image to Tk via `after()`.
+    """
+
+    def __init__(self, memory_cache, max_workers=DEFAULT_DECODE_WORKERS, metrics=None):
+        self.memory_cache = memory_cache
+        self.metrics = metrics
+        self.decoded = 0
+        self.coalesced = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="poster-decode")
+        self._lock = threading.Lock()
+        self._running = set()
+        self._pending = {}
+
+    def decode(self, url, data, box):
+        """Blocking decode through the memory cache. Safe to call from any worker thread."""
+        key = (url, box)
+        img = self.memory_cache.get(key)
+        if img is None:
+            start = time.perf_counter()
+            img = decode_poster(data, box)
+            if self.metrics:
+                self.metrics.observe('decode', 'poster', time.perf_counter() - start)
+            self.memory_cache.put(key, img)
+            self.decoded += 1
+        return img
+
+    def request(self, slot, url, data, box, callback):
+        """Queues a decode for `slot`; `callback(url, box, image)` gets None as the image if decoding failed."""
+        job = (url, data, box, callback)
+        with self._lock:
+            if slot in self._running:
+                if slot in self._pending:
+                    self.coalesced += 1
+                self._pending[slot] = job
+                return
+            self._running.add(slot)
+        self._executor.submit(self._run, slot, job)
+
+    def _run(self, slot, job):
+        while job is not None:
+            url, data, box, callback = job
+            try:
+                img = self.decode(url, data, box)
+            except Exception as e:
+                print(f"Poster decode failed for {url}: {e}")
+                img = None
+            with self._lock:
+                job = self._pending.pop(slot, None)
+                if job is None:
+                    self._running.discard(slot)
+            if job is None:
+                # Results superseded while decoding are dropped; only the latest request is reported.
+                callback(url, box, img)
+
+    def stats(self):
+        with self._lock:
+            return {'decoded': self.decoded, 'coalesced': self.coalesced, 'running': len(self._running)}
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,208 @@
+import threading
+import time
+from collections import OrderedDict
+
+# --- Prefetch Tuning ---
+PREFETCH_MIN_WINDOW = 1
+PREFETCH_MAX_WINDOW = 8
+PREFETCH_MAX_WORKERS = 4
+PREFETCH_LOOKAHEAD_SECONDS = 1.5   # how far ahead (in browsing time) the window should reach
+PREFETCH_READY_LIMIT = 96          # enriched movies kept in memory
+PREFETCH_READY_TTL = 10 * 60
+SPEED_SMOOTHING = 0.4              # EWMA weight of the newest inter-selection interval
+IDLE_INTERVAL = 2.0                # intervals longer than this count as "not scrolling"
+
+
+class NeighborPrefetcher:
+    """
+    Warms the rows around the current Treeview selection in the background.
+
+    `loader(movie_id)` does the actual work (YTS details, TMDB extras, poster) and returns
+    the enriched movie dict, which is kept in a small in-memory store until the row is
+    selected. The window and the number of concurrent workers grow with browsing speed:
+    a slow reader gets the immediate neighbours, fast arrow-key scrolling gets a wider
+    window biased in the direction of travel.
+    """
+
+    def __init__(self, loader, max_workers=PREFETCH_MAX_WORKERS):
+        self.loader = loader
+        self.max_workers = max_workers
+        self.window = PREFETCH_MIN_WINDOW
+        self.concurrency = 1
+        self.hits = 0
+        self.misses = 0
+        self._pending = []
+        self._in_progress = set()
+        self._ready = OrderedDict()
+        self._active = 0
+        self._avg_interval = IDLE_INTERVAL
+        self._last_select_time = None
+        self._last_index = None
+        self._direction = 1
+        self._cond = threading.Condition()
+        for _ in range(max_workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+
+    def _update_speed(self, index):
+        now = time.monotonic()
+        if self._last_select_time is not None:
+            interval = min(now - self._last_select_time, IDLE_INTERVAL)
+            self._avg_interval = SPEED_SMOOTHING * interval + (1 - SPEED_SMOOTHING) * self._avg_interval
+        if self._last_index is not None and index != self._last_index:
+            self._direction = 1 if index > self._last_index else -1
+        self._last_select_time = now
+        self._last_index = index
+
+        window = int(PREFETCH_LOOKAHEAD_SECONDS / max(self._avg_interval, 0.05))
+        self.window = max(PREFETCH_MIN_WINDOW, min(PREFETCH_MAX_WINDOW, window))
+        self.concurrency = max(1, min(self.max_workers, (self.window + 1) // 2))
+
+    def on_selection(self, ordered_ids, index):
+        """Re-targets the prefetch queue around `ordered_ids[index]`. Call from the UI thread."""
+        self._update_speed(index)
+        ahead = self.window
+        behind = max(PREFETCH_MIN_WINDOW, self.window // 3)
+        if self._direction < 0:
+            ahead, behind = behind, ahead
+
+        # Interleave forward and backward neighbours, nearest first.
+        targets = []
+        for distance in range(1, max(ahead, behind) + 1):
+            if distance <= ahead and index + distance < len(ordered_ids):
+                targets.append(ordered_ids[index + distance])
+            if distance <= behind and index - distance >= 0:
+                targets.append(ordered_ids[index - distance])
+
+        with self._cond:
+            self._pending = [mid for mid in targets if mid not in self._in_progress and not self._is_ready(mid)]
+            self._cond.notify_all()
+
+    def _is_ready(self, movie_id):
+        entry = self._ready.get(movie_id)
+        return entry is not None and (time.monotonic() - entry[1]) < PREFETCH_READY_TTL
+
+    def take(self, movie_id):
+        """Returns the prefetched movie dict for `movie_id`, or None if it is not warm yet."""
+        with self._cond:
+            if self._is_ready(movie_id):
+                self.hits += 1
+                self._ready.move_to_end(movie_id)
+                return self._ready[movie_id][0]
+            self.misses += 1
+            return None
+
+    def store(self, movie_id, movie):
+        with self._cond:
+            self._ready[movie_id] = (movie, time.monotonic())
+            self._ready.move_to_end(movie_id)
+            while len(self._ready) > PREFETCH_READY_LIMIT:
+                self._ready.popitem(last=False)
+
+    def clear(self):
+        with self._cond:
+            self._pending = []
+            self._ready.clear()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._pending or self._active >= self.concurrency:
+                    self._cond.wait()
+                movie_id = self._pending.pop(0)
+                self._in_progress.add(movie_id)
+                self._active += 1
+            try:
+                movie = self.loader(movie_id)
+                if movie:
+                    self.store(movie_id, movie)
+            except Exception as e:
+                print(f"Prefetch of movie {movie_id} failed: {e}")
+            finally:
+                with self._cond:
+                    self._in_progress.discard(movie_id)
+                    self._active -= 1
+                    self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                'window': self.window,
+                'concurrency': self.concurrency,
+                'pending': len(self._pending),
+                'in_progress': len(self._in_progress),
+                'ready': len(self._ready),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+# --- Page History Tuning ---
+PAGE_HISTORY_LIMIT = 12
+
+
+class PageHistory:
+    """
+    Bounded in-memory store of result pages keyed by (filter set, page number).
+
+    Pages the user has actually seen are kept as history; pages fetched ahead of time
+    are marked speculative and dropped by `invalidate_speculative()` whenever a filter
+    changes. A generation counter makes sure a speculative fetch that was started
+    before the invalidation cannot re-insert its page afterwards.
+    """
+
+    def __init__(self, limit=PAGE_HISTORY_LIMIT):
+        self.limit = limit
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._pages = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def filters_key(params):
+        return tuple(sorted((k, str(v)) for k, v in params.items() if k != 'page'))
+
+    def get(self, params, page):
+        key = (self.filters_key(params), page)
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return entry['data']
+
+    def contains(self, params, page):
+        with self._lock:
+            return (self.filters_key(params), page) in self._pages
+
+    def put(self, params, page, data, speculative=False, generation=None):
+        key = (self.filters_key(params), page)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            existing = self._pages.get(key)
+            if speculative and existing is not None and not existing['speculative']:
+                return
+            self._pages[key] = {'data': data, 'speculative': speculative}
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.limit:
+                self._pages.popitem(last=False)
+
+    def mark_seen(self, params, page):
+        with self._lock:
+            entry = self._pages.get((self.filters_key(params), page))
+            if entry is not None:
+                entry['speculative'] = False
+
+    def invalidate_speculative(self):
+        with self._lock:
+            self.generation += 1
+            for key in [k for k, v in self._pages.items() if v['speculative']]:
+                del self._pages[key]
+
+    def stats(self):
+        with self._lock:
+            speculative = sum(1 for v in self._pages.values() if v['speculative'])
+            return {'pages': len(self._pages), 'speculative': speculative, 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,161 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from concurrency import WAIT_POLL_SECONDS
+
+# --- Rate Limit Defaults (overridable in the [Network] section of config.ini) ---
+DEFAULT_RATE_PER_HOST = 10.0      # sustained requests per second to one host
+DEFAULT_BURST = 20                # requests that may go out back to back after an idle spell
+DEFAULT_MAX_RETRY_WAIT = 10.0     # longer Retry-After values are not waited out inside a request
+THROTTLE_STATUSES = (429, 503)
+MAX_THROTTLE_RETRIES = 2
+
+# --- AIMD Tuning ---
+MIN_CONCURRENCY = 1
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 1.0           # one multiplicative decrease per burst of overload signals
+BACKOFF_BASE = 0.5                # seconds; doubled per consecutive overload without Retry-After
+BACKOFF_MAX = 60.0
+
+
+class ThrottledError(ConnectionError):
+    """The server asked us to slow down (429/503). The host is fine; retry after `retry_after` seconds."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None if absent/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """
+    Admission control for one host: a token bucket caps the request rate, and an AIMD window caps
+    requests in flight. Every successful response widens the window by 1/window (about +1 per
+    window's worth of successes); an overload signal (429/503, timeout) halves it, at most once per
+    DECREASE_COOLDOWN so a burst of concurrent failures counts as one event. A throttling reply
+    also pauses the host until its Retry-After (or an exponential backoff) has passed; callers
+    are not made to wait out a pause longer than `max_wait` and get a ThrottledError instead.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE_PER_HOST, burst=DEFAULT_BURST, max_concurrency=8,
+                 max_wait=DEFAULT_MAX_RETRY_WAIT, host=None):
+        self.host = host
+        self.rate = rate
+        self.max_wait = max_wait
+        self.burst = burst
+        self.max_concurrency = max(MIN_CONCURRENCY, max_concurrency)
+        self.window = max(MIN_CONCURRENCY, self.max_concurrency / 2)
+        self.in_flight = 0
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self.throttled = 0
+        self.decreases = 0
+        self._overloads_in_row = 0
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, token=None):
+        """
+        Blocks until this host may take another request. Raises CancelledError if `token` is
+        cancelled, or ThrottledError right away while the host is paused for longer than `max_wait`.
+        """
+        with self._cond:
+            while True:
+                if token is not None:
+                    token.raise_if_cancelled()
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                    if wait > self.max_wait:
+                        raise ThrottledError(f"{self.host or 'Host'} asked us to back off; retry in {wait:.0f}s.", wait)
+                elif self.in_flight >= int(self.window):
+                    wait = WAIT_POLL_SECONDS
+                elif self.tokens < 1:
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return
+                self._cond.wait(min(wait, WAIT_POLL_SECONDS))
+
+    def release(self, overloaded=False, succeeded=True):
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if overloaded:
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self.window = max(MIN_CONCURRENCY, self.window * DECREASE_FACTOR)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif succeeded:
+                self.window = min(self.max_concurrency, self.window + 1 / self.window)
+                self._overloads_in_row = 0
+            self._cond.notify_all()
+
+    def throttle(self, retry_after=None):
+        """Pauses the host after a 429/503. Returns the pause in seconds."""
+        with self._cond:
+            self.throttled += 1
+            self._overloads_in_row += 1
+            if retry_after is None:
+                retry_after = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self._overloads_in_row - 1))
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            return retry_after
+
+    def retry_in(self):
+        with self._cond:
+            return max(0.0, self.paused_until - time.monotonic())
+
+    def stats(self):
+        with self._cond:
+            self._refill(time.monotonic())
+            return {
+                'window': round(self.window, 2),
+                'in_flight': self.in_flight,
+                'tokens': round(self.tokens, 1),
+                'paused_for': round(max(0.0, self.paused_until - time.monotonic()), 1),
+                'throttled': self.throttled,
+                'decreases': self.decreases,
+            }
+
+
+class RateLimiter:
+    """One HostLimiter per host, created on first use with the shared settings."""
+
+    def __init__(self, rate=DEFAULT_RATE_PER_HOST, burst=DEFAULT_BURST, max_concurrency=8, max_wait=DEFAULT_MAX_RETRY_WAIT):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def for_host(self, host):
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                limiter = self._hosts[host] = HostLimiter(self.rate, self.burst, self.max_concurrency, self.max_wait, host)
+            return limiter
+
+    def stats(self):
+        with self._lock:
+            hosts = list(self._hosts.items())
+        return {host: limiter.stats() for host, limiter in hosts}
@@ -1,7 +1,9 @@
 import base64
+import hashlib
 import io
+import json
+import os
 from tkinter import PhotoImage
-from PIL import Image, ImageTk
 
 ICON_DATA = {
     'app_icon': b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABhWlDQ1BJQ0MgcHJvZmlsZQAAKJF9kb1Lw1AUxU9TRZGKoB1ERDJUJ7uoqGOtQhEqhFqhVQeTl35Bk4YkxcVRcC04+LFYdXBx1tXBVRAEP0D8A8RJ0UVKvC8ptIjxwuP9OO+ew3v3AUK9zDSrIwZoum2mEnExk10Vu14RQD+CmMGIzCxjTpKS8K2ve+qmuovyLP++P6tXzVkMCIjEMWaYNvEG8fSmbXDeJw6zoqwSnxOPm3RB4keuKx6/cS64LPDMsJlOzROHicVCGyttzIqmRjxFHFE1nfKFjMcq5y3OWrnKmvfkLwzl9JVlrtMaRgKLWIIEEQqqKKEMG1HadVIspOg87uMfcv0SuRRylcDIsYAKNMiuH/wPfs/Wyk9OeEmhOND54jgfo0DXLtCoOc73seM0ToDgM3Clt/yVOjD7SXqtpUWOgL5t4OK6pSl7wOUOMPhkyKbsSkFaQj4PvJ/RN2WBgVugZ82bW/Mcpw9AmmaVvAEODoGxAmWv+7y7u31u//Y05/cDreZyvvpcZnIAAAAGYktHRAAPAJoA8tgkgrgAAAAJcEhZcwAACxMAAAsTAQCanBgAAAAHdElNRQfqARIEAwsHjQZ3AAAOdElEQVR42u1aaXBc1ZX+7lvUm1ottVZrV8uy5U3YZYwJGGdC5JkEwjCTKZMBEgheJBMPOCZgy2wzwdhYJraxTcCL7DgMhAxODcVW44k1gAGHMna8sBjHRq1d6kVrq/e3nPnRcj+1umVJDqmpqfRX1VV6793l3O+ec+455wpIIokkkkgiiSSSSCKJJEZj1po99Fe7+Hmb3/yrWDyX6OXUve2nxFTz/7lwJfudtq9rrNIGZ3VZg7Nm9HuWqPHfNzxLb654JPpt+q4vqLDzKUjm6/HB42vZZCe/5bnHyGTqGJ6Rwf5pOf6464m4cb7x4ntUIByKCqVL5xAeIpAycWUkAIE+Dmf1TxzuXGO7o3rzk2SxtiI1lwcnMvgcCjztflws2lVvX5FXJ4weoPrff09tbYHoc9nOC3Rd3mYYZ/QA7F3k7F9Bv1vZMDkSgr3IquqMSMcAnycn8Y7rtiG9JAg2vBDGGGCdnCWGQ+lovXQDUioMjT849ENKLzwJxiQwjoEB0JcRrCWE/PBj62f94kfvx5mAue9FnH3s9ugCr8vajdSsbvAiB14IIsvWiu/95tVJSeV2F4PjAcYzMI7BauPj2lT88iJllAyA41mkHQ8wbrjPBH/gCPauH8GT+Q3caKnbay1ygBfkyJgsQj7jGTiRA6NueNrVWB/wt/VPUsh6Z/R5+v42smR+BjaiFccDmeKhSe2Kq+LeciXsiz6LBjWuzdyM34Lx+lhdniTCXgEdnhJM47bBnN0ZIWUMSNx1OLbzlSMxBOTNGERnmyn6bJBcEPTxgxjShzDtQOeERWxdVWD3u4PRZ0E5i4ptZ6P9Z+w8R5b041GXRERQZYIixf5G+4KRbVSJ4BmcjxBnRP7c/oj5DEORLZCVEshKIRQJIJUw0DYsS/TY++Up4uRnce6xW6M9M1p2gc1KAY1aKi8y8Nzkdsc/mI3U/MhAnBBGmkmJfsvN8kM0yNFDKdBvQddZPUiN9W6ZNjes5cPCMILzy1x4HZor7/VZUDX3I/CiJpwUsuD8l3ehO21RPR/21uQ3bcrIm62guyk1loBMqw+DbeEYoRVVSOxpafIa6k9fDdDzAAN4kYPJJGlHlHEH2LCdkcqhtW8F3nvqu3Gq9/1f/ZyAj4bXH8CfjJtwflPpiHavoPKtnZpoJOHz83fh47Xfv9ym7tJYcUCm7xfocVbEfOyr3ABVCcTb2pCMsIT6yRDQ7xJB6uXd42ByvAwAWLRxNxnT+7QDw5uJ91Z8N6HxGrN1mvorKkLQHx75vWhX8xYx9E70WQ6E0WecN7FAyJLfhv7y2piPXtmwJNBviuvk6zXDXlNQNxkCevtFqKqmmqnGUwCA4qoh4LK9EqHpePrYwvKyptpeGbKCGBl4plZzzKMFORwDD3l8Aqb9vPEUYwLC0MV8bFlV2NjpvhtKmKICSlI+7F33TdpDX/y3JUxRtPM/dQqPeXs/pVT9hxqxbhGtxetqE8YI2y+QEPpA00KfgtaaPPuV5uT1BhQ4nhmfgIKBHZBDPCQZcZMfXXUP++pYPkLBEgS8BTjZugEnHrub4SrQ95UUdViGDANKQ09D0MnD3DI4A8vQurp0X6K+elEFJ2jmKIUz401T5RoVxRwT6JYtbMOCLf9JVyQgo7gXqgKohMZEjf5n00vsvc5N9e87t9aeXVF5VYsHgN72TC32Zgy5MzXbl0MGHLl36ZhjG/SI8e4hS7wWdq0pqwsJt8a8E/QMc2a+jMXr1tCYBKTmpoBUQuv9hWOqlH15bl3zitzo7tz81AZavOPXkzoMnOWPQFX82uQCi55x7acyrthXp2fgUzQCVEpJ2K7zollztpe1xzyEypu/xDcbjlJCAkQTP6mdrHruE7LNP43Kma9Oql+A9OWhgXDc+9CQiGbro1fsy1Mwaj5EgLc3Mfcf1S1nnu7s2HOaAYKeML20ATeue5TiCBAMHBjHUPJiR1z6efPul2jp/ntpyeN3RTumiDJ4UYYgDqL0gLt6whFh7RR70Bu/032+f8KffjLtiqaV3r4JYEKUAW//2Mr32cB6BD1cXLAiCH2ovOkUKredpBgCGMfACww8h5h8+bbtq6hixuvIsnXC9k0nbn9lPwFA7yCPoL8EHpcNLcuzGyelBcZ7YoMtCTjjXDxuP6O5a8SCOHi9ujHbfrp6Lvvi428j5M8CjQpjdakqCqb4YzVACavg9TwEHusvf1i4/W3Kn90EXvCC8Qy8yCEv93XMO3iBmh9dyI71PLPkw6Ht5ZN1hJ5eIWZnXBcy0bJm2riO1ZgjagEeM+Pzp26/Yp8TW9axkxcfgK+/MNYnMIYp2BFLQHhIgaDjkQItYckr9IIf5Wd4QULRwOZIjLAit7F1Za4dAMr3tLw2q/4Ylex3jVvB4biRcstwWjZMiDhjliYMKRMj+9O1N7DjvZsPDzkMMe9Ts92xBPgcYYDTI7tJi26NvoMJB7UW98SmsTuO0eKCJ5beOH8PFpkfbiptcF7RJ5gsWiwAIkhMN7HanaAR53PJE9a4ppX5d1zqWQNV5kYkc1wsAUNdEeeSWagxw/OuhAOmmLUTo2rru3Rt5YswpHZDEHqQltOFmzLWHS3dcSGhhyrY1VKj9/16xNmvIhQYfxFzNxzU0i8G+JzSpMzuxIPVTGWFI8yAQ/7O5i1RAlz+WwBSkV6u2dnIsDU2EdL0r7DEhxR9bzSWZxxDakYrctMTr6qseetejmkOSA2rCIbGDyXS0gIxRUxvv/XPq5CSiq41ZXVRAs7s3nCtEg5BEAdRtekdAgC/aVnicLYtK/q3JfBCXFmVcSKynZsTq7/ZAV7kR5BsREAaPwZJyxk5SRh9OfdPqoo84+l3iakdI04eNT4bHOpm4DhCYVGkdOXoSIUyKmZRJBFtFi1g0ZkSm4nR0hX3bubTR2nIyUM0avan6L6F9ofGPwFM2dyIzVMRNhXEX+JseI0Wpa1vqtp9KkalSvd1V5dnHQcnaIv2dGubGK149A8shqX4E2SKv4rYzUPfY9k7VlHBHCc4NgRVJTic/4Czy68uF8ixeuDO2gjReB8AcbhaM7EIlOekEX5DgaTEl6PyikJIy+rA9VnPofLAj2mgRQKvY7CmbYA5uyeacYMILuEhAG/EakCv7laoMgdzXhALNr5EAPD22j3s0pf/iB57AezHcvHGD2tiFh/yJfYTAW9+vPPsPATiBAg6TXiPQx138QW7WmpE/1sjihwKQhLFZa3WfBmMZxB4JzJLO1C22ImShQ6k5XSA40NaFhnk4e41xWvAidob2Kz/Wkl6oQUz5vwBJ4ffv/vAPWPu+KDhJ8igXTF+gFQJ7qxHAWjFmoWPbCbZNgf67jPA9JTo/cBECEjhycbxHgCRNFcO6yEpLC76NEq/1fwQz8DziXyfCmfb9Tj3wLUMAAq2fv6dGF1yXpwCgGA0t+BvDjaO6547Wk0IBzNxuWpKKsHbVwLHgCFmB23z23FxcDoyAm+DSIhUc8MqPIOp4+s/Y3a/pxyhYDFkpQRB7hZ0/EtxTNZaurermrFIlXisYqUicehpysWbtRuj29W5bvYRNnqgbxfcf1SX6oe/z4APevfW21dOuWLpa+6OYzRvagNEgwxfj4jj3meXtKzIje7QbbsfJFJUvP3T59mt29ZQ7nQv+psl9DcH8f721ybsT2wHnFvAGOzLchLKM/eJl6nY+t/InqGDwLsA+IYPTQZFLUHHGTOO1O1g494N/t2rvydb3jYACvocC/Efd24aV8jyPS2v6Qdbl3qtM8pbV+ZEd+emJzfS1HkncNy1GxdryxgAlB1w1TQvz9lXvLulpu2BSPWnrMFZwzhmi1R7yZYy2LZUCLgBJsCfe81hMAZFpX0jiR0LZQdcNZlNv9ubJn8IPoWDJBnROn1zbfOy7ISVpoSL+/E7a8lo+gykiuhpysAntL18vPrbaCzYd4qqpjwOh+c+vHP3D6Lz2A66tqS3N67PUt6CwSrCkMHBYOXB65h2I6QGAAoDYCDOPFwzIAR6FQT7VQQHFASHFLiu2dqviobGpmU5d1xtTJSQgJkH22hR/moI+iBIIQx05+OMey0urJ03IZW98V930vQFJ6CGBnCst6GWZ2pNyVc/nW+tMMFSJILj+sAwGLm9YYAqEXzOMEgFJJ+C4IAMVVYj9w8KgVSAZAIYgy7DCl1WPnQWDmJaHhj88LQMwPW5D21Vzy8hMPvlJO2qCQCA6gOvU3nRC+BThp2bOwctFxegM++fx/QLZQfdNZXdP9tbOL8fJHvR/gcPTIWzkVnBg0MrOI7F3dfJQQWkAnwKF0lbKepTEfYpCA3ICA3ICA7ICA7K8JvugnfqUoBjUFXA0PkxLENvwpTDI7W4CIpMcH/WB3vWg2h9eDa7agIA4DvP1FLJtS7wohekAqqihyzloPtcAN2h26BwBpjdb0BnCCG9VIS1XATPtYDxgOxXwOs4MMbAOESuuShy70dcNsDMACiyyyoQGlQR9KiASpESlo6BT4n8BD2L5BtEAMkAEyCHCP1NElyOCvRPvRsK8X8EAJnT1ek7Tx/N9ByBIUOHvi4dTu8Z24+Ny9C3dr5EFbMawXNdYBwDKHIro5IFAA9G/QCjyP07HxHyMlngc6HKDD63An+vgkCfgmC/hL6CVfBnz64fedemqmhsWRnr5Er2O20cQzVjsIExMJDN5Di9NK37N0gxKNBbOJjyDTDlZcN9fhB9lwbhnvozfPXwPPZnm0BMEXTvF3SNtR7G9CEwNgTGIplfxGfR8E0tB2J5UJQUDDRLcHRXwVF052FivN2+PLcOf0HYDri2pHSeW5/pOISMadkgVcB5thzNa2ewr4WAy7uR03WkKVd3FKY8AaYcHqRGymkA4DivR5tlNcLG7Pq/9IIngjlrXyDRqMfpTcvY10JA/Hkb+YcjItgvl8iQRBJJJJFEEkkkkUQSSSSRxP8P/C+qwvvgT14AlgAAAABJRU5ErkJggg==',
@@ -11,18 +13,80 @@ ICON_DATA = {
     'prev': b'iVBORw0KGgoAAAANSUhEUgAAAgAAAAIACAYAAAD0eNT6AAAAw3pUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjabVBbDgMhCPznFD2CPFQ8jtu1SW/Q4xcXbHY3nUTAGTMCMD7vFzwmCAUkVy2tlGSQJo26FZoc/YiY5IgLFOyFh59ARrFldkGLZ1z8MoqM3ap8MtJnCNtVaBLf680oPuLZ0WxhD6MWRkwuYBh0HyuVpvU8wjbSFeoHZuDq4y2T+12qbW/PRjLRYORkkVm8AZ6nAHcr0CJyJac7Z3s2eYpObCH/9rQAX9yBWRDxafRQAAABhWlDQ1BJQ0MgcHJvZmlsZQAAeJx9kb1Lw1AUxU9TRZGKoB1EFDJUJ7toEcdahSJUCLVCqw4mL/2CJg1Jiouj4Fpw8GOx6uDirKuDqyAIfoD4B4iToouUeF9SaBHjhcf7cd49h/fuA4RGhWlWVxzQdNtMJxNiNrcq9rwigEEEEcOYzCxjTpJS8K2ve+qmuovyLP++P6tfzVsMCIjEcWaYNvEG8cymbXDeJw6zkqwSnxNPmnRB4keuKx6/cS66LPDMsJlJzxOHicViBysdzEqmRhwjjqiaTvlC1mOV8xZnrVJjrXvyF4by+soy12mNIolFLEGCCAU1lFGBjSjtOikW0nSe8PGPuH6JXAq5ymDkWEAVGmTXD/4Hv2drFaanvKRQAuh+cZyPcaBnF2jWHef72HGaJ0DwGbjS2/5qA5j9JL3e1iJHwMA2cHHd1pQ94HIHGH4yZFN2pSAtoVAA3s/om3LA0C3Qt+bNrXWO0wcgQ7NK3QAHh8BEkbLXfd7d2zm3f3ta8/sBo+xyus0mAzgAAA14aVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/Pgo8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA0LjQuMC1FeGl2MiI+CiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICB4bWxuczp4bXBNTT0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL21tLyIKICAgIHhtbG5zOnN0RXZ0PSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvc1R5cGUvUmVzb3VyY2VFdmVudCMiCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOmY3NTQ0ZjJhLTJmNjAtNDE5Ny1iMjQ4LTY4OWU3NjA4MDVlNCIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDo2MWFjMzM3MS05YzcwLTRhYzMtODBlNi1hNjY2NzM4YWUyNWQiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDo3ZjA5OGQxYy0xZjcxLTRhOWUtODU3MS1hN2RkMDJkNDQ3Y2MiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICBHSU1QOkFQST0iMi4wIgogICBHSU1QOlBsYXRmb3JtPSJMaW51eCIKICAgR0lNUDpUaW1lU3RhbXA9IjE3Njg3MDgzODQ3MzU3NTUiCiAgIEdJTVA6VmVyc2lvbj0iMi4xMC4zNCIKICAgdGlmZjpPcmllbnRhdGlvbj0iMSIKICAgeG1wOkNyZWF0b3JUb29sPSJHSU1QIDIuMTAiCiAgIHhtcDpNZXRhZGF0YURhdGU9IjIwMjY6MDE6MTdUMjA6NTM6MDItMDc6MDAiCiAgIHhtcDpNb2RpZnlEYXRlPSIyMDI2OjAxOjE3VDIwOjUzOjAyLTA3OjAwIj4KICAgPHhtcE1NOkhpc3Rvcnk+CiAgICA8cmRmOlNlcT4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAgIHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6NDY5ZmEwN2YtMzMwNi00YWFkLTgzZDEtYzUxNTQxMzJiNGIxIgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50PSJHaW1wIDIuMTAgKExpbnV4KSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyNi0wMS0xN1QyMDo1MzowNC0wNzowMCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz5hGh6WAAAABmJLR0QADwCaAPLYJIK4AAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH6gESAzUEG2GcFgAAIABJREFUeNrsnXl4XVW5xt9v7TPknJN0binpXCgFKoJQUATEGJAS2kKBlkEEEQFRcLw4D3W8IHpVHJkEmQlzW8KcqAWcAjIYptKJllA6t0nOvPd3/0iBAi2kaYa19n5/z3Oee0Vp1/72t9b7rm8NW0AIsZt69dCB4fAxDFIeDiPDoBgIyCAAgwAMBDAIKpUQVEKDFEQqAFQCiG/5781Wf2IaQPJtf0sBQHar/xwA2ASgBKAdqnmIyQHoALQNwMYt//1GiHb+30DXQmNr4GEtMliDOeLz5RFiL8IQENKP/EmHI8BoeP5oBDIWglFQjIbIGEBHABgOYJiDfVUBrAWwBtA1UHkZgpVQvAKjL8P3VsJgJT4ta5gEhNAAEBI+VAXXYByC8h4QsxuAiYBMBHTL/4+qiEeoHYolEFkM6BIAi4FgCfzYi3gFyzFXAiYRITQAhNhLvXpow+7w/PcBsidU9wZkT0D3RGfJnew4Wai8AKPPA9KCQF+AeP9FBou4vEAIDQAhfc9VWgWv/H6o2Req+0KwH4D3Uej70BgA/wXwFCBPQoKn4MeexlnSxtAQQgNASM9wqSaRKR8IYw4A9AAAh6CzdE/sIgDkP9DgURh5HPAfx7LEC5grZYaGEBoAQt6bG3QwCv4hRvRQhRwKYH8AKQbGSfIAnhDVRwKRR+B7j+Izsp5hIYQGgBDgCt0Fnv8xIzhUIYcBOgVvPTJHwlQlEHlWoAsDxSOA14gzZRXDQmgACIkCV+sgwD/SKI5QwRGAspwfXRTAEwI8FCgeQiz2d5wuHQwLoQEgJBRDvAquLn0ARo4WYBqADwGIMTBkG5Qh+Jcq7gX0XpwRfwIiyrAQGgBCXJrliz/TiE5XxUfReZkOITvKSoE0BIoF8LxGVgcIDQAhNnKVViNWmi0qs7fM8j0GhfQgRQAPKORWJLwGnCprGRJCA0BIf/Gn/EQY73gRzILiQ+DmPdI3BAD+qYo7If4d+FTFYoaE0AAQ0geib0ROV5HZAPZmQEg/owAeU8Gt8Mq347T0SoaE0AAQ0lNcobsgUZotipMAfJgzfWK1GVDcAsRv5RFDQgNASHe4TNNIlk4UwScB1IBr+sQtSgK5KxD/OmxMPoAvSIEhITQAhGx3/qSCa8u1Bnq6AjPQ+a17QlxnrQhuDAJci08lHmc4CA0AIa9zpQ5BonS6KM4BsBcDQkLM8wq5Aoj9GWfIOoaD0ACQSM72Y9cWagPIOQBmAkgyKCRCZCF6fRCYy1kVIDQAJBpcrwNMufApiJwHYE8GhBA8D9U/BLHkNThNNjMchAaAhEz4C3ubQL8IlVMAVDEghLyDDQAuD1Sv4N0ChAaAuI2qxP5cONI38gUBjgaP7xHSFQIV3O9BLy2flryf3yMgNADEHa7WCi9WOl1VzwewDwNCSLf5r4hc4mfjN+FcKTEchAaA2Cr8g4zJfwki5wIYyYAQ0mOsgOAXQTH5J5wlbQwHoQEgdnBt2wiD2JcBOQ/AQAaEkF5jMwSXBV75Fzi18jWGg9AAkP7hz9lRRsz3AJwBHuMjpC/JQvGbIF7+JY0AoQEgfcc1+d1MTL4P1ZMAJBgQQvqNHARXBIH+AqenXmY4CA0A6b0ZvzHfBnAWhZ8QqygBuDqQ4Ef8IiGhASA9x9XtI03M+wGAT1H4CbG8IgC5NPCKP8epA9YyHIQGgHSPGzYONkHF1wE9H0CGASHEGTYD+tOgmPo9Tw0QGgCyAzN+rTCx3BcF5uuADmZACHGWNYB8x08mr8EcKTIchAaAbBtV8a7PfxLAjwCMZUAICQ1LoPoN/5Op23izIKEBIG8hdmPucA1wCYADGQ1CQsujYvTC8qnpvzMUhAYg6lybm+AZvRTAdAaDkMhwnQ98iycGaABIFKnXylgh9x0VfAFAigEhJHLkRfXicjb9M5wrWYaDBoCEndfX+UV/CmAUA0JI5FkOoxf4p2bmMxQ0ACSs3FjY0wv8PwD4KINBCHkbf/PhnYfTks8yFDQAJCxcq5mYyf1UgfMAxBkQQsg2URQEelE5mb4YcyTHgNAAEIfxru84GoLfApjIaBBCushSGFzgn5K5h6GgASCuUd8+0ivJpQBmMxiEkG5yux/gAnwy8ypDQQNAnJj1t58Bkf8DMITRCB1rBbJOVddBsA7AOhFZFyBYKyprIFgnqu1QqIhsBACRIF/UeGc5t1zchFgQID6whDnS3mkWtRKlTXGUjUEsMRAAElJKqZoKAFDVQRCIilRCMVRFhxuYYao6FMBQKIaKyFDFlv/McSVsbIDoV/1TMtfwEiEaAGIrN+TGeQguA3AUg+EkmxVYJsBSgS4LYJZKoEs90aXFhK7Cs5XrMFcCq59grhrs3T40UZSRvpHxqjLBSDBBVSaoYLwoJgAYwFftJA/4xpyLU1LLGAoaAGLRoGsm5T4nwE8BrWJArCYHoAWCp1X1OVGzzIguLZX9ZThjwLpIRKB+05B4KTYhEBmvGkwQyJ4A9gWwN4A0U8Rq2lXkW8GLqd9Zb0YJDUDYSd68cTffj/8Z0EMYDasIADwvwOMKtKjIs77gcZySaWVotmcM1EuU2/f0VQ6QTjMwBcABAHZlcKyjqQzvTHwitZyhoAEg/UD8hvZPqeBXAAYyGv2LCpaaAI8A+ncV78lyruO/OGs4P8PaE1y1piqWyrxP1N8PkIMD0UMEwlMt/c9mEfly6ZTMnxgKGgDSV1zXsWvM6FUQHM1g9AtFiPwb0EdU5VE/pv/GnMpVDEsfckNunAf/cBg9RFQOBTAZgMfA9Iv9vatcxrk4vWo1Y0EDQHoR7/qO6WL0KgAjGI2+Gt+QBfAIRB4FgkfK5cp/4nTpYGAs4lrNxLz2gwBzKEQPAXAogAwD02esUcg5/qmZuxgKGgDS08zXdHxzxx9V8EkGo094HIKHoMGC8q5V/0CNlBkSh7haK7xk9khIMB2KI7hk0EdWWfGbcjHzdZwpeYaDBoD0AInr2/cJjN6Mzo1RpHfYLIL7EeAhz5QfyJ8yeBlDEh4qbtow3g/ix6rodCg+DOFpg17kKWNwSvHkqucYChoAshPEb2g7R4FfcsDqFRYBOg9i7i0PzDyCOikwJBGgXhOxcvuhUD0aIjPQuX+A9Cw5Af6ndGrV7xkKGgCyo9y9piqerbhSgTkMRs+hkKWiuEVE6kunZP7DiJD4ze37quIkhc4RYDdGpEe5o+yVPo05QzYxFDQApAskbmx/fyB6G4BJjEZPiD4WC3C9UdxaPLWqhREh204UldhNbYdAZLYAsxQYw6D0SP97yQQyu/SJyicZDRoA8m6zkZs2n62QSwFUMBo7RSsg1xnV6yj6ZGfMAIATAIxiUHaKrIqc559ceS1DQQNA3k69pjy/7bcCfJrB6DYFUb1Txbuy/EKmiVeVkh5hrprYXu2HS4CzFXo8gCSD0k3BUVxbqmo/DzOqs4wGDQABUFG/cUI5kDugsh+j0S2eFpHflXLlepw5eCPDQXrPqLcNj/n6aSjOhHDzYDdpLiN2PE5Jr2AoaAAiTeyW9iMkCG5G52dUSdfpAHADguDy0icGPc5wkD5FVWL1HbUSBOcAmAEu2e0oq1VlTvnUqr8yFDQA0RT/mzZ/XQQ/Aa8w3ZGUfQLAZaVy8WacNnQz40H6vyqwaUjMl7NFcDp4V8eOUALk/NLJVZczFDQAERowNBUP2q8A9BMMRpcIFJgHg1+U5wx4hOEg1pr6WzYfAuCrojgWgGFEuoLeXMp0nMV9ATQAoSd107oxZYnNA8D1/vcmC8GVRvXSwsmDFjMcxBUSN7ftpQi+ic57PLhp8L35d1xjx2X5uWwagLASr994gAYyT4BqRuNdklLwahDor8ue9yfMqVrDiBBnua5j10TC/6KqfhrAcAbkXXkZCGaWTh78FENBAxCuGcEtm49T1evBL5S9G88BuKg0YMAtvJaXhIr5rel4R+ZsABeAtw2+Gx2C4PTiyYPvYChoAEJB7ObNFwr0InBNcHtp+LTA/0Hx+UF38ew+CTVz1ST2apupqt8HlwG3R6DQb5dPHnQRQ0ED4C5NGouv3nQZILzcZ9vp95QBvluYU7UAIsp4kCgZgfiem0+D4BsA9mJAtskfSzLgfMwRn6GgAXCLu9dUJQrx21TxcQbjHbwoiu8Unx94O2f8JNLUqxfHprOg+CaA8QzI2wRKdEExXzgZp4/sYDRoANzgjrYR8ZK/AMCBDMZbWCyKb1L4CXkbTRqLr9n0aSi+DWAsA7K1SuljpZg3E8cPWMdg0ABYTfLmzXsECO6FYCKj0YkCr4jgh6UNA6/GuVJiRAjZDg2ajLdv/Kyq/I8AoxmQNwaRRV4c0/InDFrCYNAAWEn85o37Q3AfeNznddoV+N9yduD/4UzJMxyEdJGrtSKW2fQlUXwLQBUDAgBYiwBHl04Z1MxQ0ABYRcUtG48IgDsBVDIaCERxpRePz82ekHmV4SCke6RuWjfG97xfQHEix2sAwOZAdGZ5zmB+Q4AGwA4St244HoobwRu/IMCjAeSLpTn8QA8hPUWsft3BBubX4L4iAMiJ6kmFk4bMZyhoAPqV+K0bzhTFFeAHfZZD5MLiiQNv45E+QnoBVYnftvGTovgpgFERj0YJomcWZw+5gYnRfXgxzU6QvGX950VxZcTFPwfFj4v5wpTi7EG3UvwJ6a3pmmhp9uBri6ncHlD8AECUP54Th8p1yVs2fIGJwQpA34v/rRu+qopLIh7DBcbD+fkTBi9nRhDSt6Tq14/1Ib8BMDPaIiZfK8wZdAkzggagT0jUb/gegB9EOASviOp5XIMjxIKp8K0bTofiZwLsEl0lk68XZw/6GbOBBqB3xf/W9RdB5esRfXwV6BWFuHwdswZvZDYQYgk3bh6WiPm/BzA7sjFQ+UbxpEEXMxloAHpL/C8G8LWIOuwXA8HZ5RMG/42ZQIidJOvXHakilwGYEM1xSn9YPHHo95kJXYObALtI/NYNP4+o+PsALi4G7ftR/Amxm8KcoQ8Wtfx+hV4KoBzBKsD3Eret/zEzgRWAHpz5r5sLSBRd5ZMq5uzSibx5ixDnJi23b9xfguBKAB+I3tPrD4qzh85lFtAA7Jz416//NgRRc5Q+oD8uDhvyY9RImVlAiKPUayIu6y8RyAVRG+8FemFh9tCfMwloALo581//dQAXReyxlwaqnyjPGfp3ZgAh4aDi1g0fDUSvhWJMpARO9CuFE4f+khlAA7BDJG9b+3l0nrGV6HQW3JrPe+fiE4M2MAMICRl3bhhU4Qd/VOCkaD24frFw4rBLmQA0AF10y+vOVMFVEYpPm6ien5897Fq+fUJCPr7dvv4cVf05ovOVwUAgZ+RPHHI93z4NwLuSuHXt8SJSj+hc7/uoeOa0/KzBy/j2CYkGydtWTxLxrlfFQRF55DIkOKFwwvB5fPs0ANt2xvUbDlcT3AsgFYHH9UXx4zw3+hESTS7TeMWwdT9Slf+JyIQnLxocnZ89/C98+TQAbyFev+YAY0wjgAGhf1jFa6LmpDy/qU0IqwF3rDsSihuhGBaBx90YGPPR0vGDn+KbpwHo7AD1q3eHMY8BGB6BF94sgTkhN2fIy3zzhBAASN21boz6elsklgRE10JwSOH44S/SAESczN2v7VIuxx4DdGL4Z/5yRSG9/gLUTSpwyCOEvIX6FamEl7pMgE9G4GkXJRKJD7fNGLCWBiCqXLsqU5GJ/UWBqSF/0pwIPps/nrv8CSHvTsXta85RyKUAkqGeDwH/KCaKtZhRnY3qu47utwCaNJbMxG+JgPgvC6CHUvwJIV0hf8Lwy43icAArQz77/VCykLgR9epF9V1H1gAk163/PaDHhPwxH0wkEgeWThj+BIc1QkhXyZ047J+xmD8VQLg3CguOTXrrIntJUCSXAJK3rbkQgp+F/DF/VRgy7EIe8SOEdJt69ZKxtT+D4ithfkyFfKt4wrD/pQEIOYnb1h4norcjvNWPsgg+lz9++BUcvQghPTNpWns+RH+F8N4XEKjI7OLxw+6gAQgp6dvXHhiI/hXhveinTYNgduHEXe7nkEUI6VETcNeaGeLjJggyIS0DdBjVw7InjvgPDUDISN2+brRK8E8A1SF9xJVBEBxTPHGXpzlUEUJ6ZRJ155oDAsV8ALuGdRw1ioOyJwx/NQrvMxqbAOtXpFSCO0Is/i3Q2KEUf0JIb5KdNfxxMeaDAnkmpI84OhDMx/zWNA1ASKiIJ64E9EBAEcLfvXkPB+dPGLycwxMhpLfJHTd0Ra5sDgPwcEjH1AMqSrGraABCQOr2NV+CyqnhfDq9LD94+EwcO7yNwxIhpM+YM2RTfs2wowFcHdInPDl1x2sXhv01hnoPQMUdaz8GBPcDiIXw8X6aP37EtzkSEUL6dZy987UfQuW7IXw0X0XrCrN2eYAGwLWknLdqAnzzbwBDQ/fSBN/IHTfiYg49hBA7JltrvgfRH4Tw0dYC/oH5WbsuC+N7C+cSQP2KlPrmthCKvypwAcWfEGIT+eOH/1BFP4/ORfQwMUzUuxv3rwrl0cdQGoCKWPJSge4fso0pZUBPL8wa8VsON4QQ2ygct8vvofgMoH6Yxl4VfX9FVn4XxncWuiWAijtXfwrQsG1MKQnktNysEfUcZgghdo/Br30SwJ8Qvr1X5+Zn7XI5DYClpO9e/YFA9TEoKkL0hvLqmxMLJwy/h0MLIcSJsfjO144LgJsRrk8K5wKDDxWPDc99K+ExAA3rBlQUys0AJoUo4dqAYGZ+1q5/4ZBCCHGJ5B2vHSmCuwCE6VKdF/LGHBiWo9eh2QNQUSpdAcEkyBZb4/6vQ1TqKP6EEBcpHL/Lg6JyFAQdIRqXJyc1+DNUQzF5DsVDpO987RwVvSxEfSeviun5WSMf5jBCCHGZzN2rpwUa3A0gEZZnEuj52eN2/Z37z+F6ct21ap8A+BcQmnX/goEc23Ecv+hHCAkH6btWzVDgdgDxkDxSzjN6YPvMXVtcfgi3lwDqV6R84MYQiX8ZIqdS/AkhYSJ73Mj5EJwOwA/JI6X8QG5E01KntcdpA5BKxC8W4H0hSahART+TO3aXOzhcEELCRu7YkTcL8FmE57Kg91dsqvilyw/g7BJA+o5V09VgHsJykkHxhdyskb/hMEEICTPpu179nEJ+G5axW1RmZWftchcNQB+Rufu1XQIEzwAYHg7x16/kjqv+JYcGQkgUSM179etQXBSSx1ntxfG+9rpd17jWcCeXAALVP4ZF/EX1pxR/QkiUyM3c9WIR/DAkjzPCL+MqVgD6gIq7Xz1DgGtCMfEXuSw/c+RnORwQQqJI+u7WKxVyVkjG88/kZ450ygg4VQGouKd1nAC/DsXMH/pg/tVdLuAQQAiJKtnChs8BaArDsxjV/6u489XxNAC9wVw1UpbrAAwMQa48nY0nT8S5UuIQQAiJLHOmFJNB/ngFWlx/FAUGiMGfMFed0VVnGpreb9V5gB4Wgs9LvqoxnYm6oZvZ+wkhUWfjrAkbpexPA/SVEIzvNan9Wz/vSuyd2ANQseC1iRL4TwPIOJ7r7SI4PDuj+gl2e0IIeZPMPSv3C3yzEECl44/Sph72yR9TvZwVgJ2uq6hIEFwuQMbx70iUReQkij8hhLyTjmNGPymqnxDAd3ysrzJlOPFtGusNQGbeqtMFWut6cqvql7Mzdm1gNyfkbcxvTWN+a5qBINljR82D4HznH0RwVPruVz5tfzNtFv97Vo9Uv9wCYIjbuYBfdcys/jK7NyHvFP8UsAAAcsB0zKjOMigkNe+VSwTyP44/xgaU4lOyJwx/lRWA7hCULwV0iMubQhTa2FG164Xs0oRsW/xFtUZUa1LAAlYCCADk8tXfAPRBxzcEDka88Fub42ytAUjfvfIYVZ3teB4vi5V1DmqkzC5NyFbUr67MBHqfqNa8/o9EtSalOo8mgGCO+CZmPgHgZbcfRI7P3N06zdrWWdmq+1dl0kW/BcA4h998QRF8JDdjzL/Ymwl5m/inSg0KHLat/1qBh3OQmVwOIOl7Wqci0IVw+pPvuiSb0/dhzpgcKwBdeenF4BuOiz8g8gWKPyE7Jv5bZiW1KbASQIDsMdXNUNc3BcrEVMp8jxWALlC5oHWvQPVJAAl33zeuyk4f9Rl2X0J2TPxZCSDbnBTOb/0DoA5/N0VKRuUD7TN3terGQ+sqAL4GvwM04ezGD0VzNlM8n12WkK2Y35pOpYrzdAdu8xRobQoBNwYSZL2OLwH6D3c3BAZxRfB7qFo16bbKAKQWrJwtQI3DebpGRU5AzYQ8uywhW8384d/Xnb4tQE0KAZcDok7dpIJ6mA1gtauPoKIfySxYeYpVdQmbZghpBM8BGOvo+/VFZFrH9FEPsbcSstXMH8GCnTX2CjTlYHhPQMSpnL/iowHkQQAxRx9hZTYR2xNHjexgBWAr0vC/BsFYZ+9/BP6X4k/I22b+4t8ngpqd7V8iqEkJKwFRp33GmL9A5EcO3xM8Ol0qf5MVgK2ouPfV8Z7vPwsg5WJSiuIf7ZWjDuN5f0I6GV6/ujKbLjQAclgP/9EPd6jhxsBIG0v10ulX/irAIY4+Qd6HPyU/fdwSVgAAeH75Z4CmHN3gsbks/ico/oS8XfzRG5/vrs2Iz0pAlJkjfszXTym03VHNqIiJ+YUNoex3A1A1f/mhANy98U/1SzY4OULsE/9egyYg4mw+dsxLApznrmzguMp5Kw6PtgFQlcASJ9Q95OaOGWOvZnckpM/EnyaAAAA6po+5XoHbnDUBBj/v72OB/WoAKhtemQ3BQY5u5ng5Xiqdx25ICDC8aXVlNlNogOCwPuyDNAERJ47gHAhWOqohUzP3rjy1X6ew/fY3NyxKZrTiOQATHMw736jWtE0fu5BdkFD8V1dms30289/GVAoPd6jHjYERpXL+io+qwcOw/eu22xbgJe0dm/fCnCnFSFUAMkHiPEAnuLmJA5dQ/Al5XfzzDdiBG/56/CfcGBhl2meM+YtAf+ro5+InZjIDvhipCsCgO5cOKiW8xQCGuJdu+mTHLmsOwtSpJXY9Emnmt6YzprQAEEtu79SmjiDOy4KiSHNzPLN6xD+g2N/B1m+Iqe62afq4DZGoAJTj3lfcFH+UAe9Mij/hzH91ZcaU77NH/AFAalgJiChTp5Y00HM6x2jnGFwW87X++Iv73ABU3v/SiAD4spNJpvh1xzGjn2RvI1EX/86yfz+t+b+rB+ByQFTJTh/3OCA/d7P1wecrG14dHnoDoH7ia2JQ6dqOTRUs7tDY99jNCMU/39e7/XfsZ7Q249EERJGODvwQgkXunQiQKtXyd/rcL/flX5ZqWDnawF8EoMK1ub8EWts+fXwTuxiJtvjnOsXfDR7u8OM8HRAxMvctPwIBHoBNH7vrGoXAL++Rm7Hby6GsAHgof0uACtfMmQGupfiTqIt/LptrEMFhDvXd2kqvxEpA1KoA08Y9JIKrHLwaIGlMvE+rzH1mACruWTIOkM84mE+viTFfYbciURd/h2b+W0MTEEE8H18DsMq1dovo6Z1aGTIDEDOxCwHE4d4b+dLmaWPWs0sRir+z0AREjE3Tx22A6vkONj0eE+/bfSZvffGXpOavGOV5wWIASbfEH3e3Hz3uOHYnQvEPBQ+3c09ApMg0LJ8vwHTHml30vdjuuaNGrQhFBSAW878K0SRE4dAvVw78L7ILkUgyvzWdy2fnwehhjvXbd/vVVsaKC1gJiA4BvPNUtMOxPE14fqlP7gXodQNQef9LIxQ418Hc+UX+mInL2YVIFGf+lbHCfQBqQvh4NZWxIpcDIkKubvRKUfmZcw0XnJW5Z+lI5w2AqvcVAK51tpUZU3ERuw+J7MwfcliIn9LwRUeH9nZzCRQvO9bslDFyodMdYfCDiweKinOfzFWRb7121MgOdh3CmX/oaGwvJ/i9gCgxZ0wO0K+51mwFzhrSsGiAswagWPbOAjDAsbg/2nHU2OvZa0jUxD+X72gI+cy/sb2cmEHxj2AV4Ojx9QD+7lizB5Yk9jk3DUB9S0Lcu/M/CIx8ESLKLkMo/hR/EhJENID5IoDArSqAXICGRb12eq7XDEBmQOokiI52afelCG7IHjXucfYWEh3xb6nMFTq23O0fmt3+b/1BKf4E2aPH/ltFr3Esf6urJH6aWwZAVUR6fwNDD7M58N1bJyJk58Q/bedX/XpuCtXYXk5S/MnrM+rvAGhzqs2iX4Fqr9zZ0ysGYOCDS48UxT5u3cMsF3ccM2EVuwiJAtXzW9P5QnqewKm7/Xf01zSA4k+2rgJMG/+qAD9xLI/3HnD/8jpnDEAQ4AtOZYXglbak/h+7B4mK+LfFCwsQ7t3+TVWl5PRWij95G21B+VcCrHCpzYFqr2hqjxuAqnsW7wFInUvB1UB+ipoJeXYNEnaGN7VUtsVDftRP0UjxJ9ulblJBBT92ao4qOGLAA4snWW8A1MPnABVA4chvafvwtVewV5AoiH++kGoA9DCH+ueO/RSNVeXkDIo/edcqwKbsNYAucyi3DQLp8avpe3RjwZCGRQNKnrcSQJVDufCZtqMmXsUuQUIv/sVUuDf8QRqrihR/0jWq7l96BqDXONTkzcl8cfTaY/fssU2MPVoBKHveGY6J/wttmyZcw65AKP4UfxKxKkBi2Q0AFjnU5AHFZPKsnvwDe84AqIoCn3MpAUTxE8wRn12BUPwp/iRi1NSURfT7LjVZRc+x0gBUPrD0MAB7OhTL5zZvnnAjewGh+FP8STTZ/NjEWwBpcajJe1Xet6zHNvD2mAEQ6NkubRZSBD/g7J+EW/wrwr3hD0rxJzvHXAk0CL7nUt4b8XusCtAjmwCrml4YhmJsJYCkI6/9qbaPT/wA7/wn4RZ/hPpu/6piiuJPdh5VqXxgSbMA+zvS4gIS5dFtNZPXWlEBkHLsNAiSrlyrpAY/pPiTMFI9vzWdL1fM67zbH+G84s+gieJPegwRFZEfONQHkijHP9VG5NWCAAAgAElEQVQTj94jBkAVZzv0uhe1PzrxLmY9CaP4t1XkFkBDfMmPoKkqn+IlP6RHaXtswgIAzztUtTi7J74PsNMGYMD9Sz8IYG934oZfYa4ETHkSJoY3tVS2VeTuC7X4A40Uf9IrzJUAIi5dB79H1UNLDtnZPyS28+0onyEQV4K2tqqYvqad6U5CJv6FcrJBVEO75q9AY1UhzbI/6b0qQCZ+/YD2wo8BjHChvaI4A8Aj/VcBaFiUhMjJDg0jv+cAQsIo/lBQ/AnZGT48Jgfgtw71ixPRtLSi3wzAQA8zAAx2wi0BuUDld8xyQvGn+BOyzXyL+38A4EquDRpQCmb1mwFQgzNc2TkZANe2H7X7aqY4CZX4I7y7/dVQ/Enf0lYzeS1ErnGnn+gZ/WIAMg8t2QWQaY681wDGqQ0ehGyXzqN+yXlAqGf+TVU5ij/pB3z9JQBXLok7Iv3A89V9bgC8wD8R0JgjtyfNbztitxeZ2SQMM//2iux9Aq0J6w1/KtpYlU9ztz/pFzZP2/0lBe52pL94MfHm9LkBgMhJzswmJPgF05qEQfw7y/4h3u0vaKzKZTjzJ/2LgUua0W0t7tb5vcEPLh7rI1gGOHH+7z+bj5y0PzOaUPwp/oR0lQEPLWqG4gAXuo4HM37Dkbu93CcVgLIEJzoi/oDgSqYyofhT/AnZMenQK1xpaoDg1O78i6Z7gcFJjuySzHpqbmAqE6fF3082QDS8u/0p/sRCvKLcBEGHE6fcBN26j2eHDcDAh16cCOhBjmyQuHXDkbttYioTF6me35rO+7F5QBDaT/oqgiaKP7GR9XWTNgv0Fhf6kUD3rbr/hT173QAE0FmuvEBVZfmfODvzb0+13yeQ0N7tr5DGqlwVd/sTe3PU4HJX2mo87LA277AB8MTMcuOLoXi27cjJjzCFiYviX/DjDQIcFtYv+gqEZX9iPZs/tsc/BfKMC30KkN41AOn7nt1VVQ92xLtdxfQlLot/eJ9SGjMUf+JKFUCd2Qw4dejDL4zqNQMQj8VmQmAcmF4UfAR/ZuoS58Q/iDeIhPd6XwjFnziGX7oBgpwLZbUSdmwZYEeXAGY5sblI9K62I/Zax8wlbol/rEGgod3wB2hjJkvxJ26xedqU9QK9zY3NgDiuVwzA4AcXD4Toxxx5Z1cwbYkrVM9vTReD2Lxwl/3RlMlWUfyJo4grG8oPH7jw6S5/obfLBiCQ0pEA4g4E4JVNf9ujiQlLXJn5t6fb7gNQE+LHbMxkudufuMvGj01aCMEKB5oa00LyqB43AIA52gmfpno75krAlCUuiH9n2T/UM/9GzvyJ+wUAUaje4khru6zVXTMAqiJQJwyAb1DPbCUUf4o/IT2JqjihLSI4CnO1S9repfv8B/110QfU959w4NmXb6qZPAEiynQlVos/vAbRkIt/R/uM1hlTKf4kNA5gYNMLiwFMcKCpH9xcO/lfPVIB0MCvc+L9QG+n+BOKP8WfkF6YWivEjWUAg6Cua/+7rjy3wonyPwJzM7OU2Er1/OZ0Ed68UIu/oIniT0Kb3ibmxDKAihzdte76HgxpWDTAr/DXAYhZ/syLN31sz92ZooQzf878CektBjY+/xKA3Sxvpi+SHLaxZsLGnaoAaIUeJkDM+rv/FbcxNYmt4l+C12A0zHf7U/xJRKoAgpsc6I8eguJ7Hi1+bwMAv9aFG5ACBNz9T6wVf2i4b/hLU/xJVAyA0Xo3bsQNanfaAEBwhAOf/ntxU+3eTzA1iU1Uz29Ol2DmARriu/3RlO7ooPiTyLDh8L2egcGztvdN7cLNveY9Zi8jAbzP+jeimM+0JLbN/LOVleG+4U/QmG7vmE7xJ1FDFfPs756y17AHnq/utgEoQz6KLt4V0L8vI7iXKUmsnPmHl6Z0G2f+JJqI4j4X2unH8bFuG4BAjAsDWPumtVjIlCSc+XPmT0hfsHFAx2MQbLa+oaof6bYBEASH2r/ZIWjCnClFpiSxQfxLkAYgCO+GP0EjZ/4k8kydWgL0Ies3x4se2i0DMOC+liFwYP1fRFj+JxaJf5gv+RGKPyFvTK5hvfYIsGdV0wvDtvffb/dyHy8hBytgbN8BoEoDQCwQfwm5+EMa05UdM1o/SvEnBABMXB/QsvVb5MRT/1AAd+1QBSDw3r10YIX4Q5/fWLPXMqYiofj3gfhPpfgT8jobDp3yMoBn7G/p9rXcvEvpwPoBTcDZP+k/qpub0yXBvHCLvzZR/AnZrk7avwxgZAcNQHNzXBUH2L7BQcW/jylI+mvmn21PbdntH+Ib/ipz0yn+hGzHHqt/r/U6qbofWloS22r/NvcADOpIvU+ACstj376xo+KvTEHSH+JfFjRIiGf+AjRWVOY48yfkXdg4wjw2eA3aAFRZ3Mzk0DW67zrg312qAEiADzowRD2GukkFpiDpS6qbm9Pl0Jf90UTxJ6QLTJlShOBvtjczEBzU5QqAGky1fW+jQh9j9pG+nvnnOtAACfnMP0PxJ2QHOs2jAI6xu4nmwG39c7OdQcD6CoAXyKPMPNKX4l82CPVuf4o/Id2YjKr9WqTQg7pkAIY98nwVoHtbvrGhHCuW/s7UI31BdXNzumx0y93+od3w10TxJ2THqYxv/DegRcv79+Qh/1g04D0NQOCX9kFXPhPcrzMVeeq1o/btYOqRvpj55zoqQn23vwCNqUyeu/0J6QYrP/zhHID/WN5Mo/nivu9pAFSxrwMxZ/mf9In4l41GoOyf58yfkJ1ABQ4sA2C/9zQAEBcMQEADQCj+FH9CLFFXfdSBDv8Obd/WKYB9bb//35j4I8w40qviH9MGaMjFP03xJ6QniIn3dx+B3bqp+h5LAKoGgn3s3syAZWsP3bOVKUd6V/zDu+FPEFD8CelB1n5k71cBfcnum3P1fWhqim3XAAx79OlJADKW11oWMt1Ib1Dd3Jwux4J5neIf2ql/U0W6SPEnpMe7lvXLABVD4iMmb9cAlH0zxYE48/gf6RXxz+WSC6Dh3e0PQVMqVeBuf0J6Y2qqDmiTH7xF499SDvAM9lK1Pcp4iqlGepLhTS2V+Zw2SJhn/tDGihRn/oT0FsZ4T6oGtjdz7+1WAKDYy/ZRzHjxZ5hqpCfF339jzT/E4s+yPyG9awDKaAFs3wn4Vo1/SwUgEN3L8gMAy9YeumcbU430nPj7nUf9JKQPKWisqKD4E9LbrKmZ0j74b08vEcHuFo8He227AqBqBNjT6nmM4GmmGelx8Q8rFH9C+rbLidqtUYpJqK/33mEABj323BgAaauDq2D5n1D8Kf6E2IrtGlUxfPSUCe8wAAb+ZAeCywoA2Sk6j/qV54VZ/BXaRPEnpD98t7F+k3o58Pd4hwFQxUTrg+uxAkB2buafzyXuE0iYj/o1plIlHvUjpB8wnrFeo0wgu73DAAisNwC5dSufX8QUI90Vf5b9CSG9yZqD914CwOov1argDQOw1SmAYDfLd0I/izlzfKYY6Zb4x8vhFn+gsaKiRPEnpF9NuAR45KlnAHzI3ibqOysAwJv/0E7bolz/JxR/ij8hlpsAu7VKVSZuwwCI1UsAKvIcM4vsCNXNzelyPOwb/tBE8SfEpk5pnre8gROgKm8YgKqm5mEAqqw2VYKlzCyyI+Kfy8cXCMJ7t78CTakKbvgjxCqtCqzXqtSwhY+PfMMAeAlvtO1BNWqWMbVIVxje1FKZz8fvC7P4A2ik+BNiH74Y6yerGouNAbZsAowFMlrF7q8AFeJZVgBIl8Tfj5caJORr/smKMsv+hNhYAUjll0k+ZncjA4wG8C8DAGpkDASw+Le57YMfXMfUIu8p/olSg8iWu/3D+aP4E2IxG6ZO3QTBBrvHERkNvLEJMLB6CUBUlzGtSJfEP+wz/yTFnxAHsLxiraO2MgAyxuqmOrCmQij+FH9CSKekwu5Jq76lAgDLKwA8AUC2TXVzczpIlOaFXPybKP6EOKT/arcBUOms+m/ZqaAjbG5sYLgEQLY9888XCg0CDbH4a2MyGVD8CXGp1yqWwuKN9QIZ8aYBEFhtAGx3U6R/xN9PFhoEEm7xT1D8CXGuAiC6VK2+Wr9z0m9QX+8BGGp1BcALuARA3qC6uTkdVBTnhVr8BU0Uf0LcxIdZbnkTB6O5OW52GTV5KN5yJbB9JIvyKlOKvD7zzxfNfdAwX/Kjjcm4z0t+CHHVAEis1fYpxrC8GW6KsLv8DyBYteql9UwpwrI/IcQFNh+890YAVn+9VkRGxAzKI2D3d4A38DPApLq5OV0o5eeJymGAhvMhRZuScaX4E+J8X5YAjz2xHsBwW5vow4wwChlseSg5++fMf0vZX0J9t38yriz7ExIerL691iAYEvMEg2zerSiCtcyjaIu/JgsNRkJ8zl/RmGDZn5CQFQFkrdXVSsEgowaDrB4bVfgNgIiLPyj+hBDn+rZarV0KDDQIMNDuRgasAFD8Kf6EEMdKAHZXr41gYEwlGCQWbwIUsAIQTfHPR0D8ueGPkBCXAOzWLsVAIyqWLwEENAAUf4o/IcSxbg7LlwBkkIHYvQQggjVMpWhQ3dyc1or8vFCLP9BE8Sck/BgVy5evdUBMRFJq8U5FFS4BREX8i2VZAAnzDX9oSsR41I+QKBAYWSc2nwJQpIxCU1Z7FA3amUrhZnhTS2WxLPcBoRb/Roo/IZEqAVitXSJIxwBNWx3DQIvMpHCLv6ZyDUCoy/6NiRhY9ickSvofBAWb7yxVIG0AWF0BCIxXYCpR/Cn+hBCXCOyfvKaMWm4AjLICQPGn+BNC3MLzrJ+8powAVi8BBF7ACkDIqG5uTmsqNy/k4t9E8SckuvgOVABiRhCzeZ3CK3MJIGwz/5Kfa5AQH/UToDHmUfwJiXQFIK5Ftfs7tvGYQj2bW1hOgEsAIRJ/pDsaAAmx+GtjzDMUf0IiTrlcLnhitbx6BoDVLYyXy6wAUPwp/oQQp4j7Kdsnr54BELO5hYVSmhUAij/FnxDiFMVkyerJq7hQAcikiqwAUPwp/oQQp8gUi1ZPXtUFA9C6ZAkNAMWf4k8IcYqVK1faXr02MYjyTZHeYQSAji1eM6QEYX44QshOzhDsHh4MAKsPKlRPnJhkFrnJmilT2pHJ1AFYGN4KAGqLQTCvurk5zTdOCHmd0aNHJ2yfv1hvADpyORoAmgCaAEKIU3QkElYbAAF8A9WyzY1MxuMJphJNAE0AIcQlEoWC1ZNXBXwDEasrAKVYjBUAmgCaAEKIU5Q8z+7Jq6pvBOp37mOy8xeTIisAoTIBHXWALrQ553bmJ9DaYuDTBBASceKel7B6vBL4BkBZBLD15/msAITLBNS0x403DYImm/NuZ35GUFtSfwFNACHRxZhy0vKxqmRgYPX55bLxaQBCRuvUqVmkszOhoV4OqCkrKwGERBW/bKyuXiuQM6rI2dxIT4RLACGtBGgmWxdmEwCgliaAkKhWAIzVk1cBckYgVhsA3zesANAE0AQQQtyqAIhv9+RVkDNAkLV5o4KRgBWASJiA8G4MBLS2rCWaAEKiVAEQsXsToGrWAHYvAUAkw1QKvwmImdg0BZrC+5RSW9IyNwYSEhWCoNLuBmrWwCAHAWz9CYJhzKTw0zp1ajYusekqaLI5H3cqlwU1JdAEEBIJ/YcMs3k8UkHOIMBm64NIImMCkMrNBMJ+OoDLAYSEHTEy1O6xSNqMGN1o+YA5lKkUHdZMqWnXVC7UNwZChHsCCAm7AVDbtUs3mUCx0eqb1VRpACJrAoLwbgwU0AQQEmICBEMtv7V0oxHIJruDCC4BRNYEFLZcGxzWKQJNACHh7d52L18HMJuMwPIlAMMlAJoAmgBCiHM1AMv3AOgmI9BNVt+rrqwA0AQU6iC6MKzfDhCDWl9oAggJlbcXGWb3uKMbjYq3zuYgqrACQBNQ0x7TxDSE+p4A1PpS4hFBQsKD1ZNXDcw6A/XXWL5hajBUDXMp2rROnZoNKvIzFaG+MbDGlyIrAYS4jqoBdIjN400MutZo2ay2PJSm+vHHhzCjyJopNe1aUahThPvbATQBhLjN2GceGQjAs7mNEpfVZnUutw5AYHNDfRR3ZUqR101A53KAcDmAEGIlxUCqba9RDIpVrTaoqSkDut7uGoBMYEqR13lzOSDMlQAuBxDiLGUZb3kLN7VMmVLsXFsXWW33PepKA0DeUQnQikKdChaG9dsBENT6hiaAEOcQmWD3d0l0NQC8vrlutd2bo4LxzCiyLRMQCxLToNoU5k8J+1LgcgAhThkAHW/zuBIAq940AKIrrQ6mcgmAbJvO5YBiuJcDBDW+KbASQIg7WD1pFeCVNw2Aygq7Y8klAPLulQBNFsN/OoAmgBAnCACrNUtVVr5hAMT2CgBkHFOK0ATQBBDiAmJ7BcBsVQFQ1ZWWb4YaOLrlMd4FQLpuAsK8MTBGE0CIrQxubh4IwRCbxxFVfbMC4BmzQjo/D2jtz8/7XAYgXTYBorrQ9pzu9k+1NqAJIMRK4iY33voxxAveNABBUF5pfVTFjGdqka6aABNUhPvbAaq1gZfn6QBCbJMqB7TK9zv3/RkAWLX/R9YAaLd6vONdAGQHaJ06NWv8iukI9weEamgCCLELY/+m9dzaDxzy6hsGAAAEWGy3q8KeTC2yoybAT5RmQkO9MbCGywGE2DRZxWTLW7gMIvoWAxAAS6xusuL9TC2yo6yZUtPuJ0t1oTYB3BNAiD2TVVXLtcq8MdnfqgIQLIYoLP7tzc8Ck50yAaILLc/x7v8Q1AaxHE0AIf1rxkUF+9g8VgiCdxoAGLsrAAAyo556ZHdmGOm2CYiX6xDyewJoAgjpP3Z55pEJAKpsbmOwlda/WQFQ6w0AfFEuA5CdMgGmnAr36YBOE8CNgYT0AybAvra3UQJ9ZwVA1X/B+uiq2YcpRnaG1qlTs368PDPklYAaVgII6QeJglqvUT70xXcYgFX7ffRlAFnLg8sKAOmRSgCXAwghPS9SYrsByK9Z9No7lwAgEgBidRVAwJMAhCaAJoAQa0XKdo16CXPm+O80AABE9DnLdzuPH97SVMksIz1qAgThPR0gWhvEszQBhPQyuzx1fwaiu1s+Hjy3dZvfeqxOgucsj7ERX7gPgPSsCYiV6wAJdyWAJoCQ3p38a2rKOzTVvgrFuxgAleds/xiaF5h9mWqkp02AKaWmGUhTeD8iiFrEeTqAkF7TViP72T4OmECf3a4BEPFb7I8yPsxUIz1N69SpWZRS0wUS2iOCCq2hCSCktyoAar02+RK0bNcAtD6/ZhGAnOXPcAhTjfSWCSjFyjPDvByg0BouBxDSG33L+slp/rX1eP6t8+m3setTf/0ngINsfopyLNh1zZSaVUw50hsMb2mqjJVNA4DDQjxYPWxKmZmtU6dm+cYJ2ekxY2SsbF61vJlPvLrv4QdstwLQaQnkKdsXM72ydyhTjvQWa6bUtJdjwZbTAQjlhgAR1AaJDlYCCOkB4r73Idv7vAqefHu7zTtnBvqU7cEWUS4DkN43AV4Q6nsCBDQBhPQIar8mGXmntr/DABgjTzoQblYACE0ATQAhVhCI/XvTAjXvbQCKMfM0gMDyZ9lvl6fuzzDtSF+YAClmpomG9wNCnUcEO3g6gJBuMPqxx1ICHGC7/hdTif+8pwFYu+ehbYA+Bygs/sWAig8y9Uhf0Hk6IJgJ6ELL+0W3fypaw0oAId1Q1nThAEATlvfxResnfWjzexoAdP7P/2X9rIX7AEgfVwLKnoZ8OUC5HEDIjmKM/Vqk29Z0sx1x/Zf9u5iFBoD0uQmQYuU0ETSF93SA1iLZzuUAQrrsnPVQ608AePLPLhsAqP7b/qjrIbsvakgy+0hf0jp1arZkdCYEIb4sCDVBBSsBhLwnzc1xBT5ifZ8Wv7nLBmCIt8szAuQtNzWV2Xz6I8xA0h+VgLJonQgWhvXbAUa1FjQBhLwrIxObPyzAAMv7c6EqkX+yywagZcqUIoAn7N+4hGlMQdJfJgD5tmmANoV1YyA0qEWybUF183yaAEK2JaBGjrZeJ4GnXppUV+iyAeisGeAR24MvqkczBUl/0Tp1RrZkEOrlAAA1qKicRxNAyLZ0UuzXIA0e3a6B2a64irowqO1V/cxfxzALSX9WAkqCulCbAEUtTQAhb2X0kw+PAnQf6xsqZuGOGwBTeAwCtX7XMoJjmIrEGhMQ1k0BoAkgZGsCz0yDQCzvuyoJ3XEDsHLKtPUQ/Nf+CoxwGYDYYwIQ6uUAmgBC3tAeJ/agvdA6uWbtDhuALY/4iP2blYKaKS31CaYjscsEhHRjILQWFRmaABJpDmhujgv04w7o47vu5Xt3A6BO7AOo2oih/DgQscYEIN8+DZCmED9mLSoqeTqARJbW9KaDAQywvkqh+Fu3DUBJTNMWG2H3Q8JwGYDYMzhMnZEtCWYCEuLlAK1hJYBEFeOLE0fQPR+N3TYAa6bUrBJFiwOD0QymJGElgJUAQvpEcQQzHWjm8yv3q32l2wYAACDykAM7lCeP+m/jvkxLYmUlQCS8pwNEa5BiJYBEh5EtjVMgmOKALja+ZyXjva2O/7ATm5MkOImpSWysBJSAujB/ShjQWqTSNAEkEhhgjhOf+FY8vNMGIFdR/JsAZfvNjsxmahJ7TYCpMwjvtwMEqBWaABIBBHqSA/3RT5Zl5ysA6yfVbYZs+1vClrH7mGeapjI9ia0mIMhlpwEI9Z4ASaW5J4CEli1LzZMdaOoTyz5Qs3GnDcAW7nXh5ajx5zBFia20Tp2RLcLMlHBfFlTDSgAJ8fR/jhvNlC5pdpcMgAINThgAyGyoCrOU2FwJKMDUhdwEcDmAhA9VAfRkJ5oqXTMA0tUHr37u4VYBRjrw6Ae/sveR/2C2EpsZ3tJUmRS/QYHDQjxdeliz2ZmtU2dk+caJ6+z6XOMBRoNmB6b/q1/Z85FdIXODHqkAQERF9F5H3hNPAxA3KgHqhbwSoLWSZiWAhANPAzeWmFXv74r4d90AAEBgHDEAcjyXAQhNAE0AIT0oqqKAI+X/rmt1lw1AvGgeBFBy4PnHjnrh4Y8yY4krJiDI5qZBw3w6QGslleLpAOIs1c8+dAiAsQ40tWyC0v09bgC2HCn4ixM1gEDPZsoSV+g8HeCF+3SAoIaVAOJs+oq4oSmKhSunTFvf4wZgy59+pxM3IAGzRj330FCmLXGpEtC5HBDmGwODWklX0AQQpxj79ILBgM52oY8JcNeOPNuOGYB4bD6k82+x/FcB1U8ydYl7JiBWJwYh/nYAaqWSJoC4Qzme/AQEKQf6lmrCu6PXDMArk2pWAnDiiJ2KfoapS5w0AX6sTiTEywFKE0DcQYBz3GinPLFFo3upAgBABHe6MNEwkCnVzz38YaYvcdkEhPcjgqg1NAHEcka/8PBBAuzjRJ8SvWtHn2+HDQB8/053nBs3AxJ3TUDQng/3twMUtSZTwdMBxOIc9c9xpanG4PZuVDe64Yqee6AZwAEOxKQjkZBRS3Y7chMzmbjI8JamyqRXboBqeG8MFDwctBd4YyCxit0XNQzIl2OtADIONPeZlXt9/P29XwEAANFbHKk1ZkolnMpUJi5XAgp+rA4i4d0YCNSayiSXA4hV5MveyRBkXOhDInJLt6oG3fmXYhrcis5zBy7AzYAkHCYAEuoPCNEEEKtw5ew/oGLkpj4zAMv2OnqZAI85ERno/tXPP3AIs5nQBNAEENIVRj330MEApjrS3OaX9zhiSZ8ZAABQ7V7JoT8wiq8ypQlNAE0AIV2b/Adfcaatim5rcbcNQCwo3gpo2YkbyESPHf3sA5OY1iQMJqDzdIA2hffGQK01lQmeDiD9wphFDbsBOsuRvuKr8W7ucwOwbMoxqwA84EwRwOiXmdokDLROnZEt+ImZCPVXBFFjKuOsBJA+RwPviwA8J9oqaFw5ufaVPjcAAKDQP7uy01gEp49uuW8I05uEpRJQ8BN1kDBfGyy1pio+r7qVJoD0DaOee2goFGc5o2uKP+/UzHhn/mXJDJgPwJUz9hnE5AKmOAmVCSgn6sJdCZBa00YTQPoG4/mfhcCVXNuITNUdO/W8O/Mvrxzz4Zxo944f9BOf3X1RQ5JpTmgCaAII2ZrxS5sqVPEFh5p8+8oxH871mwEAgMAr/7nzA4FO/EYWVT7FVCdhNAECXehQX9zBH2gCSK/iF4qnCnSEQ/3izzv7zDttAF6ZVPcPBZ535i2rfBk61zDdSdhMgF9VmiYh/naAALWxtvgCmgDS87qgAtGvOtQZFq3Y46hH+t0AdLZFr3DmPQOTx7x48ExmPAkbrdUzsuWq0vQwmwAFamgCSE8zdtEDxwDY251+oFdAZKdv4+0RA1Ayeh0EBXdOBOj3oSpMexJGE5ArJ2eG+XSACmpMO5cDSM/N/hU616E+UAi0fHVPPHqPGIBVk+rWCPQ2h2YR+4196YETmPkkjKyZUtOeLyVDvTFQgFqaANITjHnxgWPhxtdtX0/+u1onz1hrjQHoFNXgcpduG1MNvsu9ACT8JkAXhvXGQIHWmvYYTQDZCeGaayD+j1zKe+MHl/fU4/eYAK6YVLdQgBccevXvH/3SQaewB5Bwm4CKCFQCaAJI9xj70odOBOR9DiX8i8snH91je3x6bgYsooD8waWXb1S+C6332A0ITQBNAIkYTU0xhf7IqTYHuKwnNv/1vAEAEPO8awRocyWWCkwes2jA6ewJhCaAJoBEbPY/unAKFHs41OR2L5H/U49OgnvyD1uy25GbAFzj1q5i/c4Bzc1xdgcSCRNgwns6QIQmgHSNA5qb4wr9vmPfxrhu2YRZG601AABg1PweUHVoU8XE1QNeO4tdgkTCBBQq6iBBeDcGitaado8mgLwrrw187QxAd3Mot9Vo+Te9UDnrecYsamgAcLRD+bDCi6X2WDahJs+uQcJOdev8dKwjtkChNWF9RoE0lTPl6a3VM7J842Rrdl/UkMwDLwgwzqFmP7hiUt3He3zC3hstVYvnUQIAAB6/SURBVNFLHcuJMUE5/yV2DRIFWqtnZMuZ8nSBhPjGQK2JdcR4YyB5BwXBBY6JPwT4TS/9ub3R++aasS8d2ALIng7FeLPnlfZYOvHY19hFSBQY3tJUmUpmG6ByWGgfUvFwudKfyUoAAYDxS+8ZGZTlRQBVDjX7uZd3P3pKT+7+79UKAGRuoGoudiw3BgR+/H/ZRUhUWDOlpj1XSNdBNLyfEhbUxrgngGwhKMsPHRN/QORXvSH+vVcBADClpT7RlswsATDKpfwQlanLJ9X9h12FRK4SAIS3EgB9uJxWVgIizNiXFhwAyL96beLbO7yaUJnw0qS6Qm/84b0WiJYpc4oC/NqxHDEq+mt+KIhEshIQ4nsCAKmNZYWVgKiiKoD82jHxh0J/11vij94OhnjFK+DQxUBbOGzMkoaT2WMITQBNAAnL7P/eEwAc4phraZc4ft+rM97e/MO3XFrwR+eGCcXFHCRIFE1AOR1MA9AU3qeU2ljW8HRAhBi9oj4F0Uuca7iaK18eN32DswYAACTm/RKAa+frx8Q6zNfYdUjUaK2ekc0V0jPDXQmA8k1HBymkvwJgvGPNzknc/Ky3/5JeNwDLx097FcBl7mUNLpy4eP5Ydh/CSkCoaCqngxncDBiR2f8L80eJyDedkx/B1Vu0020DAACBH1wC0QJE4dAv7cP8ml2IRLcS0DETogsd67fv8gsay+mAtwNGCBOTXwGacSxXiyUtXdQn8emLv2Tl5BmvCPAn15JHoceNXXLPHHYjEs1KwJz2XD4bko2B2lhOgTP/CDHupfmzAJzonu7gutbdj1sRGgMAAGK8nwEoOZdFgf5y4uIHB7I7EZoAij9xg7HLFwxWkd852PSy+Phpn1VI+uovWjbh6GUQXO3c6xBU+yj+kl2K0AS4aAIo/pHEx0UAdnVPbuS6l/eYvqTv/r4+ZLeX7hpTltiLACpcG0Uk0I8tmzTjL+xZJKoMb6mvzFSkG9SZGwO1sUTxj97sf/H8WoE82Nf61gMUjMjkpROPWR66CgAALN79uBWK4I8Ofmdc1OCK0SvqU+xeJMqVgI58tk6gCx3osxT/CDJ6RX3KAH8AVBzUmSv7Uvz73AAAgCd6EQQdkC3+zJ3f7l4p9QN2MUITkKsTwUJr+6oBxT+imHLquyqY5KC+ZOHFf9Ln8errv7Dzc7vq6vG6L01YMn9fdjMSeROQy9WJjXsCBI2lJMU/ioxbNn9/UVzoYttF8du+OPff7wYAANQzPwewwcH3FA+Aqw9obo6zu5Gom4BiBaZBLbosSNFE8Y8oTU0xKC4HEHOw9RvLifjF/fEX94sB6LzfWH7iaKp9YM3QV7kUQCJPa/WMbDafm2lFJUDQWEqBl/xElPFjO74LxQGOzv4vXjlm2vr+6Tb9xO6LGpIlr/w83LujGQD8AKZmxcTpC9n1SNQZ3lJfmUklGxTSP6cDBI2lpHDmH1XxXzrvcFU0wrFP/b4+HxapmrxsQk2/fC+n3wL20qS6gii+5WjOeQbBdeOX3jmI3Y9Enc49AYUtpwMo/qTvGLt8weBAcZ2j4g+FfLe/xB/9HbRlE5+4BYL/OLhjExCMU3i/ZxckZCsTINqXpwMo/hFHNLhUBGMc1ZAnXp7w+PX9Gb/+dU0yN1AjFzqcf6eMX3r3GeyGhGwxAdk+qwRQ/CPOuGXzT4XiNIfdy/9A5gb92gQrXuTSu+8AZJajr3GzGvOBl8f13fWNhNjM8Jb6yky6V/cEUPwjzvild45XxJ4E1M3vtAgWLB8/c0Z/N8OKdRM/MF8HtODgzU0AdIAE5evR1BRjtyTk7ZWAXrjhj+IfbbTeUzXXA8FARzWjEBj/SzaE0goDsHK3GYsguMTNZRxAIAePH9/2XfZMQt40AZlsoU6AhT3Y1xpLSUPxjzgTlia/KYJD3NUL/dWKsbMW21GIsIRdVt2fqcjnnxdgtKN56Svk48vHz2xkFyWkk+rW+elEMVgAoGYn/6imYsLwnH/UxX/J3R8JDB4WNy/8AYDWTLowuWXEnHZWALbitZFHdYjK1xzOTU+gN+320l1j2E0J2TLaVc/IZtKFmdCduiyokeJPRq+YP0oN6h0Wf4jIN2wRf6sqAAAAVRn/8ry/QPERuPuG/xUrxj7y0qS6ArssITtdCeDMn2BKS32iI5P4CyAHOysNwKNLx808DCJqS5vsujxBRMXHBQotO7q5A9DgoFK8+Bt2WUK2VQnYkY2BAWf+BACQzST+D8DBzuoCtOSLnGuT+NtnAAAsnXjs0yJ6icvJKsDZE5bf+Ul2W0LepGXEnPZMpljXteUAbSwmYtzwRzB+6V1nKvB5l59BgV+9PG5mi23tsvL6xFwy/RMALzv9wlUuG7/0zv3YfQnZURNA8SedjF1+5wEQuH7j6tJSwptrY8OsNACvjTyqQwTnw91zHoAgBSN3jF5RP4TdmJBtmADBNq4NpviTTvZonT/MQG6HoMJlLVDo523NZ2s/oLB03HHzBbjd8RyeEA8S9dB6j92ZkLeagGLcmwagaat/3FSMU/zJ/7d351FWlWe+x7/PPqcooJCpAIuixJpkCIkmF7vTUa+tUTsxcUKgFBEEQVDb4d7WaEwcMInmqm06ahIbcQSlsJhUbDXdurSNeLNMcLgRZThVBVYVc0ExF1Xn7Of+gaYbR0SGc/b+fdaqtbL8I4v39777fZ+9z7vfDXhNoq098zhwZG63g6dWlg57Plv/eVn9BaXQM1eCb8rhjR84fkrZyrw7dUWL7GlV8Zk72vISZ0D4MoQvt+UltOFPACj9IO928O/l8twPvjmdSFyRzTlb9g+Ep8bj/nDOF7Rm/7iy/zn6eqDIxxSvWtD5o4JAaUjZyvmTHKbmejvM7ZL60nMeVAHwlVZOt9IPnnoR+G5OFwCQxjkrmx8HiYgc2sX/qTMdnw/k+s+m/7Gi/znfy7bX/j4uyPoYzTwkvMRgRy7vCQwgGRg1R654+lu6zEVE9rT7rSl/wiCR2/u/2UbIpGxf/HOjAAA+OHJ4HQE/zvG3AsDoEgThsxVNOi5YROQjJQ0L+lmCBRiH5fo873DjirJhK3Ih9yBXBkh9yTu/BX8txzeFAF4cZsIFA9c/fZguexGJu/Lamm553v4CeEkE5vf/XNH/nZw5CTZnCgBsSpjAxgHbIjDmj2nbmZkz9M9T83T5i0hcneQvJz0vOQv4es43xtkahsnx2JRQBcABkOo/rNbg6oiM/X9o7tPrHk0BIhJXKz/YdD/w/Wi0xq5dWXpWfS79i4Nci7iu/7kPgy+IxHDBLiv7YP7PNA2ISNyUNsy7GWNiFNribs/V9z9nWq79u4OcDDuTmQRsiMZl4DeVrpz7vzQdiEh8Fv/515lza0Sa0+weTsyFXf+fvAnN1QH0wZxzzGx+RAaQm3NFXf/hOihIRKK9+DfOu9Tcf5fL68+ei6iPqDtiRE4eWx/kaugr+o94KgJfifrrGHLjvrLGeWM1PYhIVJU1zJ0QpcUffFquLv45XQAAtHvmWsPei8i1EeD+UHnDvHM1TYhI5O78P5h7HruP+I3K4v8XT2+9KqfvPHO+omycdwzufwQ6RuQ62YWHZ9X3H/nvmjJEJArKG+ed4e7zgKi8+rwzcPvb2v7nvpvbd505rr7k3HfMuSZC10o+Fjxd0Tjvu4iI5Pyd/5zvufvcCC3+OH5Dri/+kXgCsLs33Mob584BovT4fDth+P26I6te0xQiIrmoomnu8R76C0CXqLTJzJ+p7TfinFzc9R+5JwAf9Qht4cUYtRH4XsBHfwUkgudKG2r+XtOIiOSa8qa5p7r77zG6RGVedqMu0568KAqLf3QKAKCuompzEFgV0Bqha+iwwILnyxvm/EDTiYjkisqm2Wfj/ixQEKFm7YTg3BVlw1qi0qAgSoMuVTz8TXe/MmLXUieMeWVNc8/StCIi2a6sce6I0K0GyI9Uw8yvrS85951INSmKA7C8Yc5MjFERa1Yat4vqjhg+U1OMiGSjisa54xx/EEhEbKGcUVsyInLntARRHIStifyJEL4TgU9L/ve/JBbOKG+afbmmGRHJuhuvxjmXOuFD4IlIzb3mizt2CCM570ayAFhVfOaOIAyHAxsj11/Ob8qaaq7QdCMi2aKscfY14L+L4JrSQmjDFvep2hbFfrNID8qmmtMMe56IPY76sOt+VtdvxC2aekTkkN75N9XcDHZrBJsWWsAZtX1HPh/VvrOoD86yptnXGtwVzd6z++v6hldiVRlNQyJyMA3989S8TX0L7wefEMX2ufHT+uKRt0e5DyNfAOBu5U1z5mCcG9Ee/LdOST8/qo+oRCT7VDY/3jVszZ8DnBbJZQN7sr54+KiovO//WYLIj1Qzbw06jgFfFLFNgbv/3H+4s52FlY1zSzQticiBNqChpl/Y2uFV8NOiOKc6/taOxI4JUV/841EA8OGmQE+cg7E6ok08OrTM6+UNNd/Q9CQiB+zOf9Ws/5EJeAM4JqJNbExnMmesLRq7PQ79GcRl4KZKhjd6hnOAnRFt4hEEvFbWVHMaIiL7WXljzQ9DD/7ToTiiTdweWHh2Q/9Rq+LSpxa3QVzRVHMeRnWE295uzmWpflUPacoSkf1y57969uXufi+RfKMKgNDxqrri8+bGqV8tloN51ewbHI/07k7c/rm22H+sNwREZN/nkZpExRq/HbfrIr4U3lRbPPIXcetei+u4Ll8160HDJkS8mb/PC/NGLyk5t1kzmYh8GRVr5vUhbJ8FnBzpRdB4JFVUFYtNfx8XxHVw9+97+KXsPiQoyr7XFrT/6ajGmm9qOhORvb5BWj3rbwjb/xz1xR/4fbeilslxXPxjXQC8YienOyapAhZFurqFsjDwhZWrnrxQ05qIfJHKppoJ5vYqcETEm/pmMq/jyEU2uT2ufW1xH+yl62qKgrS/blAW+c427igp6nPjK3ZyWtOciPx3QxbXdGjtEd4HNikGK1/KsONSfavWx7nPTcMeyhtnDbCELQR6xaC5f7RMcmSqZHijel5EYPfhPpmkzwa+E4PmNmc8ccKK4hFL4t7vKgA+VLG2+jgP7d8NCmLQ3DWhe1V98ag/qOdFYj73rZn5XTyYBfSOQXO3hgSn1vetekM9rwJgzwth9ZMngz8HdIxBc9MOP68rCm7Tq4IiMeQ1iYo1mZ+A3QwkY9DiXW7+w7qiUS+p81UAfKrK1dUjHJtFdA+82HMOgFfdM2Pri0evVO+LxGSeWzurwkMeB/4uJk1OmzEiVXT+0+r9/xIogj2l+o6aY+aTd6+NsagATwws8Vbl6lkj1fsiMVj8V1WP8ZA3Y7T4OzBBi7+eAOy1ijXVV+F2T6wa7V7tHROX1fWs2qwRIBIt5RtrugVt4W/dGR2rRc79n1LFo/5FI0AFwJerlNfMvAHs9pg1uxbswlTR+X/UCBCJhqNWPXmiB+EMoH+8Vji7JnX4+b/SCFABsG8XzprqGx1+HrNmZ3B+UVJU9AudGSCSu4YsrunQWpi5y+AKYvaTr7ldt7zv+XdpFKgA+GpPAlZXT8G4JYaj402Miak+o97SKBDJsZuXdU980z3xIO5DY9d495+l+l5wi0aBCoD9VATM+mfMr4lh09twftmaTtzReETVTo0Ekex29JrpBdvJu93gcuLxet/HFjW/bXnRBTdqJKgA2K8q1s6809x+FNPmLwlCJi3T4UEiWat8TfUpAUwFKuLYfnd+Xtt31M0aCSoADsyTgLXV/wf8+pg2P3T333iHvJv1poBI9hjSUNNzV4f2X4NdGNt53fzHqT6j79BoUAFwoIuAW8CnxDiCRpzLU0UXLNBoEDnE89G66hG43wcUxXcl0+KvAuAgOmrtzB853BnzwTPfk+FVqcIL9WEhkYNswIaafmEmfQ8wPN6rmBZ/FQCHoghYV32Vu/865jluB+5sbUvepU2CIgdeSUNNp/y89D+ZcQPx+HjZZ3HcrkkV6ZAfFQCHSOWaJyZgNpWYfDvgc4ZSPe5X62cBkQO13LlVrJs5xrDbgJKYp5EGuzh1+KgZGhgqAA7tk4C1M4c7PAHkKw1eJQj+d6r3+W8qCpH9NMesqf62m98DfFtp0IrbeamiUc8oChUA2VIEnObm84n3I7mPZBx+m9eW/tmSkouaFYfIvilbO/PwROB3sfv8fn28DbZg4dmp3mNeURQqALLKwPXVx4YePg/0UhoAbHW4jc09fp066ge7FIfI3hniNR3a1qWvxvxGoKsSAaDZAn6wrNfoNxSFCoCsNGDDzEEe+nNAmdL4qzpzbj2sz7bqRTa5XXGIfLrK5c/lW7dNlwLXAEcokb9KhYSn1/YZk1IUKgCyvAh4rJ+HyeeAo5XGHpY7/DTVe/lcbEqoOER2O8lfTq7asOpi4CfuHKlE9likFrWRd8aKPlVrlIYKgNyo5Jsf72oZmwOcpjQ+YanDTSoEJPa8JjFgXfto3/1K3yAF8gnPdSDvvMV9qrYpChUAOWWoT83bsr7gAWCc0vjU2e8t8+C6ZYePflFZSLyGvlvl+pkjzPwWnCEK5NMiYlpJn36X65PkKgBy2oANj9/gzm3K+7MLAYcpqV61z+qJgER94T9qwxM/dOwWw49VIJ+eEm43L+99wW2YueJQAZDzjlo/YxTYw0BHpfGZFpv5nXmF+bMWW1Wb4pCoKGmo6dQpf9ckzK4AKpXIZ9rhzkWpPhfOURQqAKL2JOBv3Hka6Ks0PlcT7ndlkvmP6quDkssGbXmsMNwVXOnYZUAfJfK5GnA7a3mf0W8rChUAkVS+cXr/RCZ4BjhGaXyh7RgPWcbuWXb46DrFIblT7M8chIc/cbwKTCeEfvFCtMhInLW096hVSkMFQKQVr5rauSCv80PA+Upjr4S4PRW63117+JjXFYdkq8rmx75jHlyDMwyd3Ld3i5DZ7I7pcPz/Kxq7XWmoAIgHd6tsfvw62705MKFA9jI2WBjAdKOtemnvCVuViBxq/Vue6JHfFo41Y4zDUCWy1zJu/DRVeOGd2uynAiCmdwyP/4N5WA3WU2l8KdswZoZh8EBt79GLFIccbAM2PHYqJCY5fiba3PtlF55NGeOC2sIxLygNFQDxnkjWPlFOEM7HdHLgPo7itwm5P53If1KbBuVAGrTlsUJvCyY6XAQMViJfnsO7YcgwHeurAkA+dPSa6QWtyeB+8DFKY5+1AnM8DKYt733BH/RYUfbPiuU2YNOM4wntEmAk0Emh7POKMysvk3+JTvZTASCfYmDzjKvd/Q5AO4e/mhTuT4SBz04VjlusOGRfFn0LGekwDH2Y56vaCXbpsl5jpisKFQDyOQZseOxvwWpAHwXZT5bhXq1iQL7w2ts4/YQPF/2zdf3tN7WhW1Wq95g3FYUKANkL5RtruiXD1oeBc5XG/i0GDGosCGqW9LzwL4pDKpsfHWJh4jwzrwIGKpH9x/FnOiaT4/7SffQmpaECQL7U1eM2YNP0y3C7G+0yPhDew31BmLDnu3Xf+foim9yuSKLvJH852dSy8jjLBKdjnAn6GM8B0OrO9csLx9ynvTgqAOQrGLBpxjGEXo12HR9ILcB/4PZsJu0v1BaNXadIoqOi+eEjEpZ3OqGfiXEyUKBUDpi/hISj9HObCgDZT45eM72gtYPfj6O3BA48x3gT59kg9AVLenV+G6vKKJbcMcRrOrQ37zzRzM50OAO8XKkcjAXF7t2+o+OPG4+o2qk0VADI/n4asGHGOVg4DeilNA6arWCv4uFCT7Bw57bOf9IEl11KGmo6dS7YdSxh5gSw4zBOBLoqmYOm2fHJywvHzVUUKgDkABq4/qFiD/IeAv++0jgkWoHXgIWh2aJMe/KN+sMvWKtYDp7yjdP7J8PwJLNgqJsfj3MMkFQyB58bz6Tb8ybpGlABIAezEGiePsHxX+lOJyuupBTOQjf+L6G93SnNu/q4yf6x+5AsH+IB3zLnOw7HGRylZA65rWDXLCscO01RqACQQ6Bi84zKRCZ8DDhOaWSVEHwJ2CKDxRnsvUSmfdHS3hP0udPPvJWcElRuLB0cBAzF7Wvs3p0/FOircLKsq7BXkpYY936P0SuVhgoAOcQT58CW0ivY/WXBLgokq20zfHGIvYOzhMDrIaxPe3pFXc/JsfiOQfnGqd2Sliw1kqUQlrnbYOBog69r/Ga97Zj9dGn3+vuwKaHiUAEgWWLQpkdKQ+wBc05TGjlpk8GK0K0+CMIVwAo8qA/c68M8W7Ok60XNOTEOtzxWGLR7UWhWBpRiYVkYBqVmXgqUAvryZW7e9r9EIrhkafex9QpDBYBk5UXqNnDjo+MxuxvorkAiJQSaP/zbAN6MBc04zRCux2wD0OwZ2+EJb0sY2wHCtG8n6W0A+eRvArDWTNtHexSOXjO9wDsmOgDsYlcPANLWIUhaAUDGKbCMdbCEdwYKLaTQjd6Y9cLDQrBCoBCnEKMXEKirIqXF3X60rOfYh3SojwoAyQGD18/omwnC35i5jhIWkX31lId2xbJeFzUpChUAkmMGNT863I17gH5KQ0T20grDr1rSc/wCRaECQHLYkHW/7ZLO63QbBJeD611pEfksbQa/LNjZduei4sk7FIcKAImIrzU/OiQM/HcOJyoNEfnYcvBa4OnL3u858V1loQJAosjdBrQ8NsbwXwLFCkQk9j7AuHZpt3FztMkvXrRbN3Yln/myHuOmkw4Hgd8L6BO4IvG8/Ws1uLXLzrbBS7uPn63FX08AJGYqWx6tCJxfG36G0hCJjdnJIPOTxd0mphSFCgCJuYEtD38X5052H70qItGc8N8KLfjRsu7jXlIaogJA/ovXJAZt3jbB4SagRIGIRGaqrweu1+/8ogJAPlepP9IxfzNXg18P9FAiIjmrBbcpye4F9y+2qjbFISoAZK98o+WJHm3sut7gSqCzEhHJGVtx/1Ui8HsXd5u4UXGICgDZJ4O3T+3r7XlTgHFAByUikrVaHe7JJLg7ddjF6xWHqACQ/WLIxqn900HiJsPGATpRUCR7pIEZ5n7r+z0mrlQcogJADswTgc2PHBWG4U1mnA/kKRGRQ3fHj/MABP+ypMf4FYpDVADIQVHZ8mhFwjK3GJyHfhoQOXicnRjTEpn03Yt7Tv5AgYgKADk0TwS2T+3r6eS1wCXAYUpE5IDZ5vAgSe5aWjBhleIQFQCSFYZsfrBnBrsKuAzoo0RE9tsdf5Ob35VJd3wkVXjhFgUiKgAkK5V4TaeCLVsmGVwBVCoRkX32nmF3BF0Pm6X3+EUFgOTQXcuUYPCWktMdrgJO03gT2cv7fXgR474lhzX+GzYlVCSiAkBy1uCtD37d3a4EvwDookREPmEbZg9bGPzm/W7jlysOUQEgkVK+cWq3/ERyvJtfBgxQIiIsM+dfd2UyD9f1nLxZcYgKAIk2dxu8/ZFTCMNJDmej1wglXhfATghmEIYPLOl+ySLlISoAJJYGbJnaK0linOOX6KmARHzKXQ4+rd0Sj+qoXlEBILLHU4FppxAyFjgbrKtCkQjY6MbjZJiuu31RASDyBY5eM72grWDX6MAZ6/AdIFAqkkPSwAtmNn1Hl8SCFTa+VZGICgCRL2ng9oeKAw+rcM4Dvq1xK1k8o74BNisTtNcs63xZkwIRFQAi+8ngzf96lAWJ0Y6PBPuaEpEsmEQXuvnsIOHzF3fSufyiAkDkgBuwZeqgABsGDDPjWI1nOUgct0UG8wNj/ruHXfK+IhEVACKHyNE7ppW0hz7cnJEOfwcklIrsR+0Yv3e3BclE4vl3O1/coEhEBYBIlvlGy+96pJN5Z+KcAX4y0EupyD5YZfizwIsWJl5a3G3iRkUiKgBEcoVPCYZsKTnWg8wP3Ox0nKF6OiCfIePOm4HxPKE/917X1X/SOfyiAkAkIoZsfrCnB5lTgFOBU92sXKnEtzwE3gReBF4MdrT/cXGff9ymWEQFgEgM7H7FMHMKHv5PzE4ABum6iLT3cRZi/odM4C/pVT1RASAiwIfHEif8eDw40T08DrNvAflKJie1AW8Br2O82h7mLdTxuyIqAET2Sqk/0rFga9uxYWBDzfx4nBOAvkom64TAEpzX3HyhebCoT5dVS1+xKWlFI6ICQGS/qGy+t2uHvE7HYJlvmgXHgH/TYQjQUekcFLsM3gV72z18x+Gd9ra2t1OFV21RNCIqAEQOqpN8SnLdtuKBwBACH4z718AGsntPgX5C2MeF3mGp4Utwe9/x98EXH95l7RLd2YuoABDJbl6TGLJrfVmYSQwwo8JCyt2oACqAcj01oBWoc6gLnFoPqHW3uiCRXro4v3c9VpXRIBJRASASOQO331ectGRJCP2M4AiDfo73I6Q/Ab1x+gA9c7R5GzHWEbKewBsMa3Ks0QkbjGBVxtsalna+YjVmrpEgogJARD5mqE/N27ajrXfS83qDF4WBdTf37ubW3QPvbk43N7q5W1fDO4J1MSzPoRt4Euj2sf/Lbnzy88ohsPlj/20zkDGsxfF28G2OteJsDcxb3NhsobX4h/87CK0FWJ229vVdOndYv8gmt6v3RLLX/wfbkFJ9u76BfwAAAABJRU5ErkJggg==',
 }
 
+# --- Icon Atlas ---
+# Every icon the UI asks for, at the sizes it asks for. They are rasterized once into a single
+# PNG sheet next to the app; later launches load that sheet with Tk's own PNG reader, so the
+# 512x512 sources are never decoded or resized (and Pillow is not even imported) at startup.
+ICON_ATLAS_FILE = "icon_atlas.png"
+ICON_ATLAS_INDEX_FILE = "icon_atlas.json"
+ATLAS_ICONS = [
+    ('search', 16, 16),
+    ('prev', 16, 16),
+    ('next', 16, 16),
+    ('placeholder', 64, 64),
+]
+
 # --- PhotoImage Cache ---
 # This dictionary caches the PhotoImage objects to avoid recreating them,
 # which can be a performance issue in Tkinter.
 _pillow_cache = {}
 _photo_image_cache = {}
+_atlas_loaded = False
+
+def _atlas_version():
+    """Fingerprint of the icon sources and atlas layout; a mismatch makes the atlas get rebuilt."""
+    digest = hashlib.sha1()
+    for name, width, height in ATLAS_ICONS:
+        digest.update(f"{name}:{width}x{height}:".encode())
+        digest.update(ICON_DATA.get(name, b''))
+    return digest.hexdigest()
+
+def _build_atlas(version):
+    """Rasterizes ATLAS_ICONS side by side into ICON_ATLAS_FILE and writes the offset index."""
+    from PIL import Image
+
+    sheet = Image.new('RGBA', (sum(w for _, w, _ in ATLAS_ICONS), max(h for _, _, h in ATLAS_ICONS)), (0, 0, 0, 0))
+    index = {'version': version, 'icons': {}}
+    x = 0
+    for name, width, height in ATLAS_ICONS:
+        source = Image.open(io.BytesIO(base64.b64decode(ICON_DATA[name]))).convert('RGBA')
+        sheet.paste(source.resize((width, height), Image.Resampling.LANCZOS), (x, 0))
+        index['icons'][f"{name}:{width}x{height}"] = [x, 0, width, height]
+        x += width
+    sheet.save(ICON_ATLAS_FILE, format='PNG')
+    with open(ICON_ATLAS_INDEX_FILE, 'w') as f:
+        json.dump(index, f)
+    return index
+
+def _load_atlas():
+    """Fills the PhotoImage cache from the atlas sheet, (re)building the sheet if it is missing or stale."""
+    global _atlas_loaded
+    _atlas_loaded = True
+    version = _atlas_version()
+    try:
+        index = None
+        if os.path.exists(ICON_ATLAS_FILE) and os.path.exists(ICON_ATLAS_INDEX_FILE):
+            with open(ICON_ATLAS_INDEX_FILE, 'r') as f:
+                index = json.load(f)
+        if not index or index.get('version') != version:
+            index = _build_atlas(version)
+        sheet = PhotoImage(file=ICON_ATLAS_FILE)
+        for key, (x, y, width, height) in index['icons'].items():
+            name = key.split(':')[0]
+            icon = PhotoImage(width=width, height=height)
+            icon.tk.call(icon, 'copy', sheet, '-from', x, y, x + width, y + height, '-to', 0, 0)
+            _photo_image_cache[(name, width, height)] = icon
+    except Exception as e:
+        # Fall back to resizing each icon on demand.
+        print(f"Icon atlas unavailable: {e}")
 
 def get_icon(name, width, height):
     """
     Gets a Tkinter PhotoImage object, resized to the specified dimensions.
     
-    This function decodes a high-resolution base64 image, resizes it using Pillow,
-    and caches the result for efficient reuse.
+    Sizes listed in ATLAS_ICONS come from the pre-rasterized icon atlas. Any other size
+    is decoded from the high-resolution base64 image, resized with Pillow, and cached
+    for efficient reuse.
     
     Args:
         name (str): The key of the icon in ICON_DATA.
@@ -33,11 +97,15 @@ def get_icon(name, width, height):
         tkinter.PhotoImage: The resized image object.
     """
     cache_key = (name, width, height)
+    if not _atlas_loaded:
+        _load_atlas()
     
     # Return the final PhotoImage from cache if it already exists
     if cache_key in _photo_image_cache:
         return _photo_image_cache[cache_key]
 
+    from PIL import Image, ImageTk
+
     # Load the original Pillow image from cache or create it
     if name not in _pillow_cache:
         data = ICON_DATA.get(name)
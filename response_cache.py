@@ -0,0 +1,179 @@
+import sqlite3
+import json
+import threading
+import time
+from urllib.parse import urlencode
+
+# --- Cache Defaults ---
+CACHE_DB_FILE = "yts_cache.sqlite3"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_TTLS = {
+    'list_movies.json': 15 * 60,
+    'movie_details.json': 6 * 60 * 60,
+}
+FALLBACK_TTL = 10 * 60
+
+# --- SQLite Tuning ---
+# ResponseCache and TmdbCache keep separate connections to CACHE_DB_FILE; WAL lets their reads run
+# alongside the other's writes, and the busy timeout makes a writer wait instead of raising "locked".
+BUSY_TIMEOUT_MS = 5000
+ACCESS_FLUSH_BATCH = 64        # LRU access times are written in batches of this many reads...
+ACCESS_FLUSH_SECONDS = 30      # ...or at least this often, instead of one UPDATE + commit per get()
+
+
+def connect_db(path):
+    """Opens a cache database shared between threads (and with the other cache on the same file)."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache for YTS API payloads.
+
+    Entries are keyed by endpoint plus normalized query params, never by mirror domain,
+    so switching between yts.mx / yts.lt keeps the cache valid. Every entry records when
+    it was stored (for the per-endpoint TTL) and when it was last read (for LRU eviction
+    once the total payload size exceeds `max_bytes`). Read times are buffered in memory and
+    written in batches; eviction flushes them first, so it always sees the current order.
+    """
+
+    def __init__(self, path=CACHE_DB_FILE, ttls=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._accessed = {}
+        self._last_access_flush = time.monotonic()
+        self._conn = connect_db(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL, stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(endpoint, params=None):
+        """Builds a domain-independent key: endpoint plus sorted, stringified, non-empty params."""
+        items = []
+        for k, v in (params or {}).items():
+            if v is None or v == '':
+                continue
+            value = v.strip() if isinstance(v, str) else v
+            items.append((str(k), str(value).lower() if isinstance(value, bool) else str(value)))
+        items.sort()
+        return f"{endpoint}?{urlencode(items)}"
+
+    def ttl_for(self, endpoint):
+        return self.ttls.get(endpoint, FALLBACK_TTL)
+
+    def get(self, endpoint, params=None):
+        """Returns (data, is_fresh). `data` is None on a miss; stale entries are returned with is_fresh=False."""
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, False
+            self._accessed[key] = now
+            if len(self._accessed) >= ACCESS_FLUSH_BATCH or time.monotonic() - self._last_access_flush >= ACCESS_FLUSH_SECONDS:
+                self._flush_access_locked()
+                self._conn.commit()
+            is_fresh = (now - row[1]) < self.ttl_for(endpoint)
+            if is_fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        try:
+            return json.loads(row[0]), is_fresh
+        except json.JSONDecodeError:
+            self.delete(endpoint, params)
+            return None, False
+
+    def put(self, endpoint, params, data):
+        key = self.make_key(endpoint, params)
+        payload = json.dumps(data, separators=(',', ':'))
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, payload, size, stored_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, payload, len(payload), now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def delete(self, endpoint, params=None):
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def _flush_access_locked(self):
+        """Writes the buffered read times (the caller commits)."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE responses SET last_access = ? WHERE key = ?", [(t, k) for k, t in self._accessed.items()]
+            )
+            self._accessed.clear()
+        self._last_access_flush = time.monotonic()
+
+    def _evict_locked(self):
+        """Drops least-recently-read entries until the stored payload total fits the size cap."""
+        self._flush_access_locked()
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def iter_payloads(self, endpoint):
+        """Yields every cached payload for `endpoint` (used to seed local indexes from cached pages)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM responses WHERE endpoint = ?", (endpoint,)).fetchall()
+        for (payload,) in rows:
+            try:
+                yield json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+
+    def stats(self):
+        with self._lock:
+            entries, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            'entries': entries,
+            'bytes': total,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def close(self):
+        with self._lock:
+            self._flush_access_locked()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,223 @@
+import re
+import math
+import bisect
+import heapq
+import threading
+import unicodedata
+from operator import itemgetter
+
+# --- Index Tuning ---
+FIELD_WEIGHTS = {'title': 3.0, 'cast': 1.5, 'genres': 1.0, 'year': 1.0, 'summary': 0.4}
+FUZZY_FIELDS = ('title', 'cast')   # only these feed the typo-tolerance table, to keep it small
+FUZZY_MIN_LENGTH = 4               # shorter words must match exactly or by prefix
+PREFIX_MIN_LENGTH = 2
+MAX_PREFIX_EXPANSION = 64          # vocabulary terms a single prefix may expand to
+EXACT_BOOST = 1.0
+PREFIX_BOOST = 0.7
+FUZZY_BOOST = 0.45
+BUILD_BATCH = 500
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """Lower-cases, strips accents and splits on non-word characters."""
+    if not text:
+        return []
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent swap."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+    if la > lb:
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1:]
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over title, year, genres, cast and summary of list/detail payloads.
+
+    Query tokens are matched exactly, as prefixes (the last token is usually still being typed)
+    and within one edit for longer title/cast words, then combined AND-wise and ranked with a
+    field-weighted TF-IDF score. `complete` is set once the index was built from a complete
+    catalog mirror, i.e. it can answer any query without asking YTS.
+    """
+
+    def __init__(self):
+        self.docs = {}
+        self.complete = False
+        self._postings = {}        # term -> {doc_id: weighted tf}
+        self._doc_terms = {}       # doc_id -> terms (for re-indexing)
+        self._vocab = []           # sorted terms, for prefix lookups
+        self._vocab_dirty = False
+        self._fuzzy = {}           # deletion variant -> terms
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add_many(self, movies):
+        with self._lock:
+            for movie in movies:
+                if movie.get('id') is not None:
+                    self._add(movie)
+
+    def _add(self, movie):
+        doc_id = movie['id']
+        existing = self.docs.get(doc_id)
+        if existing is not None:
+            # Keep the richer payload (e.g. details with cast) when a plain list record comes in later.
+            movie = {**movie, **{k: v for k, v in existing.items() if k not in movie}}
+            self._remove(doc_id)
+
+        cast = movie.get('cast') or []
+        cast_text = ' '.join(c.get('name', '') if isinstance(c, dict) else str(c) for c in cast)
+        fields = {
+            'title': f"{movie.get('title', '')} {movie.get('title_english', '')}",
+            'cast': cast_text,
+            'genres': ' '.join(movie.get('genres') or []),
+            'year': str(movie.get('year', '')),
+            'summary': movie.get('summary') or movie.get('synopsis') or movie.get('description_full') or '',
+        }
+        weights = {}
+        fuzzy_terms = set()
+        for field, text in fields.items():
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0.0) + FIELD_WEIGHTS[field]
+                if field in FUZZY_FIELDS and len(term) >= FUZZY_MIN_LENGTH:
+                    fuzzy_terms.add(term)
+
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocab_dirty = True
+            postings[doc_id] = weight
+        for term in fuzzy_terms:
+            for variant in _deletes(term):
+                self._fuzzy.setdefault(variant, set()).add(term)
+        self._doc_terms[doc_id] = list(weights)
+        self.docs[doc_id] = movie
+
+    def _remove(self, doc_id):
+        for term in self._doc_terms.pop(doc_id, []):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._vocab_dirty = True
+        self.docs.pop(doc_id, None)
+
+    def build_from(self, payloads, complete=False):
+        """Indexes an iterable of payloads in small batches so searches are never blocked for long."""
+        batch = []
+        for movie in payloads:
+            batch.append(movie)
+            if len(batch) >= BUILD_BATCH:
+                self.add_many(batch)
+                batch = []
+        self.add_many(batch)
+        if complete:
+            self.complete = True
+
+    def _expand(self, token, is_last):
+        """Returns [(term, boost)] that `token` matches: exact, prefix (for the token being typed) and fuzzy."""
+        matches = {}
+        if token in self._postings:
+            matches[token] = EXACT_BOOST
+        if is_last and len(token) >= PREFIX_MIN_LENGTH:
+            if self._vocab_dirty:
+                self._vocab = sorted(self._postings)
+                self._vocab_dirty = False
+            start = bisect.bisect_left(self._vocab, token)
+            for term in self._vocab[start:start + MAX_PREFIX_EXPANSION]:
+                if not term.startswith(token):
+                    break
+                matches.setdefault(term, PREFIX_BOOST)
+        if len(token) >= FUZZY_MIN_LENGTH:
+            candidates = set(self._fuzzy.get(token, ()))
+            for variant in _deletes(token):
+                candidates.update(self._fuzzy.get(variant, ()))
+                if variant in self._postings:
+                    candidates.add(variant)
+            for term in candidates:
+                if term in self._postings and _within_one_edit(token, term):
+                    matches.setdefault(term, FUZZY_BOOST)
+        return matches.items()
+
+    def search(self, query, limit=None, predicate=None):
+        """Returns matching movie payloads, best first. `predicate(movie)` can apply extra filters."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        with self._lock:
+            total_docs = max(1, len(self.docs))
+            expansions = []
+            for position, token in enumerate(tokens):
+                terms = [(self._postings[t], boost) for t, boost in self._expand(token, position == len(tokens) - 1)]
+                if not terms:
+                    return []
+                expansions.append(terms)
+            # Start from the most selective token so later tokens only probe the surviving candidates.
+            expansions.sort(key=lambda terms: sum(len(p) for p, _ in terms))
+
+            scores = {}
+            for postings, boost in expansions[0]:
+                idf = math.log(1 + total_docs / len(postings))
+                for doc_id, weight in postings.items():
+                    score = boost * idf * weight
+                    if score > scores.get(doc_id, 0.0):
+                        scores[doc_id] = score
+            for terms in expansions[1:]:
+                weighted = [(postings, boost * math.log(1 + total_docs / len(postings))) for postings, boost in terms]
+                narrowed = {}
+                for doc_id, score in scores.items():
+                    best = 0.0
+                    for postings, factor in weighted:
+                        weight = postings.get(doc_id)
+                        if weight is not None and weight * factor > best:
+                            best = weight * factor
+                    if best:
+                        narrowed[doc_id] = score + best
+                scores = narrowed
+                if not scores:
+                    return []
+
+            docs = self.docs
+            if limit is None:
+                ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+                return [docs[d] for d, _ in ranked if predicate is None or predicate(docs[d])]
+            # Over-fetch the top of the ranking and filter it; only sort everything if the filter is very selective.
+            top = heapq.nlargest(limit * 4, scores.items(), key=itemgetter(1))
+            results = [docs[d] for d, _ in top if predicate is None or predicate(docs[d])]
+            if len(results) < limit and len(top) < len(scores):
+                ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+                results = [docs[d] for d, _ in ranked if predicate is None or predicate(docs[d])]
+            results = results[:limit]
+            results.sort(key=lambda m: (scores[m['id']], m.get('rating') or 0), reverse=True)
+            return results
+
+    def stats(self):
+        with self._lock:
+            return {'documents': len(self.docs), 'terms': len(self._postings), 'fuzzy_keys': len(self._fuzzy), 'complete': self.complete}
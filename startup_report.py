@@ -0,0 +1,64 @@
+import json
+import platform
+import statistics
+import sys
+import time
+
+# --- Startup Report ---
+STARTUP_LOG_FILE = "startup_times.jsonl"
+REPORT_HISTORY = 20     # launches summarized by `python yts_me.py --startup-report`
+
+
+class StartupTimer:
+    """
+    Records named startup milestones in milliseconds since `t0`.
+
+    Each milestone is kept once (the first time it is reached). `save()` appends one JSON
+    line per launch to STARTUP_LOG_FILE so cold-start times can be compared across releases.
+    """
+
+    def __init__(self, t0=None):
+        self.t0 = t0 if t0 is not None else time.perf_counter()
+        self.marks = {}
+        self.saved = False
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = round((time.perf_counter() - self.t0) * 1000, 1)
+
+    def summary(self):
+        return "Startup: " + " | ".join(f"{name} {ms:.0f} ms" for name, ms in self.marks.items())
+
+    def save(self, path=STARTUP_LOG_FILE, **extra):
+        """Prints the summary and appends this launch to the startup log. Only the first call writes."""
+        if self.saved:
+            return
+        self.saved = True
+        print(self.summary())
+        record = {'time': time.time(), 'python': platform.python_version(), 'platform': sys.platform, 'marks': self.marks}
+        record.update(extra)
+        try:
+            with open(path, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"Could not write startup log: {e}")
+
+
+def print_history(path=STARTUP_LOG_FILE, limit=REPORT_HISTORY):
+    """Prints median and worst time per milestone over the last `limit` recorded launches."""
+    try:
+        with open(path, 'r') as f:
+            records = [json.loads(line) for line in f if line.strip()][-limit:]
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"No startup history: {e}")
+        return
+    if not records:
+        print("No startup history yet.")
+        return
+    names = []
+    for record in records:
+        names += [n for n in record.get('marks', {}) if n not in names]
+    print(f"Startup times over the last {len(records)} launches:")
+    for name in names:
+        values = [r['marks'][name] for r in records if name in r.get('marks', {})]
+        print(f"  {name:<16} median {statistics.median(values):8.1f} ms   max {max(values):8.1f} ms   (n={len(values)})")
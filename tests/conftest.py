@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Local HTTP stand-in. `routes` maps a path to handler(request) -> (status, body, headers);
+    dict bodies are sent as JSON. Every request is recorded in `calls` as (method, path).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, routes):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        self.routes = routes
+        self.calls = []
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def count(self, path):
+        return sum(1 for _, p in self.calls if p == path)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self, method):
+        path = self.path.split('?', 1)[0]
+        self.body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.calls.append((method, path))
+        handler = self.server.routes.get(path)
+        status, body, headers = handler(self) if handler else (404, {'status': 'error'}, {})
+        if isinstance(body, dict):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(routes):
+        server = StubServer(routes)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def make_api(tmp_path, monkeypatch):
+    """APIHandler in a scratch directory (it keeps its config and caches in the working directory)."""
+    monkeypatch.chdir(tmp_path)
+    apis = []
+
+    def start(domains=(), config="[TMDB]\napi_key = \n"):
+        from api_handler import APIHandler
+        (tmp_path / "yts_domains.json").write_text(json.dumps(list(domains)))
+        (tmp_path / "config.ini").write_text(config)
+        api = APIHandler(log=lambda message: None)
+        apis.append(api)
+        return api
+
+    yield start
+    for api in apis:
+        api.close()
+        api.workers.shutdown()
+        api.io.shutdown()
+        if api.cache:
+            api.cache.close()
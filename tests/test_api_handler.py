@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from concurrency import CancelToken, CancelledError
+
+
+def slow_ok(request):
+    time.sleep(0.5)
+    return 200, {'status': 'ok'}, {}
+
+
+def test_cancelling_the_leader_does_not_cancel_coalesced_followers(stub_server, make_api):
+    server = stub_server({'/slow': slow_ok})
+    api = make_api()
+    leader_token, follower_token = CancelToken(), CancelToken()
+    outcome = {}
+
+    def leader():
+        try:
+            api.http_get(f"{server.url}/slow", token=leader_token, timeout=5)
+        except CancelledError:
+            outcome['leader'] = 'cancelled'
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    time.sleep(0.1)
+    threading.Timer(0.1, leader_token.cancel).start()
+    response = api.http_get(f"{server.url}/slow", token=follower_token, timeout=5)
+    thread.join()
+
+    assert response.status_code == 200
+    assert outcome['leader'] == 'cancelled'
+    assert server.count('/slow') == 1
+
+
+def test_cancelled_follower_stops_waiting(stub_server, make_api):
+    server = stub_server({'/slow': slow_ok})
+    api = make_api()
+    threading.Thread(target=api.http_get, args=(f"{server.url}/slow",), kwargs={'timeout': 5}).start()
+    time.sleep(0.1)
+    token = CancelToken()
+    threading.Timer(0.1, token.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(CancelledError):
+        api.http_get(f"{server.url}/slow", token=token, timeout=5)
+    assert time.monotonic() - start < 0.4
+
+
+def list_movies_ok(request):
+    return 200, {'status': 'ok', 'data': {'movie_count': 1, 'movies': [{'id': 1, 'title': 'Stub'}]}}, {}
+
+
+def test_dead_remembered_mirror_is_replaced_on_the_first_request(stub_server, make_api):
+    live = stub_server({'/api/v2/list_movies.json': list_movies_ok})
+    dead = stub_server({})
+    dead_url = dead.url
+    dead.shutdown()
+    dead.server_close()
+    api = make_api(domains=[dead_url, live.url])
+    api.yts_active_domain = dead_url   # as restored from the scoreboard's last_best
+
+    data = api.list_movies(use_cache=False)
+
+    assert data['movies'][0]['title'] == 'Stub'
+    assert api.yts_active_domain == live.url
+
+
+def test_hedged_request_stops_waiting_once_the_caller_cancels(stub_server, make_api):
+    def stalled(request):
+        time.sleep(2)
+        return list_movies_ok(request)
+
+    server = stub_server({'/api/v2/list_movies.json': stalled})
+    api = make_api(domains=[server.url], config="[TMDB]\napi_key = \n[Network]\nhedge_requests = true\n")
+    api.yts_active_domain = server.url
+    token = CancelToken()
+    threading.Timer(0.2, token.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(CancelledError):
+        api.list_movies(use_cache=False, token=token)
+    assert time.monotonic() - start < 1
+
+
+def test_child_token_follows_its_parent():
+    parent = CancelToken()
+    first, second = parent.child(), parent.child()
+    first.cancel()
+    assert not parent.cancelled
+    parent.cancel()
+    assert second.cancelled
+    assert parent.child().cancelled
+
+
+def test_gets_with_different_headers_are_not_coalesced(stub_server, make_api):
+    def conditional(request):
+        time.sleep(0.3)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return 304, b'', {}
+        return 200, {'status': 'ok'}, {'ETag': '"v1"'}
+
+    server = stub_server({'/list': conditional})
+    api = make_api()
+    results = {}
+    thread = threading.Thread(target=lambda: results.update(
+        conditional=api.http_get(f"{server.url}/list", headers={'If-None-Match': '"v1"'}, timeout=5)))
+    thread.start()
+    time.sleep(0.05)
+    plain = api.http_get(f"{server.url}/list", timeout=5)
+    thread.join()
+
+    assert plain.status_code == 200
+    assert results['conditional'].status_code == 304
+    assert server.count('/list') == 2
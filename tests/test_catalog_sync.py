@@ -0,0 +1,62 @@
+from catalog_sync import CatalogStore, CatalogSync
+
+
+class StubYts:
+    """list_movies over an in-memory catalog; pages in `failing` raise like an unreachable mirror."""
+
+    def __init__(self, count):
+        self.movies = [{'id': i, 'title': f"Movie {i}", 'date_uploaded_unix': 1000 + i} for i in range(1, count + 1)]
+        self.failing = set()
+        self.calls = []
+
+    def list_movies(self, use_cache=True, page=1, limit=50, sort_by='date_added', order_by='desc', **params):
+        self.calls.append((page, order_by))
+        if page in self.failing:
+            raise ConnectionError(f"page {page} failed")
+        ordered = self.movies if order_by == 'asc' else self.movies[::-1]
+        return {'movie_count': len(self.movies), 'movies': ordered[(page - 1) * limit:page * limit]}
+
+
+def make_sync(tmp_path, api):
+    store = CatalogStore(str(tmp_path / "catalog.sqlite3"))
+    return store, CatalogSync(api, store, concurrency=2, rate=0)
+
+
+def test_full_sync_completes_the_mirror(tmp_path):
+    api = StubYts(120)
+    store, sync = make_sync(tmp_path, api)
+    sync.run()
+    assert store.is_complete()
+    assert store.count() == 120
+
+
+def test_failed_pages_are_reported_and_resumed_without_an_incremental_pass(tmp_path):
+    api = StubYts(120)
+    api.failing = {2}
+    store, sync = make_sync(tmp_path, api)
+    messages = []
+    sync.run(lambda done, total, message: messages.append(message))
+
+    assert not store.is_complete()
+    assert store.count() == 70
+    assert any("1 pages failed" in m for m in messages)
+    assert not any(order == 'desc' for _, order in api.calls)
+
+    api.failing.clear()
+    api.calls.clear()
+    sync.run()
+    assert store.is_complete()
+    assert store.count() == 120
+    assert sorted(p for p, order in api.calls if order == 'asc') == [1, 2]   # page 1 for the total, then the missing page
+
+
+def test_incremental_sync_stops_at_the_first_known_movie(tmp_path):
+    api = StubYts(120)
+    store, sync = make_sync(tmp_path, api)
+    sync.run()
+    api.movies += [{'id': i, 'title': f"New {i}", 'date_uploaded_unix': 5000 + i} for i in range(121, 131)]
+    api.calls.clear()
+
+    sync.run()
+    assert store.count() == 130
+    assert api.calls == [(1, 'desc')]
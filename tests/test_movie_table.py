@@ -0,0 +1,60 @@
+import pytest
+
+import movie_table
+from movie_table import MovieTable
+
+
+def movie(movie_id, title, year, rating, genres, qualities, seeds=10):
+    return {
+        'id': movie_id, 'title': title, 'year': year, 'rating': rating, 'genres': genres,
+        'date_uploaded_unix': 1500000000 + movie_id,
+        'torrents': [{'quality': q, 'seeds': seeds} for q in qualities],
+    }
+
+
+MOVIES = [
+    movie(1, "Alien", 1979, 8.5, ['Horror', 'Sci-Fi'], ['720p', '1080p'], seeds=50),
+    movie(2, "Brazil", 1985, 7.9, ['Comedy', 'Sci-Fi'], ['1080p'], seeds=5),
+    movie(3, "Cube", 1997, 7.2, ['Horror', 'Sci-Fi'], ['720p'], seeds=80),
+    movie(4, "Dune", 2021, 8.0, ['Drama', 'Sci-Fi'], ['1080p', '2160p'], seeds=300),
+    movie(5, "Eraserhead", 1977, 7.3, ['Horror'], ['1080p'], seeds=20),
+]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def table(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(movie_table, '_numpy', lambda: None)
+    return MovieTable(MOVIES)
+
+
+def test_select_applies_every_filter(table):
+    assert table.select(genres=('Horror', 'Sci-Fi'), sort_keys=(('id', False),)) == [1, 3]
+    assert table.select(genres=('Sci-Fi',), quality='1080p', min_rating=7.9, sort_keys=(('id', False),)) == [1, 2, 4]
+    assert table.select(min_seeds=20, min_year=1978, max_year=2000, sort_keys=(('id', False),)) == [1, 3]
+    assert table.select(genres=('Western',)) == []
+    assert table.select(quality='3D') == []
+
+
+def test_compound_sort_keys(table):
+    by_genre_then_rating = table.select(sort_keys=(('genre', False), ('rating', True)))
+    # genre text ranks: "comedy, sci-fi" < "drama, sci-fi" < "horror" < "horror, sci-fi"
+    assert by_genre_then_rating == [2, 4, 5, 1, 3]
+    assert table.select(genres=('Horror',), sort_keys=(('title', True),)) == [5, 3, 1]
+
+
+def test_query_uses_list_movies_params(table):
+    assert table.query({'genre': 'Sci-Fi', 'sort_by': 'rating', 'order_by': 'desc'}) == [1, 4, 2, 3]
+    assert table.query({'genre': 'All', 'quality': '720p', 'sort_by': 'year', 'order_by': 'asc'}) == [1, 3]
+
+
+def test_more_than_63_genres_still_filter_exactly(table):
+    many = [movie(100 + n, f"Movie {n}", 2000, 6.0, [f"Genre {n}", 'Shared'], ['720p']) for n in range(70)]
+    table.append(many)
+    assert len(table.genre_bits) > movie_table.INT64_MASK_BITS
+
+    assert table.select(genres=('Genre 69',)) == [169]
+    assert table.select(genres=('Genre 69', 'Shared')) == [169]
+    assert table.select(genres=('Genre 0', 'Genre 69')) == []
+    assert len(table.select(genres=('Shared',), quality='720p')) == 70
+    assert table.select(genres=('Horror', 'Sci-Fi'), sort_keys=(('id', True),)) == [3, 1]
@@ -0,0 +1,45 @@
+import time
+
+import pytest
+
+from rate_limit import HostLimiter, ThrottledError, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+
+def test_acquire_waits_out_a_short_pause():
+    limiter = HostLimiter(max_wait=5)
+    limiter.throttle(0.2)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+    limiter.release()
+
+
+def test_acquire_fails_fast_while_paused_longer_than_max_wait():
+    limiter = HostLimiter(max_wait=5, host="example.org")
+    limiter.throttle(30)
+    start = time.monotonic()
+    with pytest.raises(ThrottledError) as excinfo:
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
+    assert excinfo.value.retry_after > 25
+    assert limiter.in_flight == 0
+
+
+def test_long_retry_after_does_not_block_later_requests(stub_server, make_api):
+    server = stub_server({'/busy': lambda request: (429, b'', {'Retry-After': '30'})})
+    api = make_api()
+
+    first = api.http_get(f"{server.url}/busy", timeout=5)
+    assert first.status_code == 429
+
+    start = time.monotonic()
+    with pytest.raises(ThrottledError):
+        api.http_get(f"{server.url}/busy", timeout=5)
+    assert time.monotonic() - start < 1
+    assert server.count('/busy') == 1
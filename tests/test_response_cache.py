@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+import response_cache
+from response_cache import ResponseCache
+from tmdb_cache import TmdbCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, 'time', clock)
+    return clock
+
+
+def test_entries_go_stale_after_their_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), {'list_movies.json': 60})
+    cache.put('list_movies.json', {'page': 1}, {'movies': [1]})
+
+    clock.now += 59
+    assert cache.get('list_movies.json', {'page': 1}) == ({'movies': [1]}, True)
+    clock.now += 2
+    assert cache.get('list_movies.json', {'page': 1}) == ({'movies': [1]}, False)
+    assert cache.get('list_movies.json', {'page': 2}) == (None, False)
+    stats = cache.stats()
+    assert (stats['hits'], stats['stale_hits'], stats['misses']) == (1, 1, 1)
+    cache.close()
+
+
+def test_byte_cap_evicts_least_recently_read(tmp_path, clock):
+    payload = {'movies': ['x' * 100]}
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_bytes=250)
+    cache.put('list_movies.json', {'page': 1}, payload)
+    clock.now += 1
+    cache.put('list_movies.json', {'page': 2}, payload)
+    clock.now += 1
+    cache.get('list_movies.json', {'page': 1})    # buffered read time, must still count for eviction
+    clock.now += 1
+    cache.put('list_movies.json', {'page': 3}, payload)
+
+    assert cache.get('list_movies.json', {'page': 2})[0] is None
+    assert cache.get('list_movies.json', {'page': 1})[0] == payload
+    assert cache.get('list_movies.json', {'page': 3})[0] == payload
+    assert cache.stats()['evictions'] == 1
+    cache.close()
+
+
+def test_read_times_survive_close(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(path)
+    cache.put('list_movies.json', {'page': 1}, {})
+    clock.now += 10
+    cache.get('list_movies.json', {'page': 1})
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened._conn.execute("SELECT last_access FROM responses").fetchone()[0] == clock.now
+    reopened.close()
+
+
+def test_response_and_tmdb_caches_share_the_file(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    responses, tmdb = ResponseCache(path), TmdbCache(path)
+    assert responses._conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    def write_responses():
+        for n in range(50):
+            responses.put('list_movies.json', {'page': n}, {'n': n})
+
+    def write_tmdb():
+        for n in range(50):
+            tmdb.put(f"tt{n}", n, {'overview': str(n)})
+
+    threads = [threading.Thread(target=write_responses), threading.Thread(target=write_tmdb)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert responses.stats()['entries'] == 50
+    assert tmdb.stats()['entries'] == 50
+    responses.close()
+
+
+def test_stale_entry_is_served_and_revalidated(stub_server, make_api):
+    fresh = {'status': 'ok', 'data': {'movie_count': 1, 'movies': [{'id': 2}]}}
+    server = stub_server({'/api/v2/list_movies.json': lambda request: (200, fresh, {})})
+    api = make_api(domains=[server.url])
+    api.cache.ttls['list_movies.json'] = 0
+    api.cache.put('list_movies.json', {'limit': 50, 'page': 1}, {'movie_count': 1, 'movies': [{'id': 1}]})
+    refreshed = []
+    done = threading.Event()
+
+    data = api.list_movies(on_refresh=lambda new: (refreshed.append(new), done.set()), page=1)
+
+    assert data['movies'] == [{'id': 1}]
+    assert done.wait(5)
+    assert refreshed[0]['movies'] == [{'id': 2}]
+    assert api.cache.get('list_movies.json', {'limit': 50, 'page': 1})[0]['movies'] == [{'id': 2}]
@@ -0,0 +1,50 @@
+from search_index import SearchIndex, tokenize
+
+MOVIES = [
+    {'id': 1, 'title': 'The Matrix', 'year': 1999, 'genres': ['Action', 'Sci-Fi'], 'rating': 8.7,
+     'cast': [{'name': 'Keanu Reeves'}], 'summary': 'A hacker learns the truth.'},
+    {'id': 2, 'title': 'The Matrix Reloaded', 'year': 2003, 'genres': ['Action'], 'rating': 7.2},
+    {'id': 3, 'title': 'Amélie', 'year': 2001, 'genres': ['Comedy', 'Romance'], 'rating': 8.3},
+    {'id': 4, 'title': 'John Wick', 'year': 2014, 'genres': ['Action'], 'rating': 7.4, 'cast': ['Keanu Reeves']},
+]
+
+
+def build():
+    index = SearchIndex()
+    index.build_from(MOVIES, complete=True)
+    return index
+
+
+def ids(results):
+    return [m['id'] for m in results]
+
+
+def test_tokenize_folds_case_and_accents():
+    assert tokenize("Amélie, 2001!") == ['amelie', '2001']
+
+
+def test_exact_prefix_and_fuzzy_matches():
+    index = build()
+    assert ids(index.search("amelie")) == [3]
+    assert set(ids(index.search("matr"))) == {1, 2}
+    assert set(ids(index.search("keanu reevs"))) == {1, 4}
+
+
+def test_all_tokens_must_match_and_title_outranks_summary():
+    index = build()
+    assert ids(index.search("matrix reloaded")) == [2]
+    assert ids(index.search("matrix 1999")) == [1]
+    assert index.search("matrix zzzz") == []
+
+
+def test_predicate_and_limit():
+    index = build()
+    assert set(ids(index.search("action", predicate=lambda m: m['year'] > 2000))) == {2, 4}
+    assert len(index.search("action", limit=1)) == 1
+
+
+def test_readding_keeps_richer_payload():
+    index = build()
+    index.add_many([{'id': 1, 'title': 'The Matrix', 'year': 1999}])
+    assert index.docs[1]['cast'] == [{'name': 'Keanu Reeves'}]
+    assert index.complete and len(index) == 4
@@ -0,0 +1,43 @@
+import json
+
+from torrent_client import SESSION_ID_HEADER, TransmissionClient, pick_torrent
+
+SESSION_ID = "stub-session-1"
+
+
+def transmission_rpc():
+    """A minimal Transmission RPC endpoint: 409 handshake, then torrent-add with duplicate detection."""
+    added = set()
+
+    def handle(request):
+        if request.headers.get(SESSION_ID_HEADER) != SESSION_ID:
+            return 409, b'', {SESSION_ID_HEADER: SESSION_ID}
+        call = json.loads(request.body)
+        magnet = call['arguments']['filename']
+        if magnet in added:
+            return 200, {'result': 'success', 'arguments': {'torrent-duplicate': {'hashString': magnet}}}, {}
+        added.add(magnet)
+        return 200, {'result': 'success', 'arguments': {'torrent-added': {'hashString': magnet}}}, {}
+
+    return handle
+
+
+def test_add_magnets_handles_session_handshake_and_duplicates(stub_server, make_api):
+    server = stub_server({'/transmission/rpc': transmission_rpc()})
+    client = TransmissionClient(make_api(), f"{server.url}/transmission/rpc")
+
+    results = client.add_magnets([("First [1080p]", "magnet:?xt=urn:btih:aaa"),
+                                  ("First again [1080p]", "magnet:?xt=urn:btih:aaa"),
+                                  ("Second [720p]", "magnet:?xt=urn:btih:bbb")])
+
+    assert [r['status'] for r in results] == ['added', 'duplicate', 'added']
+    assert all(r['ok'] for r in results)
+    # One 409 to learn the session id, then one call per magnet on the same session.
+    assert server.count('/transmission/rpc') == 4
+
+
+def test_pick_torrent_prefers_quality_then_seeds():
+    movie = {'torrents': [{'quality': '720p', 'seeds': 50}, {'quality': '2160p', 'seeds': 5}, {'quality': '2160p', 'seeds': 9}]}
+    assert pick_torrent(movie, '2160p')['seeds'] == 9
+    assert pick_torrent(movie)['quality'] == '720p'
+    assert pick_torrent({'torrents': []}) is None
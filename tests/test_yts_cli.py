@@ -0,0 +1,54 @@
+import io
+import json
+
+import pytest
+
+import yts_cli
+
+PROBE_OK = {'status': 'ok', 'data': {'movie_count': 0, 'movies': []}}
+
+
+def list_movies(search_response):
+    """The mirror probe (limit=1, no page) succeeds; real searches get `search_response`."""
+    return lambda request: (200, PROBE_OK, {}) if 'page=' not in request.path else search_response
+
+
+def test_read_ids_skips_bad_values(monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.StringIO('7\n\nnot-an-id\n{"id": 9}\n{"title": "no id"}\n'))
+    bad = []
+    assert list(yts_cli.read_ids(['5', '-'], bad.append)) == [5, 7, 9]
+    assert bad == ['not-an-id', '{"title": "no id"}']
+
+
+def test_read_ids_raises_without_handler():
+    with pytest.raises(ValueError):
+        list(yts_cli.read_ids(['12', 'x']))
+
+
+def test_bad_id_is_skipped_and_fails_the_run(stub_server, make_api, capsys):
+    details = lambda request: (200, {'status': 'ok', 'data': {'movie': {'id': 5, 'title': 'Five'}}}, {})
+    server = stub_server({'/api/v2/movie_details.json': details})
+    make_api(domains=[server.url])
+
+    assert yts_cli.main(['--quiet', 'details', '5', 'five']) == 1
+    out, err = capsys.readouterr()
+    assert [json.loads(line)['id'] for line in out.splitlines()] == [5]
+    assert "skipping 'five'" in err
+
+
+def test_yts_error_status_is_reported(stub_server, make_api, capsys):
+    failing = (200, {'status': 'error', 'status_message': 'Invalid sort_by'}, {})
+    server = stub_server({'/api/v2/list_movies.json': list_movies(failing)})
+    make_api(domains=[server.url])
+
+    assert yts_cli.main(['--quiet', 'search', '--no-cache']) == 1
+    assert "Error: Invalid sort_by" in capsys.readouterr().err
+
+
+def test_undecodable_response_is_reported(stub_server, make_api, capsys):
+    # A mirror answering with something that is not JSON counts as unreachable.
+    server = stub_server({'/api/v2/list_movies.json': list_movies((200, b'<html>', {}))})
+    make_api(domains=[server.url])
+
+    assert yts_cli.main(['--quiet', 'search', '--no-cache']) == 2
+    assert capsys.readouterr().err.startswith("Error: ")
@@ -0,0 +1,43 @@
+import threading
+
+import pytest
+
+from yts_proxy import ProxyServer
+
+NO_CACHE_CONFIG = "[TMDB]\napi_key = test\n[Cache]\nenabled = false\n"
+
+
+@pytest.fixture
+def proxy():
+    servers = []
+
+    def start(api):
+        server = ProxyServer(api, ('127.0.0.1', 0))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_failed_tmdb_lookup_is_a_gateway_error_without_a_cache(stub_server, make_api, proxy):
+    tmdb = stub_server({'/3/find/tt0133093': lambda request: (500, {'status_message': 'boom'}, {})})
+    api = make_api(config=NO_CACHE_CONFIG)
+    api.tmdb_base_url = f"{tmdb.url}/3"
+    assert api.tmdb_cache is None
+
+    response = api.http_get(f"{proxy(api)}/tmdb/tt0133093", timeout=5)
+    assert response.status_code == 502
+
+
+def test_tmdb_no_match_is_answered(stub_server, make_api, proxy):
+    tmdb = stub_server({'/3/find/tt0000001': lambda request: (200, {'movie_results': []}, {})})
+    api = make_api(config=NO_CACHE_CONFIG)
+    api.tmdb_base_url = f"{tmdb.url}/3"
+
+    response = api.http_get(f"{proxy(api)}/tmdb/tt0000001", timeout=5)
+    assert response.status_code == 200
+    assert response.json()['data'] == {'tmdb_id': None, 'extras': None}
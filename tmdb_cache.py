@@ -0,0 +1,69 @@
+import json
+import threading
+import time
+from response_cache import connect_db
+
+# --- TMDB Cache Defaults ---
+DEFAULT_TMDB_TTL = 7 * 24 * 60 * 60
+
+# Sentinel meaning "TMDB has no match for this IMDb code"; cached so the /find call is not repeated.
+NO_MATCH = object()
+
+
+class TmdbCache:
+    """
+    Persistent store of TMDB enrichment keyed by IMDb code.
+
+    Each row keeps the imdb->tmdb id mapping and the extracted extras (trailer key, cast,
+    overview). A row with no tmdb_id is a remembered "no match". Rows older than `ttl`
+    are treated as missing, but the id mapping in them is still offered so a refresh can
+    skip the /find lookup.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TMDB_TTL):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = connect_db(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tmdb ("
+            " imdb_id TEXT PRIMARY KEY, tmdb_id INTEGER, extras TEXT, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, imdb_id):
+        """Returns (extras_or_NO_MATCH_or_None, tmdb_id). extras is None when the entry is missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tmdb_id, extras, fetched_at FROM tmdb WHERE imdb_id = ?", (imdb_id,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None, None
+            tmdb_id, extras, fetched_at = row
+            if time.time() - fetched_at >= self.ttl:
+                self.misses += 1
+                return None, tmdb_id
+            self.hits += 1
+        if tmdb_id is None:
+            return NO_MATCH, None
+        return json.loads(extras) if extras else {}, tmdb_id
+
+    def is_fresh(self, imdb_id):
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at FROM tmdb WHERE imdb_id = ?", (imdb_id,)).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    def put(self, imdb_id, tmdb_id, extras):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tmdb (imdb_id, tmdb_id, extras, fetched_at) VALUES (?, ?, ?, ?)",
+                (imdb_id, tmdb_id, json.dumps(extras) if extras is not None else None, time.time()),
+            )
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM tmdb").fetchone()[0]
+        return {'entries': entries, 'hits': self.hits, 'misses': self.misses}
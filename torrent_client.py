@@ -0,0 +1,102 @@
+import threading
+
+# --- Torrent Client Defaults (overridable in the [TorrentClient] section of config.ini) ---
+DEFAULT_RPC_URL = "http://localhost:9091/transmission/rpc"
+SESSION_ID_HEADER = "X-Transmission-Session-Id"
+RPC_TIMEOUT = 15
+PREFERRED_QUALITIES = ['1080p', '720p', '1080p.x265', '2160p', '480p', '3D']
+
+
+def read_torrent_client_config(config):
+    """[TorrentClient] settings from a parsed config.ini: RPC url, credentials, download dir and preferred quality."""
+    return {
+        'url': config.get('TorrentClient', 'rpc_url', fallback=DEFAULT_RPC_URL) or DEFAULT_RPC_URL,
+        'username': config.get('TorrentClient', 'username', fallback=None) or None,
+        'password': config.get('TorrentClient', 'password', fallback=None) or None,
+        'download_dir': config.get('TorrentClient', 'download_dir', fallback=None) or None,
+        'preferred_quality': config.get('TorrentClient', 'preferred_quality', fallback=None) or None,
+    }
+
+
+def pick_torrent(movie, preferred=None):
+    """Chooses one torrent of a movie for batch actions: the first preferred quality present, else the best-seeded."""
+    torrents = movie.get('torrents') or []
+    if not torrents:
+        return None
+    by_quality = {}
+    for torrent in torrents:
+        current = by_quality.get(torrent.get('quality'))
+        if current is None or (torrent.get('seeds') or 0) > (current.get('seeds') or 0):
+            by_quality[torrent.get('quality')] = torrent
+    for quality in ([preferred] if preferred else []) + PREFERRED_QUALITIES:
+        if quality in by_quality:
+            return by_quality[quality]
+    return max(torrents, key=lambda t: t.get('seeds') or 0)
+
+
+def export_magnets(path, items):
+    """
+    Writes one magnet per line to `path`, each preceded by a `# title [quality]` comment line.
+    `items` are (label, magnet) pairs. Returns the number of magnets written.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        for label, magnet in items:
+            f.write(f"# {label}\n{magnet}\n")
+    return len(items)
+
+
+class TransmissionClient:
+    """
+    Minimal Transmission RPC client for adding magnets in bulk.
+
+    All calls go through the API handler's pooled session for the RPC host, so a batch
+    reuses one keep-alive connection. Transmission answers the first call of a session
+    with 409 and an X-Transmission-Session-Id header; the id is remembered and the call
+    retried once, as the RPC spec requires.
+    """
+
+    def __init__(self, api, url=DEFAULT_RPC_URL, username=None, password=None, timeout=RPC_TIMEOUT):
+        self.api = api
+        self.url = url
+        self.auth = (username, password) if username else None
+        self.timeout = timeout
+        self._session_id = None
+        self._lock = threading.Lock()
+
+    def call(self, method, arguments=None):
+        payload = {'method': method, 'arguments': arguments or {}}
+        for _ in range(2):
+            headers = {SESSION_ID_HEADER: self._session_id} if self._session_id else {}
+            with self.api.metrics.timer('torrent_client', method):
+                response = self.api.http_post(self.url, json=payload, headers=headers, auth=self.auth, timeout=self.timeout)
+            if response.status_code == 409:
+                with self._lock:
+                    self._session_id = response.headers.get(SESSION_ID_HEADER)
+                continue
+            if response.status_code == 401:
+                raise PermissionError("Torrent client rejected the RPC username/password.")
+            response.raise_for_status()
+            return response.json()
+        raise ConnectionError("Torrent client kept rejecting the RPC session id.")
+
+    def add_magnets(self, items, download_dir=None):
+        """
+        Adds (label, magnet) pairs one by one. Returns a result dict per item:
+        {'label', 'ok', 'status'} where status is 'added', 'duplicate' or the error text.
+        """
+        results = []
+        for label, magnet in items:
+            arguments = {'filename': magnet}
+            if download_dir:
+                arguments['download-dir'] = download_dir
+            try:
+                reply = self.call('torrent-add', arguments)
+                if reply.get('result') != 'success':
+                    results.append({'label': label, 'ok': False, 'status': reply.get('result', 'unknown error')})
+                elif 'torrent-duplicate' in reply.get('arguments', {}):
+                    results.append({'label': label, 'ok': True, 'status': 'duplicate'})
+                else:
+                    results.append({'label': label, 'ok': True, 'status': 'added'})
+            except Exception as e:
+                results.append({'label': label, 'ok': False, 'status': str(e)})
+        return results
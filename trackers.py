@@ -0,0 +1,241 @@
+import asyncio
+import json
+import os
+import random
+import socket
+import struct
+import threading
+import time
+from urllib.parse import quote, urlsplit
+from domain_scoreboard import DomainScoreboard
+
+# --- Tracker Configuration ---
+ADDITIONAL_TRACKERS_URL = "https://raw.githubusercontent.com/ngosang/trackerslist/refs/heads/master/trackers_best.txt"
+
+DEFAULT_TRACKERS = [
+    "udp://open.demonii.com:1337/announce", "udp://tracker.openbittrent.com:80",
+    "udp://tracker.coppersfer.tk:6969", "udp://glotorrents.pw:6969/announce",
+    "udp://tracker.opentrackr.org:1337/announce", "udp://p4p.arenabg.com:1337",
+]
+
+TRACKER_LIST_FILE = "trackers_cache.json"
+TRACKER_STATS_FILE = "tracker_stats.json"
+# Overridable in the [Trackers] section of config.ini (TTLs in hours there).
+DEFAULT_LIST_TTL = 24 * 60 * 60         # re-check the online tracker list once a day
+DEFAULT_PROBE_INTERVAL = 6 * 60 * 60    # re-probe tracker health this often
+DEFAULT_MAGNET_TRACKERS = 10            # trackers put into each magnet link
+PROBE_TIMEOUT = 5.0
+PROBE_CONCURRENCY = 32
+
+# --- BEP 15 (UDP tracker protocol) ---
+UDP_PROTOCOL_ID = 0x41727101980
+UDP_ACTION_CONNECT = 0
+
+
+def read_tracker_config(config):
+    """[Trackers] settings from a parsed config.ini, as TrackerManager keyword arguments."""
+    settings = {'list_ttl': DEFAULT_LIST_TTL, 'probe_interval': DEFAULT_PROBE_INTERVAL, 'magnet_count': DEFAULT_MAGNET_TRACKERS}
+    try:
+        settings['list_ttl'] = int(config.getfloat('Trackers', 'list_ttl_hours', fallback=DEFAULT_LIST_TTL / 3600) * 3600)
+        settings['probe_interval'] = int(config.getfloat('Trackers', 'probe_interval_hours', fallback=DEFAULT_PROBE_INTERVAL / 3600) * 3600)
+        settings['magnet_count'] = config.getint('Trackers', 'magnet_count', fallback=DEFAULT_MAGNET_TRACKERS)
+    except ValueError as e:
+        print(f"Error reading [Trackers] settings: {e}")
+    return settings
+
+
+def build_magnet(info_hash, name, trackers):
+    """Builds a magnet URI with the display name and every tracker URL properly percent-encoded."""
+    magnet = f"magnet:?xt=urn:btih:{info_hash}&dn={quote(name, safe='')}"
+    return magnet + ''.join(f"&tr={quote(tracker, safe='')}" for tracker in trackers)
+
+
+class _UdpConnectProtocol(asyncio.DatagramProtocol):
+    """Resolves `future` when the tracker answers our BEP 15 connect request."""
+
+    def __init__(self, transaction_id, future):
+        self.transaction_id = transaction_id
+        self.future = future
+
+    def datagram_received(self, data, addr):
+        if len(data) >= 16 and not self.future.done():
+            action, transaction_id = struct.unpack('>II', data[:8])
+            if action == UDP_ACTION_CONNECT and transaction_id == self.transaction_id:
+                self.future.set_result(True)
+
+    def error_received(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+class TrackerManager:
+    """
+    Tracker list, tracker health and magnet-link tracker selection.
+
+    The online list is cached in TRACKER_LIST_FILE and re-checked after `list_ttl` with a
+    conditional GET (If-None-Match / If-Modified-Since), so an unchanged list costs a 304.
+    Trackers are probed concurrently on the API's asyncio loop: UDP trackers with the BEP 15
+    connect handshake, HTTP(S) trackers with a minimal announce. Outcomes and response times
+    go into a DomainScoreboard persisted in TRACKER_STATS_FILE, and `best()` returns the
+    fastest trackers that answered their latest probe.
+    """
+
+    def __init__(self, api, list_url, defaults, path=TRACKER_LIST_FILE, stats_path=TRACKER_STATS_FILE,
+                 list_ttl=DEFAULT_LIST_TTL, probe_interval=DEFAULT_PROBE_INTERVAL, magnet_count=DEFAULT_MAGNET_TRACKERS,
+                 log=print):
+        self.api = api
+        self.log = log
+        self.list_url = list_url
+        self.defaults = list(defaults)
+        self.path = path
+        self.list_ttl = list_ttl
+        self.probe_interval = probe_interval
+        self.magnet_count = magnet_count
+        self.health = DomainScoreboard(stats_path)
+        self._lock = threading.Lock()
+        self._state = {'trackers': [], 'etag': None, 'last_modified': None, 'fetched_at': 0, 'probed_at': 0}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self._state.update(json.load(f))
+        except (json.JSONDecodeError, OSError) as e:
+            self.log(f"Ignoring unreadable tracker cache: {e}")
+
+    def _save(self):
+        with self._lock:
+            state = dict(self._state)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.log(f"Could not save tracker cache: {e}")
+
+    @property
+    def trackers(self):
+        """Default trackers plus the cached online list, without duplicates, in a stable order."""
+        with self._lock:
+            online = list(self._state['trackers'])
+        return list(dict.fromkeys(self.defaults + online))
+
+    def refresh_list(self):
+        """Re-downloads the tracker list if the cached copy is older than the TTL. Returns True if it changed."""
+        if time.time() - self._state['fetched_at'] < self.list_ttl and self._state['trackers']:
+            return False
+        headers = {}
+        if self._state.get('etag'):
+            headers['If-None-Match'] = self._state['etag']
+        if self._state.get('last_modified'):
+            headers['If-Modified-Since'] = self._state['last_modified']
+        try:
+            with self.api.metrics.timer('trackers', 'list'):
+                response = self.api.http_get(self.list_url, headers=headers, timeout=10)
+        except Exception as e:
+            self.log(f"Tracker list download failed, using cached copy: {e}")
+            return False
+
+        changed = False
+        with self._lock:
+            if response.status_code == 200:
+                trackers = [line.strip() for line in response.text.split('\n') if line.strip()]
+                changed = trackers != self._state['trackers']
+                self._state['trackers'] = trackers
+                self._state['etag'] = response.headers.get('ETag')
+                self._state['last_modified'] = response.headers.get('Last-Modified')
+                self._state['fetched_at'] = time.time()
+            elif response.status_code == 304:
+                self._state['fetched_at'] = time.time()
+            else:
+                self.log(f"Tracker list request returned HTTP {response.status_code}, using cached copy.")
+                return False
+        self._save()
+        return changed
+
+    def update(self, force_probe=False):
+        """Background entry point: refresh the list, then re-probe if it changed or the last probe is old."""
+        changed = self.refresh_list()
+        if force_probe or changed or time.time() - self._state['probed_at'] >= self.probe_interval:
+            self.probe_all()
+
+    def probe_all(self, timeout=PROBE_TIMEOUT):
+        """Probes every known tracker concurrently; blocks until done. Returns {url: latency or None}."""
+        urls = self.trackers
+        results = self.api.io.run(self._probe_many(urls, timeout))
+        with self._lock:
+            self._state['probed_at'] = time.time()
+        self._save()
+        self.health.save(force=True)
+        alive = sum(1 for latency in results.values() if latency is not None)
+        self.log(f"Tracker probe: {alive}/{len(urls)} trackers answered.")
+        return results
+
+    async def _probe_many(self, urls, timeout):
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+        async def bounded(url):
+            async with semaphore:
+                return url, await self._probe(url, timeout)
+
+        return dict(await asyncio.gather(*(bounded(url) for url in urls)))
+
+    async def _probe(self, url, timeout):
+        scheme = urlsplit(url).scheme.lower()
+        start = time.monotonic()
+        try:
+            if scheme == 'udp':
+                await asyncio.wait_for(self._probe_udp(url), timeout)
+            elif scheme in ('http', 'https'):
+                await asyncio.wait_for(self._probe_http(url, timeout), timeout + 1)
+            else:
+                return None   # e.g. wss:// WebTorrent trackers, which BitTorrent clients can't use anyway
+        except Exception:
+            self.health.record_failure(url)
+            self.api.metrics.observe('trackers', scheme, time.monotonic() - start, ok=False)
+            return None
+        latency = time.monotonic() - start
+        self.health.record_success(url, latency)
+        self.api.metrics.observe('trackers', scheme, latency)
+        return latency
+
+    @staticmethod
+    async def _probe_udp(url):
+        parts = urlsplit(url)
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(parts.hostname, parts.port or 80, type=socket.SOCK_DGRAM)
+        address = infos[0][4]
+        future = loop.create_future()
+        transaction_id = random.getrandbits(32)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _UdpConnectProtocol(transaction_id, future), remote_addr=address)
+        try:
+            transport.sendto(struct.pack('>QII', UDP_PROTOCOL_ID, UDP_ACTION_CONNECT, transaction_id))
+            await future
+        finally:
+            transport.close()
+
+    async def _probe_http(self, url, timeout):
+        params = {
+            'info_hash': os.urandom(20), 'peer_id': b'-YM0001-' + os.urandom(12), 'port': 6881,
+            'uploaded': 0, 'downloaded': 0, 'left': 0, 'compact': 1, 'numwant': 0,
+        }
+        response = await self.api.io.run_blocking(self.api.http_get, url, params=params, timeout=timeout)
+        # Any tracker reply (usually a bencoded "unregistered torrent" failure) proves it is alive.
+        if response.status_code != 200:
+            raise ConnectionError(f"HTTP {response.status_code}")
+
+    def best(self, count=None):
+        """The fastest trackers whose latest probe succeeded; unprobed lists fall back to list order."""
+        count = count or self.magnet_count
+        trackers = self.trackers
+        live = [t for t in self.health.ranked(trackers) if self.health.is_live(t)]
+        if not live:
+            return trackers[:count]
+        return live[:count]
+
+    def magnet(self, info_hash, name):
+        return build_magnet(info_hash, name, self.best())
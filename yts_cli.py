@@ -0,0 +1,218 @@
+"""
+Headless YTS explorer: the same APIHandler (pooled sessions, caches, mirror selection)
+without Tk, streaming JSON Lines to stdout so it can run from cron or a pipeline.
+
+    python yts_cli.py search --genre Drama --min-rating 7 --max-pages 5 > drama.jsonl
+    python yts_cli.py details 15553 15554 --tmdb
+    python yts_cli.py search --query matrix | python yts_cli.py magnets - --quality 2160p
+
+Progress and diagnostics go to stderr; stdout only ever carries one JSON object per line.
+Exit status: 0 on success, 1 on a YTS/API error or when input ids had to be skipped, 2 when no
+mirror could be reached.
+"""
+import argparse
+import itertools
+import json
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from api_handler import APIHandler
+from trackers import TrackerManager, ADDITIONAL_TRACKERS_URL, DEFAULT_TRACKERS, read_tracker_config
+from torrent_client import pick_torrent, read_torrent_client_config
+
+# --- CLI Defaults ---
+PAGE_SIZE = 50
+DEFAULT_CONCURRENCY = 8      # matches the per-host connection pool (pool_maxsize)
+
+
+def log_to_stderr(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def iter_search(api, max_pages=None, use_cache=True, **params):
+    """
+    Yields list_movies records page by page. Page N+1 is already being fetched while page N
+    is consumed, and at most those two pages are held in memory.
+    """
+    def fetch(page):
+        return api.list_movies(use_cache=use_cache, page=page, limit=PAGE_SIZE, **params)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cli-pages") as pool:
+        page = 1
+        future = pool.submit(fetch, page)
+        while future is not None:
+            data = future.result()
+            movies = data.get('movies') or []
+            more = bool(movies) and page * PAGE_SIZE < data.get('movie_count', 0) and (max_pages is None or page < max_pages)
+            future = pool.submit(fetch, page + 1) if more else None
+            page += 1
+            yield from movies
+
+
+def iter_bounded(fn, items, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Applies `fn` to `items` with at most `concurrency` calls in flight, reading `items` lazily.
+    Yields (item, result, error) in completion order.
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cli-batch") as pool:
+        pending = {pool.submit(fn, item): item for item in itertools.islice(items, concurrency)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in itertools.islice(items, 1):
+                    pending[pool.submit(fn, next_item)] = next_item
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+
+def iter_details(api, ids, concurrency=DEFAULT_CONCURRENCY, with_tmdb=False):
+    """Yields full movie details for `ids` (TMDB extras merged in if asked); failures yield {'id', 'error'}."""
+    def load(movie_id):
+        movie = (api.get_movie_details(movie_id) or {}).get('movie')
+        if not movie:
+            raise LookupError("movie not found")
+        if with_tmdb and movie.get('imdb_code'):
+            movie.update(api.get_tmdb_details(movie['imdb_code']) or {})
+        return movie
+
+    for movie_id, movie, error in iter_bounded(load, ids, concurrency):
+        yield movie if error is None else {'id': movie_id, 'error': str(error)}
+
+
+def iter_magnets(api, trackers, ids, concurrency=DEFAULT_CONCURRENCY, quality=None, all_qualities=False):
+    """Yields {'id', 'title', 'quality', 'hash', 'magnet'} per chosen torrent of each movie id."""
+    for movie in iter_details(api, ids, concurrency):
+        if 'error' in movie:
+            yield movie
+            continue
+        if all_qualities:
+            torrents = movie.get('torrents') or []
+        else:
+            chosen = pick_torrent(movie, quality)
+            torrents = [chosen] if chosen else []
+        if not torrents:
+            yield {'id': movie['id'], 'error': 'no torrents'}
+        for torrent in torrents:
+            yield {
+                'id': movie['id'], 'title': movie.get('title'), 'quality': torrent.get('quality'),
+                'hash': torrent['hash'], 'magnet': trackers.magnet(torrent['hash'], movie.get('title', '')),
+            }
+
+
+def _parse_id(value):
+    if value.startswith('{'):
+        return int(json.loads(value)['id'])
+    return int(value)
+
+
+def read_ids(values, on_bad_id=None):
+    """
+    Movie ids from the command line, or from stdin for '-' (plain ids or JSONL records with an 'id').
+    A value that is not an id is passed to `on_bad_id` and skipped, so one bad line does not end
+    a long pipeline; without `on_bad_id` it raises ValueError.
+    """
+    def lines():
+        for value in values:
+            if value != '-':
+                yield value
+                continue
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+
+    for value in lines():
+        try:
+            movie_id = _parse_id(value)
+        except (ValueError, KeyError, TypeError):
+            if on_bad_id is None:
+                raise ValueError(f"not a movie id: {value!r}")
+            on_bad_id(value)
+            continue
+        yield movie_id
+
+
+def write_jsonl(records):
+    count = 0
+    for record in records:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    sys.stdout.flush()
+    return count
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Headless YTS explorer with JSON Lines output.")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="max requests in flight for batches")
+    parser.add_argument('--quiet', action='store_true', help="suppress progress messages on stderr")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    search = sub.add_parser('search', help="stream list_movies results")
+    search.add_argument('--query', dest='query_term')
+    search.add_argument('--genre')
+    search.add_argument('--quality')
+    search.add_argument('--min-rating', dest='minimum_rating', type=int)
+    search.add_argument('--sort-by', default='date_added')
+    search.add_argument('--order-by', default='desc', choices=['asc', 'desc'])
+    search.add_argument('--max-pages', type=int)
+    search.add_argument('--no-cache', action='store_true', help="always ask YTS, bypassing the response cache")
+
+    details = sub.add_parser('details', help="full details for movie ids ('-' reads ids from stdin)")
+    details.add_argument('ids', nargs='+')
+    details.add_argument('--tmdb', action='store_true', help="merge TMDB cast/trailer/overview")
+
+    magnets = sub.add_parser('magnets', help="magnet links for movie ids ('-' reads ids from stdin)")
+    magnets.add_argument('ids', nargs='+')
+    magnets.add_argument('--quality', help="preferred quality (falls back to the best-seeded torrent)")
+    magnets.add_argument('--all-qualities', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    log = (lambda message: None) if args.quiet else log_to_stderr
+    bad_ids = []
+
+    def skip_bad_id(value):
+        # Warnings are shown even with --quiet: the run's output is missing these.
+        log_to_stderr(f"Warning: skipping {value!r}, not a movie id")
+        bad_ids.append(value)
+
+    api = APIHandler(log=log)
+    try:
+        if args.command == 'search':
+            params = {k: getattr(args, k) for k in ('query_term', 'genre', 'quality', 'minimum_rating') if getattr(args, k)}
+            records = iter_search(api, max_pages=args.max_pages, use_cache=not args.no_cache,
+                                  sort_by=args.sort_by, order_by=args.order_by, **params)
+        elif args.command == 'details':
+            records = iter_details(api, read_ids(args.ids, skip_bad_id), args.concurrency, with_tmdb=args.tmdb)
+        else:
+            trackers = TrackerManager(api, ADDITIONAL_TRACKERS_URL, DEFAULT_TRACKERS, log=log, **read_tracker_config(api.config))
+            trackers.refresh_list()
+            preferred_quality = read_torrent_client_config(api.config)['preferred_quality']
+            records = iter_magnets(api, trackers, read_ids(args.ids, skip_bad_id), args.concurrency,
+                                   quality=args.quality or preferred_quality, all_qualities=args.all_qualities)
+        count = write_jsonl(records)
+        log(f"{count} records written.")
+        # Skipped ids leave the output incomplete; say so in the exit status.
+        return 1 if bad_ids else 0
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); that's a normal way to stop.
+        sys.stderr.close()
+        return 0
+    except ConnectionError as e:
+        log_to_stderr(f"Error: {e}")
+        return 2
+    except Exception as e:
+        # YTS answering with status != ok, an undecodable response, ...
+        log_to_stderr(f"Error: {e}")
+        return 1
+    finally:
+        api.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,29 @@
+import time
+STARTUP_T0 = time.perf_counter()   # taken before any other import so the startup report covers them
 import tkinter as tk
-from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from tkinter import ttk, messagebox, filedialog
 import threading
 import webbrowser
-import urllib.parse
-import io
 import json
 import configparser
 import sys
-import requests
 from api_handler import APIHandler
+from concurrency import CancelledError
+from poster_cache import DecodedImageLRU
+from poster_decoder import PosterDecoder
+from prefetch import NeighborPrefetcher, PageHistory
+from catalog_sync import CatalogStore, CatalogSync, CATALOG_DB_FILE, read_catalog_config
+from search_index import SearchIndex
+from movie_model import MovieModel
+from movie_table import MovieTable
 import resources
+from startup_report import StartupTimer, print_history
+from trackers import TrackerManager, ADDITIONAL_TRACKERS_URL, DEFAULT_TRACKERS, read_tracker_config
+from torrent_client import TransmissionClient, export_magnets, pick_torrent, read_torrent_client_config
+from metrics import LagMonitor, DEFAULT_STALL_THRESHOLD_MS, export_json, format_report, hit_rate
+
+startup_timer = StartupTimer(STARTUP_T0)
+startup_timer.mark('imports')
 
 # --- Visual Constants (Dark Mode) ---
 COLOR_BG_DARK = "#2b2b2b"
@@ -27,13 +40,6 @@ FONT_HEADER = ('Segoe UI', 12, 'bold')
 BASE_GEOMETRY = "1100x700"
 YTS_DOMAINS_FILE = "yts_domains.json"
 APP_CONFIG_FILE = "config.ini"
-ADDITIONAL_TRACKERS_URL = "https://raw.githubusercontent.com/ngosang/trackerslist/refs/heads/master/trackers_best.txt"
-
-DEFAULT_TRACKERS = [
-    "udp://open.demonii.com:1337/announce", "udp://tracker.openbittrent.com:80",
-    "udp://tracker.coppersfer.tk:6969", "udp://glotorrents.pw:6969/announce",
-    "udp://tracker.opentrackr.org:1337/announce", "udp://p4p.arenabg.com:1337",
-]
 
 # --- API Filter Options ---
 GENRES = ['All', 'Action', 'Adventure', 'Animation', 'Biography', 'Comedy', 'Crime', 'Documentary', 'Drama', 'Family', 'Fantasy', 'Film-Noir', 'History', 'Horror', 'Music', 'Musical', 'Mystery', 'Romance', 'Sci-Fi', 'Sport', 'Thriller', 'War', 'Western']
@@ -41,6 +47,16 @@ QUALITIES = ['All', '480p', '720p', '1080p', '1080p.x265', '2160p', '3D']
 RATINGS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
 SORT_BY = ['date_added', 'like_count', 'download_count', 'peers', 'seeds', 'rating', 'year', 'title']
 
+POSTER_MAX_HEIGHT = 250
+POSTER_WIDTH_STEP = 40       # panel widths are bucketed so small resizes reuse decoded posters
+PREFETCH_IDLE_DELAY_MS = 120
+SEARCH_AS_YOU_TYPE_DELAY_MS = 80
+
+# --- Results List ---
+RESULTS_PAGE_SIZE = 50       # YTS list_movies page size
+VIRTUAL_ROW_HEIGHT = 20      # fallback when the theme does not report a Treeview rowheight
+LOAD_AHEAD_ROWS = 25         # infinite scroll fetches the next page once the viewport is this close to the end
+
 # --- Helper: Tooltip Class (Fixed Indentation) ---
 class ToolTip(object):
     def __init__(self, widget, text='widget info'):
@@ -87,6 +103,123 @@ class ToolTip(object):
         if tw:
             tw.destroy()
 
+# --- Helper: Pooled Torrent Card ---
+class TorrentCard(object):
+    """One reusable row of the Downloads tab. update() only reconfigures labels whose text changed."""
+    def __init__(self, parent, on_download):
+        self.frame = ttk.Frame(parent, style="Card.TFrame", relief="solid", borderwidth=1)
+        self.checked = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.frame, variable=self.checked, style="Card.TCheckbutton").pack(side=tk.LEFT, padx=(5, 0))
+        self.lbl_quality = ttk.Label(self.frame, text="", font=FONT_BOLD, background=COLOR_BG_LIGHT, width=15)
+        self.lbl_quality.pack(side=tk.LEFT, padx=5, pady=5)
+        self.lbl_size = ttk.Label(self.frame, text="", background=COLOR_BG_LIGHT)
+        self.lbl_size.pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.frame, text="⬇ Download", style="Accent.TButton",
+                   command=lambda: on_download(self.torrent, self.title)).pack(side=tk.RIGHT, padx=5, pady=2)
+        self.torrent = None
+        self.title = None
+        self.visible = False
+        self._texts = {}
+
+    def update(self, torrent, title):
+        if self.torrent is None or self.torrent.get('hash') != torrent.get('hash'):
+            self.checked.set(False)
+        self.torrent = torrent
+        self.title = title
+        self._set_text(self.lbl_quality, f"{torrent['quality']}  {torrent['type'].upper()}")
+        self._set_text(self.lbl_size, torrent['size'])
+
+    def _set_text(self, label, text):
+        if self._texts.get(label) != text:
+            label.config(text=text)
+            self._texts[label] = text
+
+    def show(self):
+        if not self.visible:
+            self.frame.pack(fill=tk.X, pady=2)
+            self.visible = True
+
+    def hide(self):
+        if self.visible:
+            self.frame.pack_forget()
+            self.visible = False
+
+# --- Batch Results Window ---
+class BatchResultWindow(tk.Toplevel):
+    def __init__(self, parent, target, results):
+        super().__init__(parent)
+        self.title("Batch Results")
+        self.geometry("520x400")
+        self.transient(parent)
+        self.configure(bg=COLOR_BG_DARK)
+
+        ok = sum(1 for r in results if r['ok'])
+        ttk.Label(self, text=f"{ok} of {len(results)} torrents sent to {target}", background=COLOR_BG_DARK, foreground=COLOR_TEXT).pack(padx=10, pady=10)
+
+        text = tk.Text(self, wrap="word", bg=COLOR_LIST_BG, fg=COLOR_TEXT, font=('Consolas', 10))
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        for r in results:
+            text.insert(tk.END, f"{'✔' if r['ok'] else '✖'} {r['label']} — {r['status']}\n")
+        text.config(state="disabled")
+
+        button_frame = ttk.Frame(self, padding=10, style="Dark.TFrame")
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+
+# --- Diagnostics Window ---
+class DiagnosticsWindow(tk.Toplevel):
+    """
+    Live diagnostics. `collect(done)` gathers the report off the Tk thread (the cache stats run
+    SQLite queries) and calls `done(report)` back on it; the next refresh is only scheduled once
+    that report has been shown, so slow collections never pile up.
+    """
+    REFRESH_MS = 1000
+
+    def __init__(self, parent, collect):
+        super().__init__(parent)
+        self.title("Diagnostics")
+        self.geometry("640x560")
+        self.transient(parent)
+        self.collect = collect
+        self.report = None
+        self.configure(bg=COLOR_BG_DARK)
+
+        self.text = tk.Text(self, wrap="none", bg=COLOR_LIST_BG, fg=COLOR_TEXT, font=('Consolas', 10))
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        button_frame = ttk.Frame(self, padding=10, style="Dark.TFrame")
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Export JSON...", command=self._on_export).pack(side=tk.RIGHT)
+        self._refresh()
+
+    def _refresh(self):
+        if self.winfo_exists():
+            self.collect(self._show)
+
+    def _show(self, report):
+        if not self.winfo_exists():
+            return
+        self.report = report
+        text = format_report(report)
+        top = self.text.yview()[0]
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, text)
+        self.text.config(state="disabled")
+        self.text.yview_moveto(top)
+        self.after(self.REFRESH_MS, self._refresh)
+
+    def _on_export(self):
+        path = filedialog.asksaveasfilename(parent=self, title="Export diagnostics", defaultextension=".json",
+                                            initialfile="yts_diagnostics.json", filetypes=[("JSON", "*.json"), ("All files", "*.*")])
+        if not path or self.report is None:
+            return
+        try:
+            export_json(path, self.report)
+        except OSError as e:
+            messagebox.showerror("Export Failed", str(e), parent=self)
+
 # --- Editor Windows ---
 class ApiKeyEditorWindow(tk.Toplevel):
     def __init__(self, parent, callback):
@@ -193,6 +326,7 @@ class MovieApp:
 
         self.api = APIHandler()
         self.movies_cache = []
+        self.movies_by_id = {}
         self.current_movie_details = None
         self.current_page = 1
         self.total_movie_count = 0
@@ -200,25 +334,74 @@ class MovieApp:
         self._resize_job = None
         self.last_sort = {'col': None, 'rev': False}
         self.current_poster_data = None
-        
-        self.all_trackers = list(DEFAULT_TRACKERS)
-        threading.Thread(target=self._fetch_additional_trackers, daemon=True).start()
+        self.current_poster_url = None
+        self.current_search_params = None
+        self.poster_images = DecodedImageLRU(self.api.poster_memory_max_bytes)
+        self.poster_decoder = PosterDecoder(self.poster_images, metrics=self.api.metrics)
+        stall_threshold_ms = self._read_setting(self.api.config.getint, 'Diagnostics', 'stall_threshold_ms', DEFAULT_STALL_THRESHOLD_MS)
+        self.lag_monitor = LagMonitor(self.root, self.api.metrics, threshold_ms=stall_threshold_ms)
+        self.poster_box = (0, POSTER_MAX_HEIGHT)
+        self.prefetcher = NeighborPrefetcher(self._prefetch_movie)
+        self._prefetch_job = None
+        self._detail_handle = None
+        self._poster_handle = None
+        self._poster_requested_url = None
+        self._detail_parts = {}
+        self._torrent_cards = []
+        self._widget_state = {}
+        self._trailer_key = None
+        self.torrent_client = None
+        self.torrent_settings = read_torrent_client_config(self.api.config)
+        self.page_history = PageHistory()
+        self.catalog_settings = read_catalog_config(self.api.config)
+        self.catalog = CatalogStore(CATALOG_DB_FILE)
+        self.catalog_sync = CatalogSync(self.api, self.catalog, self.catalog_settings['concurrency'], self.catalog_settings['rate'])
+        self.search_index = SearchIndex()
+        self._index_requested = False
+        self._index_ready = threading.Event()
+        self._index_lock = threading.Lock()
+        self._typing_job = None
+        self.model = MovieModel()
+        self.results_table = MovieTable()
+        self.movie_table = None
+        self.view_offset = 0
+        self._loading_more = False
+        self._scroll_generation = 0
+        self._search_generation = 0
+        self._search_handle = None
+        self.trackers = TrackerManager(self.api, ADDITIONAL_TRACKERS_URL, DEFAULT_TRACKERS, **read_tracker_config(self.api.config))
 
         self._setup_dark_theme()
         self._setup_ui()
-        self._on_search()
+        for var in (self.search_term, self.genre, self.quality, self.rating, self.sort_by, self.order_by):
+            var.trace_add('write', lambda *args: self.page_history.invalidate_speculative())
         self.details_frame.bind('<Configure>', self._on_panel_resize)
+        startup_timer.mark('ui_built')
+        # Let Tk map and paint the window before any network or index work starts.
+        self.root.after_idle(self.root.after, 0, self._on_window_painted)
+
+    def _on_window_painted(self):
+        startup_timer.mark('first_paint')
+        self.lag_monitor.start()
+        # Mirror selection and the tracker list download run side by side; the first search
+        # shares the in-flight mirror probe instead of starting its own.
+        threading.Thread(target=self._warm_up_network, daemon=True).start()
+        threading.Thread(target=self._update_trackers, daemon=True).start()
+        self.api.submit(self._load_movie_table)
+        self._on_search()
 
-    def _fetch_additional_trackers(self):
+    def _warm_up_network(self):
         try:
-            response = requests.get(ADDITIONAL_TRACKERS_URL, timeout=10)
-            if response.status_code == 200:
-                new_trackers = [line.strip() for line in response.text.split('\n') if line.strip()]
-                combined = set(self.all_trackers)
-                combined.update(new_trackers)
-                self.all_trackers = list(combined)
-        except:
-            pass
+            self.api.warm_up()
+        finally:
+            startup_timer.mark('domain_ready')
+
+    def _update_trackers(self):
+        """Refreshes the cached tracker list (conditional GET) and re-ranks trackers when due."""
+        try:
+            self.trackers.update()
+        except Exception as e:
+            print(f"Tracker update failed: {e}")
 
     def _setup_dark_theme(self):
         style = ttk.Style()
@@ -242,6 +425,8 @@ class MovieApp:
         style.map("TCombobox", fieldbackground=[('readonly', '#444444')])
         style.configure("TCheckbutton", background=COLOR_BG_DARK, foreground=COLOR_TEXT)
         style.map("TCheckbutton", background=[('active', COLOR_BG_DARK)])
+        style.configure("Card.TCheckbutton", background=COLOR_BG_LIGHT, foreground=COLOR_TEXT)
+        style.map("Card.TCheckbutton", background=[('active', COLOR_BG_LIGHT)])
         style.configure("Treeview", background=COLOR_LIST_BG, foreground=COLOR_TEXT, fieldbackground=COLOR_LIST_BG, borderwidth=0, font=('Segoe UI', 10))
         style.configure("Treeview.Heading", background=COLOR_BG_LIGHT, foreground=COLOR_TEXT, font=FONT_BOLD, relief="flat")
         style.map("Treeview.Heading", background=[('active', '#444444')])
@@ -281,6 +466,7 @@ class MovieApp:
         self.search_term = tk.StringVar()
         s_ent = add_filter("Search:", self.search_term, is_combo=False)
         s_ent.bind("<Return>", lambda e: self._on_search())
+        s_ent.bind("<KeyRelease>", self._on_search_key)
         
         self.genre = tk.StringVar(value='All')
         add_filter("Genre:", self.genre, GENRES)
@@ -296,6 +482,9 @@ class MovieApp:
         
         self.order_by = tk.StringVar(value='desc')
         ttk.Checkbutton(frame, text="Ascending Order", variable=self.order_by, onvalue='asc', offvalue='desc', style="TCheckbutton").pack(fill=tk.X, pady=10)
+
+        self.infinite_mode = tk.BooleanVar(value=self._read_setting(self.api.config.getboolean, 'Display', 'infinite_scroll', False))
+        ttk.Checkbutton(frame, text="Infinite Scroll", variable=self.infinite_mode, command=self._on_search, style="TCheckbutton").pack(fill=tk.X)
         
         try:
             search_icon = resources.get_icon("search", 16, 16)
@@ -308,6 +497,11 @@ class MovieApp:
         ttk.Separator(frame, orient='horizontal').pack(fill='x', pady=15)
         ttk.Button(frame, text="⚙ Settings / API", command=self._open_api_key_editor).pack(fill=tk.X, pady=2)
         ttk.Button(frame, text="🌐 Domains", command=self._open_domain_editor).pack(fill=tk.X, pady=2)
+        ttk.Button(frame, text="📈 Diagnostics", command=self._open_diagnostics).pack(fill=tk.X, pady=2)
+        self.sync_btn = ttk.Button(frame, text="📚 Sync Catalog", command=self._on_sync_catalog)
+        self.sync_btn.pack(fill=tk.X, pady=2)
+        self.sync_status = ttk.Label(frame, text="", style="Sub.TLabel", wraplength=180)
+        self.sync_status.pack(fill=tk.X, pady=(5, 0))
         return frame
 
     def _create_center_panel(self, parent):
@@ -316,12 +510,13 @@ class MovieApp:
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
         columns = ("title", "year", "rating", "genre")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode="browse")
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode="extended")
         
-        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self._on_yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
+        self.tree_vsb = vsb
         
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=hsb.set)
         
         self.tree.heading("title", text="Title", command=lambda: self._sort_column("title"))
         self.tree.heading("year", text="Year", command=lambda: self._sort_column("year"))
@@ -337,6 +532,11 @@ class MovieApp:
         hsb.pack(side=tk.BOTTOM, fill=tk.X)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.tree.bind("<<TreeviewSelect>>", self._on_movie_select)
+        self.tree.bind("<Configure>", lambda e: self.infinite_mode.get() and self._render_viewport())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_virtual_wheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_virtual_key)
         
         self.status_label = ttk.Label(tree_frame, text="Loading...", font=('Segoe UI', 14), background=COLOR_LIST_BG, foreground="white", anchor='center')
         
@@ -358,6 +558,11 @@ class MovieApp:
         
         self.btn_next = ttk.Button(nav_frame, text="Next ", command=self._next_page, state=tk.DISABLED, image=next_icon, compound=tk.RIGHT)
         self.btn_next.pack(side=tk.RIGHT)
+
+        batch_frame = ttk.Frame(frame, padding=(5, 0, 5, 5), style="Dark.TFrame")
+        batch_frame.pack(fill=tk.X)
+        ttk.Button(batch_frame, text="💾 Export Magnets", command=lambda: self._export_batch(self._batch_items_from_results())).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 2))
+        ttk.Button(batch_frame, text="➜ Send to Client", command=lambda: self._send_batch(self._batch_items_from_results())).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(2, 0))
         
         return frame
 
@@ -413,6 +618,11 @@ class MovieApp:
         self.notebook.add(self.tab_down, text='  Downloads  ')
         
         ttk.Label(self.tab_down, text="Available Torrents:", style="Header.TLabel", background=COLOR_BG_LIGHT).pack(anchor="w", pady=(0,10))
+
+        dl_actions = ttk.Frame(self.tab_down, style="Card.TFrame")
+        dl_actions.pack(fill=tk.X, pady=(0, 5))
+        ttk.Button(dl_actions, text="💾 Export Checked", command=lambda: self._export_batch(self._batch_items_from_cards())).pack(side=tk.LEFT)
+        ttk.Button(dl_actions, text="➜ Send Checked", command=lambda: self._send_batch(self._batch_items_from_cards())).pack(side=tk.LEFT, padx=5)
         
         canvas = tk.Canvas(self.tab_down, bg=COLOR_BG_LIGHT, highlightthickness=0)
         sb = ttk.Scrollbar(self.tab_down, orient="vertical", command=canvas.yview)
@@ -424,6 +634,7 @@ class MovieApp:
         canvas.configure(yscrollcommand=sb.set)
         sb.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.lbl_no_torrents = ttk.Label(self.dl_scroll_frame, text="No torrents found.", background=COLOR_BG_LIGHT)
         
         self.tab_specs = ttk.Frame(self.notebook, style="Card.TFrame", padding=10)
         self.notebook.add(self.tab_specs, text='  Specs  ')
@@ -440,77 +651,400 @@ class MovieApp:
     def _open_api_key_editor(self):
         ApiKeyEditorWindow(self.root, callback=self._on_api_key_updated)
 
+    def _open_diagnostics(self):
+        DiagnosticsWindow(self.root, collect=self._collect_diagnostics)
+
+    def _collect_diagnostics(self, done):
+        """
+        APIHandler diagnostics (gathered on the worker pool) plus the GUI-side caches, workers
+        and event-loop lag (added on the Tk thread); `done(report)` is called on the Tk thread.
+        """
+        def collect(token=None):
+            try:
+                report = self.api.get_diagnostics()
+            except Exception as e:
+                print(f"Collecting diagnostics failed: {e}")
+                report = {'caches': {}, 'in_flight': {}}
+            self.root.after(0, lambda: done(self._add_gui_diagnostics(report)))
+
+        self.api.submit(collect)
+
+    def _add_gui_diagnostics(self, report):
+        for name, stats in (('posters_memory', self.poster_images.stats()), ('page_history', self.page_history.stats()),
+                            ('prefetch', self.prefetcher.stats())):
+            report['caches'][name] = dict(stats, hit_rate=hit_rate(stats))
+        report['in_flight']['poster_decoder'] = self.poster_decoder.stats()
+        report['in_flight']['prefetch'] = {k: v for k, v in self.prefetcher.stats().items() if k in ('pending', 'in_progress')}
+        report['ui'] = {'worst_lag_ms': round(self.lag_monitor.worst_ms, 1), 'stall_threshold_ms': self.lag_monitor.threshold_ms}
+        report['startup'] = dict(startup_timer.marks)
+        return report
+
     def _on_domains_updated(self):
         self.api.reload_yts_domains()
         messagebox.showinfo("Updated", "Domains updated.")
 
+    def _read_setting(self, read, section, option, fallback):
+        """One GUI-only config.ini value (e.g. [Display]); a malformed value falls back to the default."""
+        try:
+            return read(section, option, fallback=fallback)
+        except ValueError as e:
+            print(f"Error reading [{section}] {option}: {e}")
+            return fallback
+
     def _on_api_key_updated(self):
         self.api.reload_app_config()
+        self.catalog_settings = read_catalog_config(self.api.config)
+        self.torrent_settings = read_torrent_client_config(self.api.config)
+        self.torrent_client = None
+
+    # --- Batch Actions ---
+    def _batch_item(self, title, torrent):
+        return f"{title} [{torrent['quality']}]", self.trackers.magnet(torrent['hash'], title)
+
+    def _batch_items_from_results(self):
+        """One (label, magnet) per selected result row, using the preferred quality of each movie."""
+        items = []
+        for iid in self.tree.selection():
+            movie = self._list_record(int(iid)) or {}
+            torrent = pick_torrent(movie, self.torrent_settings['preferred_quality'])
+            if torrent:
+                items.append(self._batch_item(movie.get('title', 'Unknown'), torrent))
+        return items
+
+    def _batch_items_from_cards(self):
+        return [self._batch_item(card.title, card.torrent) for card in self._torrent_cards if card.visible and card.checked.get()]
+
+    def _export_batch(self, items):
+        if not items:
+            messagebox.showinfo("Batch", "Select movies in the list (Ctrl/Shift-click) or tick torrents in the Downloads tab first.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Magnets", defaultextension=".txt",
+                                            filetypes=[("Magnet list", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            count = export_magnets(path, items)
+            messagebox.showinfo("Export", f"Wrote {count} magnet links to:\n{path}")
+        except OSError as e:
+            messagebox.showerror("Export", str(e))
+
+    def _send_batch(self, items):
+        if not items:
+            messagebox.showinfo("Batch", "Select movies in the list (Ctrl/Shift-click) or tick torrents in the Downloads tab first.")
+            return
+        if self.torrent_client is None:
+            settings = self.torrent_settings
+            self.torrent_client = TransmissionClient(self.api, settings['url'], settings['username'], settings['password'])
+        self.api.submit(self._run_send_batch, self.torrent_client, items)
+
+    def _run_send_batch(self, client, items, token=None):
+        results = client.add_magnets(items, self.torrent_settings['download_dir'])
+        self.root.after(0, lambda: BatchResultWindow(self.root, client.url, results))
 
     def _sort_column(self, col):
-        items = [(self.tree.set(k, col), k) for k in self.tree.get_children('')]
-        
-        def get_sort_key(item):
-            value = item[0]
-            if col in ['year', 'rating']:
-                try:
-                    return float(value)
-                except:
-                    return 0.0
-            return value.lower()
-            
         reverse = self.last_sort['col'] == col and not self.last_sort['rev']
         self.last_sort = {'col': col, 'rev': reverse}
-        items.sort(key=get_sort_key, reverse=reverse)
-        
-        for index, (val, k) in enumerate(items):
-            self.tree.move(k, '', index)
+        if self.infinite_mode.get():
+            self._sort_model()
+            self._render_viewport()
+            return
+        # Sort on the columnar copy of the page, then reorder the tree in a single call.
+        ids = self.results_table.select(sort_keys=[(col, reverse)])
+        self.tree.set_children('', *[str(i) for i in ids if self.tree.exists(str(i))])
+
+    def _sort_model(self):
+        """Applies the current column sort to every loaded row of the infinite-scroll model."""
+        col = self.last_sort['col']
+        if col:
+            self.model.reorder(self.results_table.select(sort_keys=[(col, self.last_sort['rev'])]))
 
     def _on_panel_resize(self, event):
         self.lbl_title.config(wraplength=event.width - 20)
+        # Posters only need re-fitting once the panel is narrower than the poster height.
+        available = event.width - 20
+        box = (0 if available >= POSTER_MAX_HEIGHT else max(POSTER_WIDTH_STEP, available // POSTER_WIDTH_STEP * POSTER_WIDTH_STEP), POSTER_MAX_HEIGHT)
+        if box == self.poster_box:
+            return
+        self.poster_box = box
         if self._resize_job:
             self.root.after_cancel(self._resize_job)
         self._resize_job = self.root.after(300, self._resize_poster_job)
 
     def _resize_poster_job(self):
+        self._resize_job = None
         if self.current_poster_data:
-            self._apply_poster_image(self.current_poster_data)
+            self._apply_poster_image(self.current_poster_url, self.current_poster_data)
     
+    def _build_search_params(self, page):
+        params = {'page': page, 'sort_by': self.sort_by.get(), 'order_by': self.order_by.get()}
+        if self.search_term.get():
+            params['query_term'] = self.search_term.get()
+        if self.genre.get() != 'All':
+            params['genre'] = self.genre.get()
+        if self.quality.get() != 'All':
+            params['quality'] = self.quality.get()
+        if self.rating.get() > 0:
+            params['minimum_rating'] = self.rating.get()
+        return params
+
+    def _supersede_search(self):
+        """
+        Starts a new search generation: the search still in flight (if any) is cancelled and its
+        results are dropped if they arrive anyway. Returns True if there was one.
+        """
+        self._search_generation += 1
+        handle, self._search_handle = self._search_handle, None
+        if handle is None:
+            return False
+        in_flight = not handle.done()
+        handle.cancel()
+        return in_flight
+
     def _on_search(self, page=1):
+        params = self._build_search_params(page)
+        if self._typing_job:
+            self.root.after_cancel(self._typing_job)
+            self._typing_job = None
+        was_searching = self._supersede_search()
         self.current_page = page
+        self.current_search_params = params
         self.last_selected_movie_id = None
+        self._cancel_detail_work()
+        self._scroll_generation += 1
+        self._loading_more = False
+
+        # --- PAGE HISTORY: swap instantly when this page was already seen or fetched ahead ---
+        cached_page = self.page_history.get(params, page)
+        if cached_page is not None:
+            self.page_history.mark_seen(params, page)
+            if was_searching:
+                self._set_ui_state(tk.NORMAL)
+            self.total_movie_count = cached_page.get('movie_count', 0)
+            self._update_results_list(cached_page.get('movies', []))
+            self._prefetch_adjacent_pages(params)
+            return
+
         self._set_ui_state(tk.DISABLED)
         self.tree.delete(*self.tree.get_children())
+        self.model.clear()
         
         self.status_label.config(text="Searching YTS...", background=COLOR_LIST_BG)
         self.status_label.place(relx=0.5, rely=0.5, anchor='center', relwidth=1.0, relheight=1.0)
         self.status_label.lift()
         
-        threading.Thread(target=self._perform_search, daemon=True).start()
-    
-    def _perform_search(self):
+        self._search_handle = self.api.submit(self._perform_search, params, self._search_generation)
+
+    def _perform_search(self, params, generation, token=None):
+        """Worker side of a search: fetches the page and hands it to the Tk thread, tagged with its generation."""
         try:
-            params = {'page': self.current_page, 'sort_by': self.sort_by.get(), 'order_by': self.order_by.get()}
-            if self.search_term.get():
-                params['query_term'] = self.search_term.get()
-            if self.genre.get() != 'All':
-                params['genre'] = self.genre.get()
-            if self.quality.get() != 'All':
-                params['quality'] = self.quality.get()
-            if self.rating.get() > 0:
-                params['minimum_rating'] = self.rating.get()
-            
-            data = self.api.list_movies(**params)
-            self.total_movie_count = data.get('movie_count', 0)
-            self.root.after(0, self._update_results_list, data.get('movies', []))
+            data = self._list_movies(params, on_refresh=lambda d, p=params: self.root.after(0, self._on_list_revalidated, p, d), token=token)
+            self.page_history.put(params, params['page'], data)
+        except CancelledError:
+            raise
         except Exception as e:
-            self.root.after(0, self._show_error, str(e))
+            self.root.after(0, self._on_search_failed, generation, str(e))
+            return
+        self.root.after(0, self._apply_search_results, params, generation, data)
+
+    def _apply_search_results(self, params, generation, data):
+        if generation != self._search_generation:
+            return   # a newer search has started since; its own results will follow
+        self._search_handle = None
+        self.total_movie_count = data.get('movie_count', 0)
+        self._update_results_list(data.get('movies', []))
+        self._set_ui_state(tk.NORMAL)
+        self._prefetch_adjacent_pages(params)
+
+    def _on_search_failed(self, generation, message):
+        if generation != self._search_generation:
+            return
+        self._search_handle = None
+        self._show_error(message)
+        self._set_ui_state(tk.NORMAL)
+
+    def _ensure_search_index(self):
+        """
+        Starts seeding the local search index the first time a search needs it, rather than at
+        startup: indexing a full catalog mirror is seconds of pure Python holding the GIL.
+        Returns True once the index is built; until then searches go to the mirror or YTS.
+        """
+        if self._index_ready.is_set():
+            return True
+        with self._index_lock:
+            if not self._index_requested:
+                self._index_requested = True
+                self.api.submit(self._build_search_index)
+        return False
+
+    def _build_search_index(self, token=None):
+        """Seeds the local search index from the catalog mirror (if any) and from cached YTS pages."""
+        self.search_index.build_from(self.catalog.iter_payloads(), complete=self.catalog.is_complete())
+        if self.api.cache:
+            for payload in self.api.cache.iter_payloads('list_movies.json'):
+                self.search_index.add_many((payload or {}).get('movies') or [])
+        self._index_ready.set()
+
+    def _load_movie_table(self, token=None):
+        if self.catalog.is_complete():
+            self._build_movie_table()
+
+    def _build_movie_table(self):
+        """Loads the complete catalog mirror into a columnar table for millisecond local filtering and sorting."""
+        self.movie_table = MovieTable(self.catalog.iter_payloads())
+
+    def _table_page(self, params):
+        """Answers a list_movies query from the in-memory catalog table; payloads come from the mirror by id."""
+        ids = self.movie_table.query(params)
+        page = params.get('page', 1)
+        start = (page - 1) * RESULTS_PAGE_SIZE
+        movies = self.catalog.get_many(ids[start:start + RESULTS_PAGE_SIZE])
+        return {'movie_count': len(ids), 'page_number': page, 'limit': RESULTS_PAGE_SIZE, 'movies': movies}
+
+    def _on_search_key(self, event):
+        if event.keysym in ('Return', 'KP_Enter', 'Tab', 'Up', 'Down', 'Left', 'Right', 'Home', 'End'):
+            return
+        if self._typing_job:
+            self.root.after_cancel(self._typing_job)
+        self._typing_job = self.root.after(SEARCH_AS_YOU_TYPE_DELAY_MS, self._on_search_typed)
+
+    def _on_search_typed(self):
+        """
+        Search-as-you-type: answers from the local index once it covers the whole catalog; until
+        then typing waits for Return and the YTS API. Clearing the box brings back the unfiltered list.
+        """
+        self._typing_job = None
+        if not self.search_term.get().strip():
+            if self.current_search_params and self.current_search_params.get('query_term'):
+                self._on_search()
+            return
+        if not self._ensure_search_index() or not self.search_index.complete:
+            return
+        params = self._build_search_params(1)
+        data = self._local_search(params)
+        if self._supersede_search():
+            self._set_ui_state(tk.NORMAL)
+        self.current_page = 1
+        self.current_search_params = params
+        self.last_selected_movie_id = None
+        self._cancel_detail_work()
+        self._scroll_generation += 1
+        self._loading_more = False
+        self.total_movie_count = data['movie_count']
+        self._update_results_list(data['movies'])
+
+    def _local_search(self, params):
+        """Runs a list_movies-style query against the local index and returns the same response shape."""
+        genre = params.get('genre')
+        quality = params.get('quality')
+        min_rating = params.get('minimum_rating', 0)
+
+        def matches_filters(movie):
+            if genre and genre not in (movie.get('genres') or []):
+                return False
+            if quality and not any(t.get('quality') == quality for t in movie.get('torrents') or []):
+                return False
+            return (movie.get('rating') or 0) >= min_rating
+
+        results = self.search_index.search(params.get('query_term', ''), predicate=matches_filters)
+        if (params.get('sort_by', 'date_added'), params.get('order_by', 'desc')) != ('date_added', 'desc'):
+            # The default sort keeps the relevance ranking; an explicit one sorts like the mirror table does.
+            by_id = {m['id']: m for m in results}
+            results = [by_id[i] for i in MovieTable(results).query({'sort_by': params.get('sort_by'), 'order_by': params.get('order_by')})]
+        page = params.get('page', 1)
+        start = (page - 1) * RESULTS_PAGE_SIZE
+        return {'movie_count': len(results), 'page_number': page, 'limit': RESULTS_PAGE_SIZE, 'movies': results[start:start + RESULTS_PAGE_SIZE]}
+
+    def _list_movies(self, params, on_refresh=None, token=None):
+        """Serves a results page from the local catalog mirror once it is complete, else from YTS (mirror as fallback)."""
+        if params.get('query_term') and self._ensure_search_index() and self.search_index.complete:
+            return self._local_search(params)
+        if self.catalog_settings['prefer_local'] and self.catalog.is_complete():
+            if self.movie_table is not None and not params.get('query_term'):
+                return self._table_page(params)
+            return self.catalog.query(**params)
+        try:
+            data = self.api.list_movies(on_refresh=on_refresh, token=token, **params)
+            self.search_index.add_many(data.get('movies') or [])
+            return data
+        except ConnectionError:
+            if self.catalog.count():
+                return self.catalog.query(**params)
+            raise
+
+    def _on_sync_catalog(self):
+        if self.catalog_sync.running:
+            self.catalog_sync.stop()
+            self.sync_btn.config(text="📚 Sync Catalog")
+            return
+        self.sync_btn.config(text="■ Stop Sync")
+        threading.Thread(target=self._run_catalog_sync, daemon=True).start()
+
+    def _run_catalog_sync(self):
+        def progress(done, total, message):
+            self.root.after(0, lambda: self.sync_status.config(text=f"{message} {done}/{total}" if total > 1 else message))
+        try:
+            self.catalog_sync.run(progress)
+            if self.catalog.is_complete():
+                if self._index_requested:   # otherwise the first search indexes the complete mirror
+                    self.search_index.build_from(self.catalog.iter_payloads(), complete=True)
+                self._build_movie_table()
+        except Exception as e:
+            message = f"Sync interrupted: {e}"   # `e` is unbound once the except block ends
+            self.root.after(0, lambda: self.sync_status.config(text=message))
         finally:
-            self.root.after(0, self._set_ui_state, tk.NORMAL)
+            self.root.after(0, lambda: self.sync_btn.config(text="📚 Sync Catalog"))
+
+    def _prefetch_adjacent_pages(self, params):
+        """Speculatively fetches page N+1 (and N-1 if it has dropped out of history) for the current filters."""
+        page = params['page']
+        targets = []
+        if page * RESULTS_PAGE_SIZE < self.total_movie_count:
+            targets.append(page + 1)
+        if page > 1:
+            targets.append(page - 1)
+        generation = self.page_history.generation
+        for target in targets:
+            if not self.page_history.contains(params, target):
+                target_params = dict(params, page=target)
+                self.api.submit(self._fetch_speculative_page, target_params, generation)
+
+    def _fetch_speculative_page(self, params, generation, token=None):
+        try:
+            data = self._list_movies(params, token=token)
+            self.page_history.put(params, params['page'], data, speculative=True, generation=generation)
+        except CancelledError:
+            raise
+        except Exception as e:
+            print(f"Speculative fetch of page {params['page']} failed: {e}")
+
+    def _on_list_revalidated(self, params, data):
+        """Swaps in a background-refreshed results page, keeping the current selection if it is still listed."""
+        if params != self.current_search_params:
+            return
+        self.page_history.put(params, params['page'], data)
+        if self.infinite_mode.get():
+            # Rows already scrolled into the model stay put; the refreshed page is used on the next search.
+            return
+        selected = self.tree.selection()
+        self.total_movie_count = data.get('movie_count', 0)
+        self._update_results_list(data.get('movies', []))
+        if selected and self.tree.exists(selected[0]):
+            self.tree.selection_set(selected[0])
+            self.tree.focus(selected[0])
+            self.tree.see(selected[0])
 
     def _update_results_list(self, movies):
+        if not startup_timer.saved:
+            startup_timer.mark('first_results')
+            self.root.after_idle(startup_timer.save)
         self.tree.delete(*self.tree.get_children())
         self.movies_cache = movies
+        self.movies_by_id = {m['id']: m for m in movies}
+        self.results_table = MovieTable(movies)
+        if self.infinite_mode.get():
+            self._reset_infinite_list(movies)
+            return
+        self.model.clear()
         
         if not movies:
             self._clear_all_details()
@@ -530,72 +1064,341 @@ class MovieApp:
                 first = self.tree.get_children()[0]
                 self.tree.selection_set(first)
                 self.tree.focus(first)
+            self.api.enrich_page_in_background(movies)
+        self._update_pagination()
+
+    # --- Infinite Scroll: a compact model plus a viewport's worth of Treeview items ---
+    def _reset_infinite_list(self, movies):
+        self.movies_by_id = {}
+        self.model.clear()
+        self.model.append_page(movies, self.total_movie_count)
+        self._sort_model()
+        self.view_offset = 0
+        if not movies:
+            self._clear_all_details()
+            self.status_label.config(text="No movies found.")
+            self.status_label.lift()
+        else:
+            self.status_label.place_forget()
+            self._render_viewport()
+            first = str(self.model.records[0].id)
+            self.tree.selection_set(first)
+            self.tree.focus(first)
+            self.api.enrich_page_in_background(movies)
         self._update_pagination()
+
+    def _visible_row_count(self):
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or VIRTUAL_ROW_HEIGHT)
+        except (tk.TclError, ValueError):
+            row_height = VIRTUAL_ROW_HEIGHT
+        # One row's worth of height goes to the headings.
+        return max(1, self.tree.winfo_height() // row_height - 1)
+
+    def _list_record(self, movie_id):
+        """The list_movies payload for a row, from the current page or the infinite-scroll model."""
+        return self.movies_by_id.get(movie_id) or self.model.payload(movie_id)
+
+    def _render_viewport(self):
+        """Materializes only the model rows in view, moving/inserting/deleting as few items as possible."""
+        visible = self._visible_row_count()
+        self.view_offset = max(0, min(self.view_offset, len(self.model) - visible))
+        wanted = [str(r.id) for r in self.model.window(self.view_offset, visible)]
+        current = self.tree.get_children()
+        if list(current) != wanted:
+            keep = set(wanted)
+            stale = [iid for iid in current if iid not in keep]
+            if stale:
+                self.tree.delete(*stale)
+            for position, record in enumerate(self.model.window(self.view_offset, visible)):
+                iid = str(record.id)
+                if self.tree.exists(iid):
+                    self.tree.move(iid, '', position)
+                else:
+                    self.tree.insert('', position, iid=iid, values=record.values())
+            selected = str(self.last_selected_movie_id)
+            if self.last_selected_movie_id is not None and self.tree.exists(selected) and selected not in self.tree.selection():
+                self.tree.selection_add(selected)
+        total = max(1, len(self.model))
+        self.tree_vsb.set(self.view_offset / total, min(1.0, (self.view_offset + visible) / total))
+        self._maybe_load_more(visible)
+
+    def _on_tree_yscroll(self, first, last):
+        if not self.infinite_mode.get():
+            self.tree_vsb.set(first, last)
+
+    def _on_yview(self, *args):
+        if not self.infinite_mode.get():
+            return self.tree.yview(*args)
+        if args[0] == 'moveto':
+            self.view_offset = int(float(args[1]) * len(self.model))
+        elif args[0] == 'scroll':
+            step = self._visible_row_count() if args[2] == 'pages' else 1
+            self.view_offset += int(args[1]) * step
+        self._render_viewport()
+
+    def _on_virtual_wheel(self, event):
+        if not self.infinite_mode.get():
+            return None
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self._on_yview('scroll', -3, 'units')
+        else:
+            self._on_yview('scroll', 3, 'units')
+        return "break"
+
+    def _on_virtual_key(self, event):
+        """Keyboard navigation over the whole model, scrolling the viewport when the cursor leaves it."""
+        if not self.infinite_mode.get() or not len(self.model):
+            return None
+        selection = self.tree.selection()
+        row = self.model.row_of(int(selection[0])) if selection else self.model.row_of(self.last_selected_movie_id)
+        row = row if row is not None else self.view_offset
+        visible = self._visible_row_count()
+        moves = {'Up': row - 1, 'Down': row + 1, 'Prior': row - visible, 'Next': row + visible, 'Home': 0, 'End': len(self.model) - 1}
+        row = max(0, min(len(self.model) - 1, moves[event.keysym]))
+        if row < self.view_offset:
+            self.view_offset = row
+        elif row >= self.view_offset + visible:
+            self.view_offset = row - visible + 1
+        self._render_viewport()
+        iid = str(self.model.records[row].id)
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
+
+    def _maybe_load_more(self, visible):
+        if self._loading_more or not self.model.has_more or self.current_search_params is None:
+            return
+        if self.view_offset + visible + LOAD_AHEAD_ROWS < len(self.model):
+            return
+        self._loading_more = True
+        params = dict(self.current_search_params, page=self.model.pages_loaded + 1)
+        self.api.submit(self._fetch_more, params, self._scroll_generation)
+
+    def _fetch_more(self, params, generation, token=None):
+        try:
+            data = self.page_history.get(params, params['page'])
+            if data is None:
+                data = self._list_movies(params, token=token)
+                self.page_history.put(params, params['page'], data)
+        except Exception as e:
+            print(f"Loading page {params['page']} failed: {e}")
+            data = None
+        self.root.after(0, self._append_more, params, data, generation)
+
+    def _append_more(self, params, data, generation):
+        if generation != self._scroll_generation or not self.infinite_mode.get():
+            return
+        self._loading_more = False
+        if data is None:
+            return
+        movies = data.get('movies') or []
+        self.total_movie_count = data.get('movie_count', self.total_movie_count)
+        self.model.append_page(movies, self.total_movie_count)
+        self.results_table.append(movies)
+        self._sort_model()
+        self.api.enrich_page_in_background(movies)
+        self._update_pagination()
+        self._render_viewport()
+        self._prefetch_adjacent_pages(params)
     
     def _on_movie_select(self, event=None):
         selection = self.tree.selection()
         if not selection:
             return
-        movie_id = int(selection[0])
+        # With several rows selected (for batch actions) the details follow the focused row.
+        focused = self.tree.focus()
+        iid = focused if focused in selection else selection[0]
+        movie_id = int(iid)
         if movie_id == self.last_selected_movie_id:
             return
         
         self.last_selected_movie_id = movie_id
-        self._clear_all_details()
-        self.lbl_title.config(text="Loading Details...")
+        self._cancel_detail_work()
+        self._schedule_prefetch(iid)
+
+        ready = self.prefetcher.take(movie_id)
+        if ready:
+            self.current_movie_details = ready
+            self._populate_all_details(ready)
+            return
+
+        # --- CACHE LOGIC: render the list record right away, then patch in YTS/TMDB fields as they arrive ---
+        cached_movie = self._list_record(movie_id)
+        self._detail_parts = {'movie_id': movie_id, 'list': cached_movie or {}}
+        if cached_movie:
+            self.current_movie_details = dict(cached_movie)
+            self._populate_all_details(self.current_movie_details)
+        else:
+            self._clear_all_details()
+            self._set_widget(self.lbl_title, text="Loading Details...")
+        self._detail_handle = self.api.submit(self._load_movie_details, movie_id, cached_movie)
+
+    def _cancel_detail_work(self):
+        """Drops detail/poster work for the previous selection before it uses a worker or any bandwidth."""
+        for handle in (self._detail_handle, self._poster_handle):
+            if handle:
+                handle.cancel()
+        self._detail_handle = None
+        self._poster_handle = None
+        self._poster_requested_url = None
+
+    def _schedule_prefetch(self, iid):
+        # Wait for the selection to settle so prefetching never competes with the UI thread mid-scroll.
+        if self._prefetch_job:
+            self.root.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.root.after(PREFETCH_IDLE_DELAY_MS, self._run_prefetch, iid)
+
+    def _run_prefetch(self, iid):
+        self._prefetch_job = None
+        if self.infinite_mode.get():
+            row = self.model.row_of(int(iid))
+            if row is not None:
+                self.prefetcher.on_selection(self.model.ids(), row)
+            return
+        rows = self.tree.get_children()
+        if iid in rows:
+            self.prefetcher.on_selection([int(r) for r in rows], rows.index(iid))
+
+    def _prefetch_movie(self, movie_id):
+        """Prefetcher loader: full details plus a decoded poster, without touching any widget."""
+        return self._fetch_full_details(movie_id, self._list_record(movie_id))
+
+    def _fetch_full_details(self, movie_id, cached_movie, on_refresh=None, token=None, on_part=None):
+        """
+        Fetches YTS details, TMDB extras and the poster concurrently on the API's asyncio engine.
+        Returns the merged movie dict (with the poster already decoded into the image LRU), or None.
+        """
+        cached_movie = cached_movie or {}
+        bundle = self.api.io.run(self.api.fetch_movie_bundle(
+            movie_id,
+            imdb_code=cached_movie.get('imdb_code'),
+            poster_url=cached_movie.get('large_cover_image'),
+            on_refresh=on_refresh,
+            token=token,
+            on_part=on_part,
+        ))
+        yts = bundle['details']
+        if not yts:
+            if cached_movie:
+                movie = dict(cached_movie)
+            else:
+                return None
+        else:
+            movie = yts['movie']
+
+        if token:
+            token.raise_if_cancelled()
         
-        # --- CACHE LOGIC ---
-        cached_movie = next((m for m in self.movies_cache if m['id'] == movie_id), None)
-        threading.Thread(target=self._load_movie_details, args=(movie_id, cached_movie), daemon=True).start()
+        # TMDB Enhance
+        tmdb_extras = bundle['tmdb']
+        if tmdb_extras:
+            movie.update(tmdb_extras)
+
+        poster_url = cached_movie.get('large_cover_image') or movie.get('large_cover_image')
+        if bundle['poster'] and poster_url:
+            try:
+                self.poster_decoder.decode(poster_url, bundle['poster'], self.poster_box)
+            except Exception:
+                pass
+        
+        # --- FALLBACK DESCRIPTION LOGIC ---
+        if cached_movie:
+            if not movie.get('description_full') and not movie.get('description_intro'):
+                if cached_movie.get('summary'):
+                    movie['description_full'] = cached_movie['summary']
+                elif cached_movie.get('synopsis'):
+                    movie['description_full'] = cached_movie['synopsis']
+        return movie
     
-    def _load_movie_details(self, movie_id, cached_movie):
-        try:
-            yts = self.api.get_movie_details(movie_id)
-            if not yts:
-                if cached_movie:
-                    movie = cached_movie
-                else:
-                    return
-            else:
-                movie = yts['movie']
+    def _load_movie_details(self, movie_id, cached_movie, token=None):
+        def on_part(name, value):
+            if name == 'details' and value.get('movie'):
+                self.root.after(0, self._patch_details, movie_id, 'details', value['movie'])
+            elif name == 'tmdb':
+                self.root.after(0, self._patch_details, movie_id, 'tmdb', value)
 
-            if self.last_selected_movie_id != movie['id']:
+        try:
+            movie = self._fetch_full_details(
+                movie_id, cached_movie,
+                on_refresh=lambda data: self.root.after(0, self._on_details_revalidated, movie_id, data),
+                token=token,
+                on_part=on_part,
+            )
+            if not movie or self.last_selected_movie_id != movie['id']:
                 return
-            
-            # TMDB Enhance
-            imdb = movie.get('imdb_code')
-            tmdb_extras = self.api.get_tmdb_details(imdb)
-            if tmdb_extras:
-                movie.update(tmdb_extras)
-            
-            # --- FALLBACK DESCRIPTION LOGIC ---
-            if cached_movie:
-                if not movie.get('description_full') and not movie.get('description_intro'):
-                    if cached_movie.get('summary'):
-                        movie['description_full'] = cached_movie['summary']
-                    elif cached_movie.get('synopsis'):
-                        movie['description_full'] = cached_movie['synopsis']
 
+            self.prefetcher.store(movie_id, movie)
+            self.search_index.add_many([movie])
             self.current_movie_details = movie
             self.root.after(0, self._populate_all_details, movie)
         except Exception:
             pass
 
+    def _patch_details(self, movie_id, part, fields):
+        """Merges a newly arrived part (YTS details or TMDB extras) into the panel of the still-selected movie."""
+        if self.last_selected_movie_id != movie_id or self._detail_parts.get('movie_id') != movie_id:
+            return
+        self._detail_parts[part] = fields
+        parts = self._detail_parts
+        # TMDB extras win over YTS details, which win over the list record (same precedence as the final merge).
+        merged = {**parts.get('list', {}), **parts.get('details', {}), **parts.get('tmdb', {})}
+        self.current_movie_details = merged
+        self._populate_all_details(merged)
+
+    def _on_details_revalidated(self, movie_id, data):
+        """Patches a background-refreshed YTS details payload into the panel; TMDB extras and the poster are kept."""
+        movie = (data or {}).get('movie')
+        if not movie or self.last_selected_movie_id != movie_id:
+            return
+        self._patch_details(movie_id, 'details', movie)
+        if self._detail_parts.get('movie_id') == movie_id:
+            self.prefetcher.store(movie_id, self.current_movie_details)
+
+    def _set_widget(self, widget, **options):
+        """Reconfigures `widget` only if `options` differ from what it was last given."""
+        if self._widget_state.get(widget) != options:
+            widget.config(**options)
+            self._widget_state[widget] = options
+
+    def _set_story_text(self, text):
+        if self._widget_state.get(self.story_text) == text:
+            return
+        self.story_text.config(state="normal")
+        self.story_text.delete("1.0", tk.END)
+        self.story_text.insert(tk.END, text)
+        self.story_text.config(state="disabled")
+        self._widget_state[self.story_text] = text
+
+    def _show_torrents(self, torrents, title):
+        """Fills pooled torrent cards in order, creating cards only when a movie has more torrents than ever before."""
+        while len(self._torrent_cards) < len(torrents or ()):
+            self._torrent_cards.append(TorrentCard(self.dl_scroll_frame, self._download_torrent))
+        for i, card in enumerate(self._torrent_cards):
+            if torrents and i < len(torrents):
+                card.update(torrents[i], title)
+                card.show()
+            else:
+                card.hide()
+        if torrents is not None and not torrents:
+            self.lbl_no_torrents.pack(pady=10)
+        else:
+            self.lbl_no_torrents.pack_forget()
+
+    def _open_trailer(self):
+        if self._trailer_key:
+            webbrowser.open(f"https://www.youtube.com/watch?v={self._trailer_key}")
+
     def _populate_all_details(self, movie):
-        self.lbl_title.config(text=movie.get('title', 'No Title'))
+        self._set_widget(self.lbl_title, text=movie.get('title', 'No Title'))
         run_time = f"{movie.get('runtime', 0)} min" if movie.get('runtime') else "N/A"
         meta_text = f"{movie.get('year', 'N/A')}  |  {movie.get('rating', 0)}/10 ★  |  {run_time}"
-        self.lbl_meta.config(text=meta_text)
-        
-        self.story_text.config(state="normal")
-        self.story_text.delete("1.0", tk.END)
+        self._set_widget(self.lbl_meta, text=meta_text)
         
         desc = movie.get('description_full') or movie.get('description_intro') or movie.get('summary') or movie.get('synopsis')
         if not desc:
             desc = "No synopsis available (Try adding a TMDB API key in Settings)."
-        
-        self.story_text.insert(tk.END, desc)
-        self.story_text.config(state="disabled")
+        self._set_story_text(desc)
 
         cast = movie.get('cast')
         if cast:
@@ -603,72 +1406,72 @@ class MovieApp:
                 names = [a.get('name', '') for a in cast]
             else:
                 names = cast
-            self.lbl_cast.config(text="Starring: " + ", ".join(names[:5]))
+            self._set_widget(self.lbl_cast, text="Starring: " + ", ".join(names[:5]))
         else:
-            self.lbl_cast.config(text="Starring: N/A")
+            self._set_widget(self.lbl_cast, text="Starring: N/A")
 
-        if 'trailer_key' in movie:
-            self.trailer_btn.config(state="normal", command=lambda: webbrowser.open(f"https://www.youtube.com/watch?v={movie['trailer_key']}"))
+        self._trailer_key = movie.get('trailer_key')
+        if self._trailer_key:
+            self._set_widget(self.trailer_btn, state="normal", command=self._open_trailer)
         else:
-            self.trailer_btn.config(state="disabled")
+            self._set_widget(self.trailer_btn, state="disabled")
 
-        for w in self.dl_scroll_frame.winfo_children():
-            w.destroy()
-            
         torrents = movie.get('torrents', [])
-        if torrents:
-            for t in torrents:
-                card = ttk.Frame(self.dl_scroll_frame, style="Card.TFrame", relief="solid", borderwidth=1)
-                card.pack(fill=tk.X, pady=2)
-                
-                lbl = ttk.Label(card, text=f"{t['quality']}  {t['type'].upper()}", font=FONT_BOLD, background=COLOR_BG_LIGHT, width=15)
-                lbl.pack(side=tk.LEFT, padx=5, pady=5)
-                
-                ttk.Label(card, text=t['size'], background=COLOR_BG_LIGHT).pack(side=tk.LEFT, padx=5)
-                
-                btn = ttk.Button(card, text="⬇ Download", style="Accent.TButton", 
-                           command=lambda t=t, title=movie['title']: self._download_torrent(t, title))
-                btn.pack(side=tk.RIGHT, padx=5, pady=2)
-        else:
-            ttk.Label(self.dl_scroll_frame, text="No torrents found.", background=COLOR_BG_LIGHT).pack(pady=10)
+        self._show_torrents(torrents, movie['title'])
 
         spec_text = f"IMDB Code: {movie.get('imdb_code', 'N/A')}\nLanguage: {movie.get('language', 'en').upper()}\nMPA Rating: {movie.get('mpa_rating', 'NR')}\n\nTorrent Stats:\n"
         for t in torrents:
              spec_text += f"• {t['quality']}: {t['seeds']} Seeds / {t['peers']} Peers\n"
-        self.lbl_specs.config(text=spec_text)
+        self._set_widget(self.lbl_specs, text=spec_text)
         
-        threading.Thread(target=self._load_poster_image, args=(movie,), daemon=True).start()
+        url = movie.get('large_cover_image')
+        if url != self._poster_requested_url or not url:
+            if self._poster_handle:
+                self._poster_handle.cancel()
+            # Show an already-decoded poster in this same frame; otherwise don't leave the previous movie's up.
+            ready_img = self.poster_images.get((url, self.poster_box)) if url else None
+            if ready_img is not None:
+                self._show_poster(ready_img)
+            else:
+                self._set_placeholder_poster()
+            self._poster_requested_url = url
+            self._poster_handle = self.api.submit(self._load_poster_image, movie)
 
-    def _load_poster_image(self, movie):
+    def _load_poster_image(self, movie, token=None):
         url = movie.get('large_cover_image')
         if not url:
             self.current_poster_data = None
+            self.current_poster_url = None
             self.root.after(0, self._set_placeholder_poster)
             return
         
-        data = self.api.get_image_data(url)
+        data = self.api.get_image_data(url, token=token)
         if not data or self.last_selected_movie_id != movie['id']:
             return
             
         self.current_poster_data = data
-        self.root.after(0, lambda: self._apply_poster_image(data))
+        self.current_poster_url = url
+        self.root.after(0, lambda: self._apply_poster_image(url, data))
 
-    def _apply_poster_image(self, data):
-        try:
-            MAX_HEIGHT = 250
-            img_temp = Image.open(io.BytesIO(data))
-            orig_w, orig_h = img_temp.size
-            aspect_ratio = orig_w / orig_h
-            
-            target_h = MAX_HEIGHT
-            target_w = int(target_h * aspect_ratio)
-            
-            img = img_temp.resize((target_w, target_h), Image.Resampling.LANCZOS)
+    def _apply_poster_image(self, url, data):
+        """Hands decoding/resizing to the poster workers; only the latest request for the panel is shown."""
+        self.poster_decoder.request('details', url, data, self.poster_box,
+                                    lambda url, box, img: self.root.after(0, self._on_poster_decoded, url, img))
+
+    def _on_poster_decoded(self, url, img):
+        if url != self.current_poster_url:
+            return
+        if img is None:
+            self._set_placeholder_poster()
+        else:
+            self._show_poster(img)
+
+    def _show_poster(self, img):
+        from PIL import ImageTk
+        with self.api.metrics.timer('ui', 'show_poster'):
             photo = ImageTk.PhotoImage(img)
             self.poster_label.config(image=photo)
-            self.poster_label.image = photo
-        except:
-            self._set_placeholder_poster()
+        self.poster_label.image = photo
 
     def _set_placeholder_poster(self):
         try:
@@ -680,32 +1483,29 @@ class MovieApp:
 
     def _clear_all_details(self):
         self.current_movie_details = None
+        self._poster_requested_url = None
         self._set_placeholder_poster()
-        self.lbl_title.config(text="Select a Movie")
-        self.lbl_meta.config(text="")
-        
-        self.story_text.config(state="normal")
-        self.story_text.delete("1.0", tk.END)
-        self.story_text.config(state="disabled")
-        
-        self.trailer_btn.config(state="disabled")
-        for w in self.dl_scroll_frame.winfo_children():
-            w.destroy()
-        self.lbl_specs.config(text="")
+        self._set_widget(self.lbl_title, text="Select a Movie")
+        self._set_widget(self.lbl_meta, text="")
+        self._set_story_text("")
+        self._set_widget(self.trailer_btn, state="disabled")
+        self._show_torrents(None, None)
+        self._set_widget(self.lbl_specs, text="")
 
     def _download_torrent(self, torrent, title):
-        encoded = urllib.parse.quote(title)
-        magnet = f"magnet:?xt=urn:btih:{torrent['hash']}&dn={encoded}"
-        for tr in self.all_trackers:
-            magnet += f"&tr={tr}"
-            
+        magnet = self.trackers.magnet(torrent['hash'], title)
         if messagebox.askyesno("Download", f"Open magnet link for:\n{title} [{torrent['quality']}]?"):
             webbrowser.open(magnet)
 
     def _update_pagination(self):
+        if self.infinite_mode.get():
+            self.page_label.config(text=f"{len(self.model)} of {self.total_movie_count} loaded")
+            self.btn_prev.config(state=tk.DISABLED)
+            self.btn_next.config(state=tk.DISABLED)
+            return
         self.page_label.config(text=f"Page {self.current_page} ({self.total_movie_count} found)")
         self.btn_prev.config(state=tk.NORMAL if self.current_page > 1 else tk.DISABLED)
-        self.btn_next.config(state=tk.NORMAL if (self.current_page*50) < self.total_movie_count else tk.DISABLED)
+        self.btn_next.config(state=tk.NORMAL if self.current_page * RESULTS_PAGE_SIZE < self.total_movie_count else tk.DISABLED)
 
     def _prev_page(self):
         if self.current_page > 1:
@@ -731,6 +1531,9 @@ class MovieApp:
             self._update_pagination()
 
 if __name__ == "__main__":
+    if '--startup-report' in sys.argv:
+        print_history()
+        sys.exit(0)
     root = tk.Tk()
     app = MovieApp(root)
     root.mainloop()
@@ -0,0 +1,248 @@
+"""
+Shared caching proxy for an office or LAN: one process does the domain selection and keeps the
+response, TMDB and poster caches, and every yts_me.py / yts_cli.py client talks to it instead
+of YTS, TMDB and the image hosts.
+
+    python yts_proxy.py --host 0.0.0.0 --port 8077
+
+Clients add "http://<proxy-host>:8077" to yts_domains.json (on its own, or first with real
+mirrors behind it as fallbacks) and may set `[TMDB] proxy_url = http://<proxy-host>:8077` so
+they need no TMDB key. Routes:
+
+    /api/v2/<endpoint>.json?...   YTS API shape: {"status": "ok", "data": {...}}
+    /poster?url=<image url>       image bytes (YTS/TMDB image hosts only)
+    /tmdb/<imdb code>             {"status": "ok", "data": {"tmdb_id": ..., "extras": {...}}}
+    /stats                        latency histograms, cache hit rates, coalescing and connection counters
+
+Identical requests from different clients that arrive while one is in flight share a single
+upstream call. Image URLs in YTS payloads are rewritten to /poster on this proxy, so posters
+are cached once for everybody.
+"""
+import argparse
+import json
+import mimetypes
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, parse_qsl, quote, urlsplit
+from api_handler import APIHandler
+from concurrency import SingleFlight
+from rate_limit import ThrottledError
+
+# --- Proxy Defaults (overridable in the [Proxy] section of config.ini) ---
+DEFAULT_PROXY_HOST = "127.0.0.1"
+DEFAULT_PROXY_PORT = 8077
+DEFAULT_IMAGE_HOSTS = ("img.yts.mx", "image.tmdb.org")   # besides the YTS mirrors themselves
+KEEP_WARM_INTERVAL = 60      # seconds between checks that a YTS mirror is still selected
+IMAGE_MAX_AGE = 7 * 24 * 60 * 60
+
+IMDB_CODE_PATTERN = re.compile(r"^tt\d{1,10}$")
+YTS_ENDPOINT_PATTERN = re.compile(r"^[a-z_]+\.json$")
+
+
+def read_proxy_config(config):
+    """[Proxy] settings from a parsed config.ini: listen host and port, image rewriting and extra image hosts."""
+    settings = {'host': DEFAULT_PROXY_HOST, 'port': DEFAULT_PROXY_PORT, 'rewrite_images': True, 'image_hosts': list(DEFAULT_IMAGE_HOSTS)}
+    try:
+        settings['host'] = config.get('Proxy', 'host', fallback=DEFAULT_PROXY_HOST)
+        settings['port'] = config.getint('Proxy', 'port', fallback=DEFAULT_PROXY_PORT)
+        settings['rewrite_images'] = config.getboolean('Proxy', 'rewrite_images', fallback=True)
+    except ValueError as e:
+        print(f"Error reading [Proxy] settings: {e}")
+    image_hosts = config.get('Proxy', 'image_hosts', fallback='')
+    settings['image_hosts'] = [h.strip().lower() for h in image_hosts.split(',') if h.strip()] or list(DEFAULT_IMAGE_HOSTS)
+    return settings
+
+
+def rewrite_image_urls(data, proxy_base):
+    """Returns a copy of a YTS payload with every http(s) image field pointed at the proxy's /poster route."""
+    if isinstance(data, list):
+        return [rewrite_image_urls(item, proxy_base) for item in data]
+    if not isinstance(data, dict):
+        return data
+    rewritten = {}
+    for key, value in data.items():
+        if 'image' in key and isinstance(value, str) and value.startswith(('http://', 'https://')):
+            rewritten[key] = f"{proxy_base}/poster?url={quote(value, safe='')}"
+        else:
+            rewritten[key] = rewrite_image_urls(value, proxy_base)
+    return rewritten
+
+
+class ProxyServer(ThreadingHTTPServer):
+    """Threaded HTTP server that answers every client from one APIHandler and its caches."""
+
+    daemon_threads = True
+
+    def __init__(self, api, address, rewrite_images=True, image_hosts=DEFAULT_IMAGE_HOSTS, verbose=False):
+        super().__init__(address, ProxyRequestHandler)
+        self.api = api
+        self.rewrite_images = rewrite_images
+        self.extra_image_hosts = [h.lower() for h in image_hosts]
+        self.verbose = verbose
+        self.coalescer = SingleFlight()
+        self.started_at = time.time()
+        self.route_counts = {}
+        self._counts_lock = threading.Lock()
+
+    def count(self, route):
+        with self._counts_lock:
+            self.route_counts[route] = self.route_counts.get(route, 0) + 1
+
+    def image_allowed(self, url):
+        """Only images on the YTS mirrors (and their subdomains) or the configured image hosts are fetched."""
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower()
+        if parts.scheme not in ('http', 'https') or not host:
+            return False
+        allowed = [urlsplit(d.strip()).hostname or '' for d in self.api.yts_domains] + self.extra_image_hosts
+        return any(h and (host == h or host.endswith('.' + h)) for h in allowed)
+
+    def keep_warm(self, interval=KEEP_WARM_INTERVAL):
+        """Background loop: (re)select a YTS mirror whenever none is active, before a client has to wait for it."""
+        while True:
+            try:
+                self.api.warm_up()
+            except Exception as e:
+                self.api.log(f"Proxy warm-up failed: {e}")
+            time.sleep(interval)
+
+    def stats(self):
+        with self._counts_lock:
+            routes = dict(self.route_counts)
+        report = self.api.get_diagnostics()
+        report['proxy'] = {'uptime': round(time.time() - self.started_at), 'routes': routes, 'coalesced': self.coalescer.stats()}
+        return report
+
+
+class ProxyRequestHandler(BaseHTTPRequestHandler):
+    server_version = "yts-proxy/1.0"
+    protocol_version = "HTTP/1.1"   # keep-alive, so clients' pooled sessions reuse their connection
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/')
+        try:
+            if path.startswith('/api/v2/'):
+                self._serve_yts(path[len('/api/v2/'):], parts.query)
+            elif path == '/poster':
+                self._serve_image(parts.query)
+            elif path.startswith('/tmdb/'):
+                self._serve_tmdb(path[len('/tmdb/'):])
+            elif path == '/stats':
+                self.server.count('stats')
+                self._send_json(200, self.server.stats())
+            else:
+                self._send_json(404, {'status': 'error', 'status_message': f"Unknown route {parts.path}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass   # the client went away; nothing left to answer
+
+    def _serve_yts(self, endpoint, query):
+        if not YTS_ENDPOINT_PATTERN.match(endpoint):
+            self._send_json(404, {'status': 'error', 'status_message': f"Unknown endpoint {endpoint}"})
+            return
+        self.server.count(endpoint)
+        params = dict(parse_qsl(query))
+        key = ('yts', endpoint, tuple(sorted(params.items())))
+        try:
+            data = self.server.coalescer.do(key, lambda: self.server.api.get_yts(endpoint, params))
+        except ThrottledError as e:
+            # Pass upstream throttling on, so clients back off too instead of dropping the proxy.
+            retry_after = {'Retry-After': str(max(1, round(e.retry_after or 0)))}
+            self._send_json(503, {'status': 'error', 'status_message': str(e)}, retry_after)
+            return
+        except ConnectionError as e:
+            # No upstream mirror answered: a gateway failure, so clients fail over to their other domains.
+            self._send_json(502, {'status': 'error', 'status_message': str(e)})
+            return
+        except Exception as e:
+            self._send_json(502, {'status': 'error', 'status_message': str(e)})
+            return
+        if self.server.rewrite_images:
+            data = rewrite_image_urls(data, self._public_base())
+        self._send_json(200, {'status': 'ok', 'status_message': 'Query was successful', 'data': data})
+
+    def _serve_image(self, query):
+        self.server.count('poster')
+        url = (parse_qs(query).get('url') or [''])[0]
+        if not self.server.image_allowed(url):
+            self._send_json(403, {'status': 'error', 'status_message': "Image host not allowed"})
+            return
+        data = self.server.coalescer.do(('image', url), lambda: self.server.api.get_image_data(url))
+        if data is None:
+            self._send_json(502, {'status': 'error', 'status_message': "Image download failed"})
+            return
+        content_type = mimetypes.guess_type(urlsplit(url).path)[0] or 'application/octet-stream'
+        self._send_bytes(200, data, content_type, {'Cache-Control': f"max-age={IMAGE_MAX_AGE}"})
+
+    def _serve_tmdb(self, imdb_code):
+        self.server.count('tmdb')
+        api = self.server.api
+        if not IMDB_CODE_PATTERN.match(imdb_code):
+            self._send_json(404, {'status': 'error', 'status_message': "Not an IMDb code"})
+            return
+        if not api.tmdb_api_key:
+            self._send_json(503, {'status': 'error', 'status_message': "TMDB is not configured on the proxy"})
+            return
+        try:
+            tmdb_id, extras = self.server.coalescer.do(('tmdb', imdb_code), lambda: api.fetch_tmdb_entry(imdb_code))
+        except ThrottledError as e:
+            self._send_json(503, {'status': 'error', 'status_message': str(e)}, {'Retry-After': str(max(1, round(e.retry_after or 0)))})
+            return
+        except ConnectionError as e:
+            # Never answer a failed lookup with tmdb_id None: clients would cache it as "no match".
+            self._send_json(502, {'status': 'error', 'status_message': str(e)})
+            return
+        self._send_json(200, {'status': 'ok', 'data': {'tmdb_id': tmdb_id, 'extras': extras}})
+
+    def _public_base(self):
+        """The proxy's address as the client reached it, for rewritten image URLs."""
+        host = self.headers.get('Host') or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+        return f"http://{host}"
+
+    def _send_json(self, status, payload, headers=None):
+        self._send_bytes(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+
+    def _send_bytes(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            self.server.api.log(f"{self.address_string()} {format % args}")
+
+    def log_error(self, format, *args):
+        self.server.api.log(f"{self.address_string()} {format % args}")
+
+
+def main(argv=None):
+    api = APIHandler()
+    settings = read_proxy_config(api.config)
+    parser = argparse.ArgumentParser(description="Shared caching proxy for YTS, TMDB and poster requests.")
+    parser.add_argument('--host', default=settings['host'], help=f"address to listen on (default {settings['host']})")
+    parser.add_argument('--port', type=int, default=settings['port'])
+    parser.add_argument('--no-rewrite-images', action='store_true', help="leave image URLs pointing at the original hosts")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    server = ProxyServer(api, (args.host, args.port), rewrite_images=settings['rewrite_images'] and not args.no_rewrite_images,
+                         image_hosts=settings['image_hosts'], verbose=args.verbose)
+    threading.Thread(target=server.keep_warm, daemon=True).start()
+    api.log(f"YTS proxy listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        api.close()
+
+
+if __name__ == "__main__":
+    main()